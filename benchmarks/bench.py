@@ -0,0 +1,311 @@
+#!/usr/bin/python3
+"""
+Offline benchmark suite of school-bell.
+
+Runs without audio device, network or remote hosts: rings use the null
+audio backend, remote hosts are stubbed and the holidays are served from a
+pre-filled cache. Results are stored as JSON per version in
+`benchmarks/results` (not tracked), and compared against the tracked
+`benchmarks/baseline.json`, such that regressions show up between releases.
+
+Usage::
+
+    python benchmarks/bench.py [--quick] [--compare baseline.json]
+"""
+
+# absolute imports
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import timeit
+from time import time
+
+# school_bell imports
+import schedule
+import school_bell
+from school_bell import school_bell as bell_module
+from school_bell.cache import HolidayCache
+from school_bell.scheduler import Scheduler
+from school_bell.timeline import Timeline
+
+here = os.path.dirname(os.path.abspath(__file__))
+samples = os.path.join(here, '..', 'samples')
+days = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+
+def _stats(times: list, number: int = 1) -> dict:
+    """Returns the min, median and max time per call in seconds.
+    """
+    times = sorted(t / number for t in times)
+    return dict(
+        min=times[0],
+        median=times[len(times) // 2],
+        max=times[-1],
+        repeat=len(times),
+        number=number,
+    )
+
+
+def _holidays(year: int, count: int) -> list:
+    """Returns `count` single and multi-day holidays spread over the year.
+    """
+    start = datetime.date(year, 1, 1)
+    return [
+        dict(
+            id=str(i),
+            startDate=start + datetime.timedelta(days=i * 365 // count),
+            endDate=start + datetime.timedelta(days=i * 365 // count + i % 3),
+        )
+        for i in range(count)
+    ]
+
+
+def _schedule(rings_per_day: int) -> dict:
+    """Returns a weekly schedule with `rings_per_day` rings every day.
+    """
+    step = 86400 // rings_per_day
+    return {
+        day: {
+            '{:02d}:{:02d}:{:02d}'.format(
+                i * step // 3600, i * step // 60 % 60, i * step % 60
+            ): str(i % 2)
+            for i in range(rings_per_day)
+        }
+        for day in days
+    }
+
+
+def _bell(cache: str, holidays: list = None, hosts: int = 0,
+          fill: bool = True, **kwargs) -> bell_module.SchoolBell:
+    """Returns an offline SchoolBell with the null audio backend, a
+    pre-filled holiday cache and `hosts` stubbed remote hosts. Set `fill`
+    to `False` to keep the cache as is.
+    """
+    today = datetime.date.today()
+    if fill:
+        HolidayCache(cache).set(
+            'NL-BE', today, today + datetime.timedelta(days=180),
+            holidays or []
+        )
+    return bell_module.SchoolBell(
+        schedule={},
+        wav={
+            '0': 'ClassBell-SoundBible.com-1426436341.wav',
+            '1': 'SchoolBell-SoundBible.com-449398625.wav',
+        },
+        root=samples,
+        backend='null',
+        holidays='NL-BE',
+        cache=cache,
+        trigger={f"pibell{i}": '' for i in range(hosts)},
+        **kwargs
+    )
+
+
+def bench_create_schedule(cache: str, quick: bool = False) -> dict:
+    """Build the weekly timeline of large schedules.
+    """
+    bell = _bell(cache)
+    results = dict()
+    for rings_per_day in (10, 100, 1000):
+        value = _schedule(rings_per_day)
+        number = 1 if quick else 5
+        results[f"rings_per_day={rings_per_day}"] = _stats(timeit.repeat(
+            lambda: bell.create_schedule(value),
+            number=number, repeat=3 if quick else 7,
+        ), number)
+    bell.close()
+    return results
+
+
+def bench_is_holiday(cache: str, quick: bool = False) -> dict:
+    """Lookup every day of the year against year-sized holiday lists.
+    """
+    year = datetime.date.today().year
+    dates = [datetime.date(year, 1, 1) + datetime.timedelta(days=i)
+             for i in range(365)]
+    results = dict()
+    for count in (10, 100, 1000):
+        bell = _bell(cache, holidays=_holidays(year, count))
+        number = 1 if quick else 10
+        results[f"holidays={count}"] = _stats(timeit.repeat(
+            lambda: [bell.is_holiday(date) for date in dates],
+            number=number, repeat=3 if quick else 7,
+        ), number * len(dates))
+        bell.close()
+    return results
+
+
+def bench_ring_fanout(cache: str, quick: bool = False) -> dict:
+    """Ring the local null player and N stubbed remote hosts.
+    """
+    call = bell_module.system_call
+    bell_module.system_call = lambda *args, **kwargs: True
+    results = dict()
+    try:
+        for hosts in (0, 1, 4, 16):
+            bell = _bell(cache, hosts=hosts)
+            bell.ring('0')  # warm up the worker pool
+            number = 3 if quick else 20
+            results[f"hosts={hosts}"] = _stats(timeit.repeat(
+                lambda: bell.ring('0'), number=number, repeat=3,
+            ), number)
+            bell.close()
+    finally:
+        bell_module.system_call = call
+    return results
+
+
+def bench_dispatch_drift(cache: str, quick: bool = False) -> dict:
+    """Drift of the scheduler dispatch against the scheduled ring times.
+    """
+    rings = 2 if quick else 5
+    now = datetime.datetime.now().replace(microsecond=0)
+    entries = [
+        (at.weekday(), at.strftime('%H:%M:%S'), str(i))
+        for i, at in enumerate(
+            now + datetime.timedelta(seconds=i + 2) for i in range(rings)
+        )
+    ]
+    drift = []
+    done = threading.Event()
+
+    def callback(key, scheduled=None):
+        drift.append(time() - scheduled)
+        if len(drift) == rings:
+            done.set()
+
+    scheduler = Scheduler(schedule.Scheduler())
+    scheduler.set_timeline(Timeline(entries), callback)
+    thread = threading.Thread(target=scheduler.run, daemon=True)
+    thread.start()
+    done.wait(rings + 5)
+    scheduler.stop()
+    thread.join()
+    return _stats(drift) if drift else dict()
+
+
+def bench_startup(cache: str, quick: bool = False) -> dict:
+    """Create a SchoolBell from a cached holiday list: holiday cache load,
+    wav hashing and preloading, schedule compilation and stubbed trigger
+    probes.
+    """
+    call = bell_module.system_call
+    bell_module.system_call = lambda *args, **kwargs: True
+    results = dict()
+    try:
+        _bell(cache).close()
+        for hosts in (0, 16):
+            times = []
+            for i in range(3 if quick else 10):
+                t0 = time()
+                bell = _bell(cache, hosts=hosts, fill=False)
+                times.append(time() - t0)
+                bell.close()
+            results[f"hosts={hosts}"] = _stats(times)
+    finally:
+        bell_module.system_call = call
+    return results
+
+
+def bench_cold_import(cache: str, quick: bool = False) -> dict:
+    """Cold import time of the package and the command line entry point.
+    """
+    results = dict()
+    for module in ('school_bell', 'school_bell.main'):
+        times = []
+        for i in range(3 if quick else 10):
+            t0 = time()
+            subprocess.run([sys.executable, '-c', f"import {module}"],
+                           check=True)
+            times.append(time() - t0)
+        results[module] = _stats(times)
+    return results
+
+
+benchmarks = {
+    'create_schedule': bench_create_schedule,
+    'is_holiday': bench_is_holiday,
+    'ring_fanout': bench_ring_fanout,
+    'dispatch_drift': bench_dispatch_drift,
+    'startup': bench_startup,
+    'cold_import': bench_cold_import,
+}
+
+
+def compare(results: dict, baseline: dict):
+    """Print the median ratio of the results against a baseline.
+    """
+    for name, cases in results['benchmarks'].items():
+        base = baseline['benchmarks'].get(name, {})
+        if 'median' in cases:
+            cases, base = {'': cases}, {'': base}
+        for case, stats in cases.items():
+            ref = base.get(case, {}).get('median')
+            if not ref or 'median' not in stats:
+                continue
+            print("{:<16} {:<24} {:>8.2f}x".format(
+                name, case, stats['median'] / ref
+            ))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='bench',
+        description='Offline benchmark suite of school-bell.',
+    )
+    parser.add_argument(
+        '--quick', action='store_true', default=False,
+        help='Run fewer repetitions'
+    )
+    parser.add_argument(
+        '--only', metavar='..', type=str, nargs='+', choices=benchmarks,
+        help='Run only the given benchmarks'
+    )
+    parser.add_argument(
+        '--output', metavar='..', type=str,
+        help='Output JSON file. Defaults to results/<version>.json'
+    )
+    parser.add_argument(
+        '--compare', metavar='..', type=str,
+        help='Baseline JSON file to compare the medians against'
+    )
+    args = parser.parse_args()
+
+    # Silence the ring logging
+    logging.disable(logging.WARNING)
+
+    results = dict(
+        version=school_bell.__version__,
+        python=platform.python_version(),
+        machine=platform.machine(),
+        date=datetime.datetime.now().isoformat(timespec='seconds'),
+        benchmarks=dict(),
+    )
+    with tempfile.TemporaryDirectory() as cache:
+        for name in args.only or benchmarks:
+            print(f"{name} ..", flush=True)
+            results['benchmarks'][name] = benchmarks[name](cache, args.quick)
+
+    output = args.output or os.path.join(
+        here, 'results', f"{results['version']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"results written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
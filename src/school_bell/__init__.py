@@ -15,14 +15,27 @@ Python scheduled ringing of the school bell
     MIT that can be found under the LICENSE file.
 """
 
-# Import main modules
-from . import utils, openholidays, main
-
-# Import SchoolBell class
-from .school_bell import SchoolBell
+# Import main modules and the SchoolBell class lazily, on first access, such
+# that importing the package or the command line entry point stays fast
+import importlib
 
 # Make only a selection available to __all__ to not clutter the namespace
-__all__ = ['SchoolBell', 'utils', 'openholidays', 'main']
+__all__ = ['SchoolBell', 'BellRunner', 'utils', 'openholidays', 'main']
+
+
+def __getattr__(name):
+    if name == 'SchoolBell':
+        return importlib.import_module('.school_bell', __name__).SchoolBell
+    if name == 'BellRunner':
+        return importlib.import_module('.runner', __name__).BellRunner
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
+
 
 # Version
 try:
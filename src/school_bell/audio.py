@@ -0,0 +1,417 @@
+#!/usr/bin/python3
+
+# absolute imports
+import hashlib
+import os
+import wave
+from collections import namedtuple
+from select import select
+from subprocess import Popen, PIPE, DEVNULL
+from threading import Lock
+from time import monotonic, sleep, time
+
+
+__all__ = ['Sample', 'WavInfo', 'load_wav', 'wav_info', 'Player',
+           'NullSink', 'FileSink', 'AlsaSink', 'AplaySink', 'create_sink']
+
+
+Sample = namedtuple(
+    'Sample', ['nchannels', 'sampwidth', 'framerate', 'nframes', 'frames']
+)
+Sample.__doc__ = """Decoded WAVE audio file with its raw PCM frames."""
+
+
+WavInfo = namedtuple(
+    'WavInfo',
+    ['nchannels', 'sampwidth', 'framerate', 'nframes', 'duration', 'sha1']
+)
+WavInfo.__doc__ = """WAVE audio file header, duration and content hash."""
+
+
+def wav_info(path: str) -> WavInfo:
+    """Parse the header of a WAVE audio file and hash its content, without
+    decoding the frames. Raises a `ValueError` if the format is unsupported.
+    """
+    try:
+        with wave.open(path, 'rb') as f:
+            params = f.getparams()
+    except (wave.Error, EOFError) as err:
+        raise ValueError(f"WAVE audio file \"{path}\" is invalid: {err}")
+
+    if params.comptype != 'NONE':
+        raise ValueError(f"WAVE audio file \"{path}\" is compressed!")
+    if params.sampwidth not in (1, 2, 3, 4):
+        raise ValueError(f"WAVE audio file \"{path}\" sample width of "
+                         f"{params.sampwidth} bytes is not supported!")
+    if params.nchannels < 1 or params.framerate < 1:
+        raise ValueError(f"WAVE audio file \"{path}\" has no audio!")
+
+    sha1 = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            sha1.update(chunk)
+
+    return WavInfo(
+        nchannels=params.nchannels,
+        sampwidth=params.sampwidth,
+        framerate=params.framerate,
+        nframes=params.nframes,
+        duration=params.nframes / params.framerate,
+        sha1=sha1.hexdigest(),
+    )
+
+
+def load_wav(path: str) -> Sample:
+    """Decode a WAVE audio file into memory.
+    """
+    with wave.open(path, 'rb') as f:
+        if f.getcomptype() != 'NONE':
+            raise ValueError(f"WAVE audio file \"{path}\" is compressed!")
+        return Sample(
+            nchannels=f.getnchannels(),
+            sampwidth=f.getsampwidth(),
+            framerate=f.getframerate(),
+            nframes=f.getnframes(),
+            frames=f.readframes(f.getnframes()),
+        )
+
+
+def _truncate(sample: Sample, duration: float = None) -> Sample:
+    """Internal function to truncate a sample to the duration in seconds.
+    """
+    if duration is None:
+        return sample
+    nframes = min(sample.nframes, int(duration * sample.framerate))
+    return sample._replace(
+        nframes=nframes,
+        frames=sample.frames[:nframes * sample.nchannels * sample.sampwidth],
+    )
+
+
+class NullSink(object):
+    """Audio sink that discards the samples, for hosts without a sound card.
+    """
+
+    def __init__(self, realtime: bool = False):
+        """Initialize the NullSink object
+
+        Parameters
+        ----------
+        realtime : `bool`, optional
+            Block for the duration of the sample as if it were played.
+            Defaults to `False`.
+        """
+        self.realtime = realtime
+        self.count = 0
+
+    def play(self, sample: Sample) -> bool:
+        """Discard the sample. Returns `True`.
+        """
+        self.count += 1
+        if self.realtime:
+            sleep(sample.nframes / sample.framerate)
+        return True
+
+
+class FileSink(object):
+    """Audio sink writing each played sample to a WAVE audio file.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the FileSink object
+
+        Parameters
+        ----------
+        path : `str`
+            The output WAVE audio file, overwritten by each played sample.
+        """
+        self.path = path
+
+    def play(self, sample: Sample) -> bool:
+        """Write the sample to the output file. Returns `True` on success.
+        """
+        with wave.open(self.path, 'wb') as f:
+            f.setnchannels(sample.nchannels)
+            f.setsampwidth(sample.sampwidth)
+            f.setframerate(sample.framerate)
+            f.writeframes(sample.frames)
+        return True
+
+
+class AlsaSink(object):
+    """Audio sink writing the samples straight to an ALSA device.
+
+    Requires the optional `pyalsaaudio` package.
+    """
+
+    def __init__(self, device: str = None, periodsize: int = None):
+        """Initialize the AlsaSink object
+
+        Parameters
+        ----------
+        device : `str`, optional
+            The ALSA device. Defaults to "default".
+
+        periodsize : `int`, optional
+            Number of frames per write. Defaults to 1024.
+        """
+        try:
+            import alsaaudio
+        except ImportError:
+            raise ImportError("The alsa audio backend requires pyalsaaudio!")
+        self.__alsa = alsaaudio
+        self.device = device or 'default'
+        self.periodsize = periodsize or 1024
+        self.__formats = {
+            1: alsaaudio.PCM_FORMAT_U8,
+            2: alsaaudio.PCM_FORMAT_S16_LE,
+            3: alsaaudio.PCM_FORMAT_S24_3LE,
+            4: alsaaudio.PCM_FORMAT_S32_LE,
+        }
+
+    def play(self, sample: Sample) -> bool:
+        """Write the sample to the device. Returns `True` on success.
+        """
+        pcm = self.__alsa.PCM(
+            type=self.__alsa.PCM_PLAYBACK,
+            device=self.device,
+            channels=sample.nchannels,
+            rate=sample.framerate,
+            format=self.__formats[sample.sampwidth],
+            periodsize=self.periodsize,
+        )
+        try:
+            step = self.periodsize * sample.nchannels * sample.sampwidth
+            for i in range(0, len(sample.frames), step):
+                pcm.write(sample.frames[i:i + step])
+            if hasattr(pcm, 'drain'):
+                pcm.drain()
+        finally:
+            pcm.close()
+        return True
+
+
+class AplaySink(object):
+    """Audio sink streaming raw PCM frames over a pipe to a long-lived aplay
+    worker.
+
+    One worker is kept per device, with the ALSA device kept open, such that
+    a ring only writes frames. The worker is restarted in the format of a
+    sample that differs from the running one, as a hardware device can be
+    opened only once. A worker that died or got stuck is restarted
+    automatically and counted in :attr:`restarts`.
+    """
+
+    _formats = {1: 'U8', 2: 'S16_LE', 3: 'S24_3LE', 4: 'S32_LE'}
+
+    def __init__(self, device: str = None, command: list = None,
+                 timeout: float = None):
+        """Initialize the AplaySink object
+
+        Parameters
+        ----------
+        device : `str`, optional
+            The ALSA device. Defaults to the aplay default device.
+
+        command : `list`, optional
+            The player command. Defaults to ["/usr/bin/aplay"].
+
+        timeout : `float`, optional
+            Time, in seconds, a write may take beyond the duration of the
+            sample before the worker is considered stuck. Defaults to 5.
+        """
+        self.device = device
+        self.command = command or ["/usr/bin/aplay"]
+        self.timeout = timeout or 5.
+        self.restarts = 0
+        self.__worker = None
+        self.__format = None
+
+    @property
+    def worker(self) -> Popen:
+        """Get the worker process, or `None`.
+        """
+        return self.__worker
+
+    @property
+    def format(self) -> tuple:
+        """Get the `(nchannels, sampwidth, framerate)` of the worker.
+        """
+        return self.__format
+
+    def _start(self, fmt: tuple) -> Popen:
+        """Internal function to start the worker for the sample format.
+        """
+        nchannels, sampwidth, framerate = fmt
+        cmd = self.command + [
+            '-q', '-t', 'raw',
+            '-f', self._formats[sampwidth],
+            '-r', str(framerate),
+            '-c', str(nchannels),
+        ]
+        if self.device:
+            cmd += ['-D', self.device]
+        worker = Popen(cmd + ['-'], stdin=PIPE, stdout=DEVNULL,
+                       stderr=DEVNULL)
+        os.set_blocking(worker.stdin.fileno(), False)
+        self.__worker, self.__format = worker, fmt
+        return worker
+
+    def _stop(self):
+        """Internal function to stop the worker, releasing the device.
+        """
+        worker, self.__worker, self.__format = self.__worker, None, None
+        if worker is None:
+            return
+        if worker.poll() is None:
+            try:
+                worker.stdin.close()
+            except OSError:
+                pass
+            worker.terminate()
+        worker.wait()
+
+    def _worker(self, fmt: tuple) -> Popen:
+        """Internal function returning a running worker for the sample
+        format, restarting it if it died or runs another format.
+        """
+        worker = self.__worker
+        if worker is not None and worker.poll() is not None:
+            self.restarts += 1
+            self._stop()
+        elif worker is not None and self.__format != fmt:
+            self._stop()
+        return self.__worker or self._start(fmt)
+
+    def _write(self, worker: Popen, frames: bytes, timeout: float) -> bool:
+        """Internal function to write the frames to the worker within the
+        timeout. Returns `False` if the worker did not accept them in time.
+        """
+        fd = worker.stdin.fileno()
+        view = memoryview(frames)
+        deadline = monotonic() + timeout
+        while view:
+            remaining = deadline - monotonic()
+            if remaining <= 0 or not select([], [fd], [], remaining)[1]:
+                return False
+            try:
+                view = view[os.write(fd, view):]
+            except BlockingIOError:
+                continue
+        return True
+
+    def prepare(self, sample: Sample):
+        """Start the worker ahead of the first ring, unless one runs.
+        """
+        if self.__worker is None:
+            self._worker(
+                (sample.nchannels, sample.sampwidth, sample.framerate)
+            )
+
+    def play(self, sample: Sample) -> bool:
+        """Stream the sample to the worker. Returns `True` on success.
+        """
+        fmt = (sample.nchannels, sample.sampwidth, sample.framerate)
+        timeout = sample.nframes / sample.framerate + self.timeout
+        for attempt in range(2):
+            worker = self._worker(fmt)
+            try:
+                if self._write(worker, sample.frames, timeout):
+                    return True
+                worker.kill()
+                worker.wait()
+                return False
+            except OSError:
+                worker.kill()
+                worker.wait()
+        return False
+
+    def close(self):
+        """Stop the worker.
+        """
+        self._stop()
+
+
+def create_sink(backend: str, device: str = None):
+    """Returns the audio sink given the backend name: "alsa", "pipe", "null"
+    or "file:<path>".
+    """
+    if backend == 'alsa':
+        return AlsaSink(device)
+    if backend == 'pipe':
+        return AplaySink(device)
+    if backend == 'null':
+        return NullSink()
+    if backend.startswith('file:'):
+        return FileSink(backend[5:])
+    raise ValueError(f"Audio backend \"{backend}\" is not supported!")
+
+
+class Player(object):
+    """In-process audio player with preloaded PCM buffers.
+
+    Each WAVE audio file is decoded into memory once, such that playback
+    writes the buffer straight to the sink without forking a player or
+    parsing the file.
+    """
+
+    def __init__(self, sink):
+        """Initialize the Player object
+
+        Parameters
+        ----------
+        sink : `object`
+            The audio sink, any object with a `play(sample)` method.
+        """
+        self.__sink = sink
+        self.__samples = dict()
+        self.__lock = Lock()
+
+    @property
+    def sink(self):
+        """Get the audio sink.
+        """
+        return self.__sink
+
+    @property
+    def samples(self) -> dict:
+        """Get the preloaded samples.
+        """
+        return self.__samples
+
+    def load(self, key: str, path: str) -> Sample:
+        """Decode and preload the WAVE audio file given the key.
+        """
+        sample = load_wav(path)
+        self.__samples[str(key)] = sample
+        if hasattr(self.__sink, 'prepare'):
+            self.__sink.prepare(sample)
+        return sample
+
+    def play(self, key: str, duration: float = None) -> bool:
+        """Play the preloaded sample given the key, optionally truncated to
+        `duration` seconds. Returns `True` on success.
+        """
+        sample = _truncate(self.__samples[str(key)], duration)
+        with self.__lock:
+            return self.__sink.play(sample)
+
+    def play_at(self, start: float, key: str,
+                duration: float = None) -> tuple:
+        """Play the preloaded sample given the key at the epoch time `start`.
+        Returns a tuple with `True` on success and the epoch time the sample
+        was handed to the sink, after waiting on any playing sample.
+        """
+        sample = _truncate(self.__samples[str(key)], duration)
+        delay = start - time()
+        if delay > 0:
+            sleep(delay)
+        with self.__lock:
+            started = time()
+            return self.__sink.play(sample), started
+
+    def close(self):
+        """Close the audio sink, if supported.
+        """
+        if hasattr(self.__sink, 'close'):
+            self.__sink.close()
@@ -0,0 +1,143 @@
+#!/usr/bin/python3
+
+# absolute imports
+import json
+import os
+import tempfile
+import time
+
+# Relative imports
+from .utils import to_date
+
+
+__all__ = ['HolidayCache']
+
+
+class HolidayCache(object):
+    """Persistent on-disk cache of holiday responses.
+
+    One JSON record is kept per subdivision, holding the requested date
+    window, the time of the update and the holidays. Records are written
+    atomically, so a crash or power cut never leaves a corrupt cache.
+    """
+
+    def __init__(self, path: str = None, ttl: float = None):
+        """Initialize the HolidayCache object
+
+        Parameters
+        ----------
+        path : `str`, optional
+            The cache directory.
+            Defaults to `$XDG_CACHE_HOME/school-bell`.
+
+        ttl : `float`, optional
+            Time to live of a record, in seconds. Defaults to one day.
+        """
+        self.__path = os.path.expandvars(path or os.path.join(
+            os.environ.get('XDG_CACHE_HOME',
+                           os.path.join(os.path.expanduser('~'), '.cache')),
+            'school-bell'
+        ))
+        self.ttl = 86400. if ttl is None else float(ttl)
+
+    @property
+    def path(self) -> str:
+        """Get the cache directory.
+        """
+        return self.__path
+
+    def filename(self, subdivisionCode: str) -> str:
+        """Returns the record filename of the subdivision.
+        """
+        return os.path.join(self.path, f"holidays-{subdivisionCode}.json")
+
+    def record(self, subdivisionCode: str) -> dict:
+        """Returns the raw record of the subdivision, or `None` if missing,
+        unreadable or malformed.
+        """
+        try:
+            with open(self.filename(subdivisionCode)) as f:
+                record = json.load(f)
+            record['validFrom'] = to_date(record['validFrom'])
+            record['validTo'] = to_date(record['validTo'])
+            record['updated'] = float(record['updated'])
+            for holiday in record['holidays']:
+                holiday['startDate'] = to_date(holiday['startDate'])
+                holiday['endDate'] = to_date(holiday['endDate'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return record
+
+    def age(self, subdivisionCode: str) -> float:
+        """Returns the age of the record in seconds, or `None`.
+        """
+        record = self.record(subdivisionCode)
+        return None if record is None else time.time() - record['updated']
+
+    def get(self, subdivisionCode: str, validFrom, validTo,
+            stale: bool = False) -> list:
+        """Returns the cached holidays, or `None` if not available.
+
+        Parameters
+        ----------
+        subdivisionCode : `str`
+            Code of the subdivision.
+
+            _Example_: NL-BE
+
+        validFrom : `str` or `datetime.date`
+            Start of the data range (format: %Y-%m-%d).
+
+        validTo : `str` or `datetime.date`
+            End of the data range (format: %Y-%m-%d).
+
+        stale : `bool`, optional
+            Also return an expired record or a record that only partially
+            covers the data range, as long as it includes `validFrom`.
+            Defaults to `False`.
+        """
+        return self.match(self.record(subdivisionCode), validFrom, validTo,
+                          stale)
+
+    def match(self, record: dict, validFrom, validTo,
+              stale: bool = False) -> list:
+        """Returns the holidays of a record read by :meth:`record`, or `None`
+        if not available. See :meth:`get` for the parameters.
+        """
+        if record is None:
+            return None
+
+        validFrom, validTo = to_date(validFrom), to_date(validTo)
+        if not record['validFrom'] <= validFrom <= record['validTo']:
+            return None
+
+        if not stale and (
+            record['validTo'] < validTo or
+            time.time() - record['updated'] >= self.ttl
+        ):
+            return None
+
+        return record['holidays']
+
+    def set(self, subdivisionCode: str, validFrom, validTo, holidays: list):
+        """Atomically store the holidays of the subdivision.
+        """
+        record = dict(
+            subdivisionCode=subdivisionCode,
+            validFrom=str(validFrom),
+            validTo=str(validTo),
+            updated=time.time(),
+            holidays=holidays,
+        )
+        os.makedirs(self.path, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(record, f, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.filename(subdivisionCode))
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
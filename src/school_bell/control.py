@@ -0,0 +1,280 @@
+#!/usr/bin/python3
+
+# absolute imports
+import argparse
+import datetime
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+from threading import Thread
+
+# Relative imports
+from .utils import private_dir
+
+
+__all__ = ['ControlServer', 'default_path', 'request', 'main']
+
+
+def default_path() -> str:
+    """Returns the default path of the control socket:
+    `$XDG_RUNTIME_DIR/school-bell.sock` or a socket in the private per-user
+    directory of the temporary directory (see :func:`private_dir`).
+    """
+    runtime = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime:
+        return os.path.join(runtime, 'school-bell.sock')
+    return os.path.join(private_dir(), 'control.sock')
+
+
+def request(command: str, path: str = None, timeout: float = None,
+            **kwargs) -> dict:
+    """Send a command to the control socket of a running school bell and
+    returns the response, a dictionary with `ok` and either the `result` or
+    the `error`.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout or 60.)
+        sock.connect(path or default_path())
+        sock.sendall(json.dumps(dict(kwargs, cmd=command)).encode() + b'\n')
+        with sock.makefile('rb') as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError("control socket closed the connection!")
+    return json.loads(line)
+
+
+class ControlServer(object):
+    """Local control API of a running :class:`SchoolBell` or
+    :class:`BellRunner` on a UNIX socket.
+
+    Requests and responses are JSON objects, one per line. A request holds
+    the command `cmd` and its arguments, optionally with the `bell` name of
+    a runner. Commands are "ring", "play", "next-rings", "holiday",
+    "reload" and "status".
+    """
+
+    def __init__(self, target, path: str = None, reload=None):
+        """Initialize the ControlServer object
+
+        Parameters
+        ----------
+        target : :class:`SchoolBell` or :class:`BellRunner`
+            The school bell(s) to control.
+
+        path : `str`, optional
+            Path of the control socket. Defaults to :func:`default_path`.
+
+        reload : `callable`, optional
+            Reloads the configuration and returns the changes. Run in the
+            scheduler loop. Reload is not available if not set.
+        """
+        self.target = target
+        self.__reload = reload
+        self.__path = path or default_path()
+        self.__thread = None
+        _unlink_stale(self.__path)
+        umask = os.umask(0o177)
+        try:
+            self.__server = socketserver.ThreadingUnixStreamServer(
+                self.__path, _handler(self)
+            )
+        finally:
+            os.umask(umask)
+        self.__server.daemon_threads = True
+
+    @property
+    def path(self) -> str:
+        """Get the path of the control socket.
+        """
+        return self.__path
+
+    def start(self):
+        """Start serving in a daemon thread.
+        """
+        self.__thread = Thread(target=self.__server.serve_forever,
+                               name='control', daemon=True)
+        self.__thread.start()
+        self.target.log.info(f"control socket at {self.path}")
+
+    def stop(self):
+        """Stop serving and remove the socket.
+        """
+        if self.__thread is not None:
+            self.__server.shutdown()
+            self.__thread.join()
+            self.__thread = None
+        self.__server.server_close()
+        if os.path.exists(self.__path):
+            os.remove(self.__path)
+
+    def handle(self, request: dict) -> dict:
+        """Handle a request. Returns the response.
+        """
+        try:
+            command = request.pop('cmd')
+            func = getattr(self, '_' + str(command).replace('-', '_'), None)
+            if command not in _commands or func is None:
+                raise ValueError(f"Unknown command \"{command}\"!")
+            return dict(ok=True, result=func(**request))
+        except Exception as err:
+            return dict(ok=False, error=f"{err.__class__.__name__}: {err}")
+
+    def _bells(self, bell: str = None) -> dict:
+        """Internal function returning the selected bells by name.
+        """
+        bells = getattr(self.target, 'bells', None)
+        if bells is None:
+            bells = {self.target.name or 'default': self.target}
+        if bell is None:
+            return bells
+        if bell not in bells:
+            raise KeyError(f"bell \"{bell}\" not found!")
+        return {bell: bells[bell]}
+
+    def _ring(self, key: str, bell: str = None, force: bool = True) -> dict:
+        return {name: obj.ring(key, force=force)
+                for name, obj in self._bells(bell).items()}
+
+    def _play(self, key: str, bell: str = None) -> dict:
+        return {name: obj.play(key)
+                for name, obj in self._bells(bell).items()}
+
+    def _next_rings(self, count: int = None, bell: str = None) -> dict:
+        return {name: [dict(when=when, key=key)
+                       for when, key in obj.next_rings(count)]
+                for name, obj in self._bells(bell).items()}
+
+    def _holiday(self, date: str = None, bell: str = None) -> dict:
+        date = datetime.date.fromisoformat(date) if date else \
+            datetime.date.today()
+        return {name: dict(
+            date=date,
+            holiday=obj.is_holiday(date),
+            subdivision=obj.config['holidays'],
+            window=obj.holidays_window,
+        ) for name, obj in self._bells(bell).items()}
+
+    def _reload(self) -> object:
+        if self.__reload is None:
+            raise RuntimeError("reload is not available!")
+        return self.target.scheduler.call(self.__reload).result(timeout=300)
+
+    def _status(self, bell: str = None) -> dict:
+        return {name: dict(
+            running=obj.scheduler.running,
+            next_ring=obj.next_ring(),
+            last_ring={target: result.success
+                       for target, result in obj.last_ring.items()},
+            trigger=sorted(obj.trigger),
+            unhealthy=sorted(obj.unhealthy),
+            holidays=obj.config['holidays'],
+            holidays_window=obj.holidays_window,
+            drift=obj.ring_stats.summary(),
+        ) for name, obj in self._bells(bell).items()}
+
+
+_commands = ('ring', 'play', 'next-rings', 'holiday', 'reload', 'status')
+
+
+def _unlink_stale(path: str):
+    """Internal function to remove a stale control socket. Raises a
+    `RuntimeError` if a server is still listening.
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"\"{path}\" is not a socket!")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            os.remove(path)
+            return
+    raise RuntimeError(f"control socket \"{path}\" is in use!")
+
+
+def _handler(server: ControlServer):
+    """Internal function returning the request handler class of the server.
+    """
+    class Handler(socketserver.StreamRequestHandler):
+
+        def handle(self):
+            for line in self.rfile:
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("request should be an object!")
+                except ValueError as err:
+                    response = dict(ok=False, error=f"ValueError: {err}")
+                else:
+                    response = server.handle(request)
+                self.wfile.write(
+                    json.dumps(response, default=str).encode() + b'\n'
+                )
+                self.wfile.flush()
+
+    return Handler
+
+
+def main():
+    """Control client script function.
+    """
+    parser = argparse.ArgumentParser(
+        prog='school-bell-ctl',
+        description='Control a running school-bell.',
+    )
+    parser.add_argument(
+        '-s', '--socket', metavar='..', type=str, default=None,
+        help='Path of the control socket (default: %(default)s)'
+    )
+    parser.add_argument(
+        '-b', '--bell', metavar='..', type=str, default=None,
+        help='Name of the bell, if multiple (default: all)'
+    )
+    parser.add_argument(
+        '--timeout', metavar='..', type=float, default=60.,
+        help='Response timeout in seconds (default: %(default)s)'
+    )
+    commands = parser.add_subparsers(dest='cmd', metavar='command')
+    commands.required = True
+    ring = commands.add_parser(
+        'ring', help='Ring the bell now, also on holidays'
+    )
+    ring.add_argument('key', type=str, help='Key of the WAVE audio file')
+    play = commands.add_parser('play', help='Play locally now')
+    play.add_argument('key', type=str, help='Key of the WAVE audio file')
+    next_rings = commands.add_parser('next-rings', help='List the next rings')
+    next_rings.add_argument('count', type=int, nargs='?', default=5,
+                            help='Number of rings (default: %(default)s)')
+    holiday = commands.add_parser('holiday', help='Query a holiday')
+    holiday.add_argument('date', type=str, nargs='?', default=None,
+                         help='Date (format: %%Y-%%m-%%d, default: today)')
+    commands.add_parser('reload', help='Reload the configuration file')
+    commands.add_parser('status', help='Print the status')
+
+    args = vars(parser.parse_args())
+    path, timeout = args.pop('socket'), args.pop('timeout')
+    command = args.pop('cmd')
+    if command == 'reload':
+        args.pop('bell')
+    args = {key: value for key, value in args.items() if value is not None}
+
+    try:
+        response = request(command, path, timeout, **args)
+    except OSError as err:
+        print(f"school-bell-ctl: {err}", file=sys.stderr)
+        sys.exit(2)
+
+    if not response['ok']:
+        print(f"school-bell-ctl: {response['error']}", file=sys.stderr)
+        sys.exit(1)
+    print(json.dumps(response['result'], indent=4, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+#!/usr/bin/python3
+
+# absolute imports
+import datetime
+import logging
+from threading import Lock, Thread
+from time import time
+
+# Relative imports
+from .cache import HolidayCache
+from .openholidays import OpenHolidays, HolidayIndex, merge_holidays
+
+
+__all__ = ['HolidaySource']
+
+
+class HolidaySource(object):
+    """School and public holidays of a subdivision.
+
+    Holidays are loaded from the on-disk cache, refreshed incrementally from
+    the OpenHolidays API and requested again every night. One source can be
+    shared by all bells of the same subdivision, such that the holidays are
+    fetched only once.
+    """
+
+    def __init__(self, subdivisionCode: str, cache: HolidayCache = None,
+                 timeout: float = None, logger: logging.Logger = None):
+        """Initialize the HolidaySource object
+
+        Parameters
+        ----------
+        subdivisionCode : `str`
+            Code of the subdivision, prefixed by the language code.
+
+            _Example_: NL-BE
+
+        cache : :class:`HolidayCache`, optional
+            The on-disk holiday cache. Disabled if `None`.
+
+        timeout : `float`, optional
+            Timeout of each request, in seconds. Defaults to 10.
+
+        logger : :class:`logging.Logger`, optional
+            The logger object. Defaults to the "school-bell" logger.
+        """
+        if not isinstance(subdivisionCode, str):
+            raise TypeError("holidays subdivisionCode should be of type str!")
+        self.__timeout = timeout or 10
+        self.__logger = logger or logging.getLogger('school-bell')
+        self.__client = OpenHolidays(
+            countryIsoCode=subdivisionCode.split('-')[1],
+            languageIsoCode=subdivisionCode.split('-')[0],
+            subdivisionCode=subdivisionCode,
+            timeout=self.__timeout,
+            logger=self.__logger,
+        )
+        self.__cache = cache
+        self.__lock = Lock()
+        self.__holidays = list()
+        self.__index = HolidayIndex()
+        self.__window = None
+        self.__last_update = None
+        self.__updated = None
+        self.__job = None
+        self.__scheduler = None
+        self.__users = 0
+
+    @property
+    def client(self) -> OpenHolidays:
+        """Get the OpenHolidays object.
+        """
+        return self.__client
+
+    @property
+    def subdivisionCode(self) -> str:
+        """Get the code of the subdivision.
+        """
+        return self.__client.subdivisionCode
+
+    @property
+    def cache(self) -> HolidayCache:
+        """Get the on-disk holiday cache, or `None`.
+        """
+        return self.__cache
+
+    @property
+    def log(self):
+        """Get the logger object.
+        """
+        return self.__logger
+
+    @property
+    def holidays(self) -> list:
+        """Get the list with holidays.
+        """
+        return self.__holidays
+
+    @property
+    def index(self) -> HolidayIndex:
+        """Get the index of merged holiday intervals.
+        """
+        return self.__index
+
+    @property
+    def window(self) -> tuple:
+        """Get the `(startDate, endDate)` window covered by the holidays.
+        """
+        return self.__window
+
+    @property
+    def updated(self) -> float:
+        """Get the epoch time of the last update, or `None`.
+        """
+        return self.__updated
+
+    @property
+    def users(self) -> int:
+        """Get the number of bells using the source.
+        """
+        return self.__users
+
+    def acquire(self):
+        """Register a bell using the source.
+        """
+        self.__users += 1
+
+    def release(self) -> bool:
+        """Unregister a bell using the source. Returns `True` if it was the
+        last one, in which case the source is closed.
+        """
+        self.__users = max(self.__users - 1, 0)
+        if self.__users:
+            return False
+        self.close()
+        return True
+
+    def start(self, scheduler):
+        """Load the holidays from the cache, or request them if not cached,
+        refresh expired cached holidays in the background and schedule the
+        nightly request. A started source is left as is.
+        """
+        if self.__job is not None:
+            return
+        record = self.cache.record(self.subdivisionCode) if self.cache \
+            else None
+        if not self.load(record=record):
+            self.request()
+        elif not self.is_fresh(record=record):
+            self.log.info("cached holidays expired -> background refresh")
+            Thread(target=self.request, daemon=True).start()
+        self.__scheduler = scheduler
+        self.__job = scheduler.jobs.every().day.at("00:00").do(self.request)
+
+    def close(self):
+        """Cancel the nightly request and close the http session.
+        """
+        if self.__job is not None:
+            self.__scheduler.jobs.cancel_job(self.__job)
+            self.__job = None
+        self.__client.close()
+
+    def load(self, days: int = None, record: dict = None) -> bool:
+        """Load school and public holidays from the on-disk cache, or from a
+        `record` already read from it, also if expired. Returns `True` on
+        success.
+        """
+        if not self.cache:
+            return False
+
+        startDate = datetime.date.today()
+        endDate = startDate + datetime.timedelta(days=days or 180)
+
+        record = record or self.cache.record(self.subdivisionCode)
+        holidays = self.cache.match(record, startDate, endDate, stale=True)
+        if holidays is None:
+            return False
+
+        self.log.info("holidays loaded from cache")
+        self.__holidays = merge_holidays([], holidays, startDate=startDate)
+        self.__index = HolidayIndex(self.__holidays)
+        self.__window = (startDate, record['validTo'])
+        self.__last_update = datetime.date.fromtimestamp(record['updated'])
+        self.__updated = record['updated']
+        return True
+
+    def is_fresh(self, days: int = None, record: dict = None) -> bool:
+        """Returns `True` if the on-disk cache, or a `record` already read
+        from it, covers the next `days` and has not expired.
+        """
+        if not self.cache:
+            return False
+
+        startDate = datetime.date.today()
+        endDate = startDate + datetime.timedelta(days=days or 180)
+
+        record = record or self.cache.record(self.subdivisionCode)
+        return self.cache.match(record, startDate, endDate) is not None
+
+    def request(self, days: int = None, revalidate: int = None,
+                **kwargs) -> bool:
+        """Request school and public holidays using the OpenHolidays API.
+        Returns `True` on success.
+
+        The refresh is incremental: known holidays are kept, only the newly
+        uncovered tail of the window and a revalidation window near today
+        are requested, and holidays that already passed are dropped.
+        """
+        startDate = datetime.date.today()
+        endDate = startDate + datetime.timedelta(days=days or 180)
+        revalidateDate = startDate + datetime.timedelta(days=revalidate or 7)
+
+        with self.__lock:
+            known = self.__window
+            if (
+                known is None or known[0] > startDate or
+                known[1] < revalidateDate
+            ):
+                windows = [(startDate, endDate)]
+            else:
+                windows = [(startDate, revalidateDate)]
+                if known[1] < endDate:
+                    windows.append(
+                        (known[1] + datetime.timedelta(days=1), endDate)
+                    )
+
+            holidays = self._fetch(windows, **kwargs)
+            if holidays is None:
+                return False
+
+            self.__holidays = merge_holidays(
+                self.__holidays if known else [], holidays, windows, startDate
+            )
+            self.__index = HolidayIndex(self.__holidays)
+            self.__window = (
+                startDate, max(endDate, known[1]) if known else endDate
+            )
+            self.__last_update = startDate
+            self.__updated = time()
+            self.log.debug("holidays request completed.")
+
+            if self.cache:
+                try:
+                    self.cache.set(self.subdivisionCode, *self.__window,
+                                   self.__holidays)
+                except OSError as err:
+                    self.log.warning(f"holidays cache update failed: {err}")
+            return True
+
+    def _fetch(self, windows: list, **kwargs) -> list:
+        """Internal function to request the holidays of the `(validFrom,
+        validTo)` date windows. Returns `None` if a request failed.
+
+        Partial results are refused, as merging them would drop the known
+        holidays of the failed kind within the windows.
+        """
+        from requests.exceptions import RequestException
+
+        holidays = []
+        for validFrom, validTo in windows:
+            self.log.info(f"request holidays from {validFrom} until {validTo}")
+            try:
+                result = self.client.holidays(
+                    str(validFrom), str(validTo),
+                    timeout=self.__timeout,
+                    partial=False,
+                    **kwargs
+                )
+                if not isinstance(result, list):
+                    raise RequestException(result)
+            except RequestException as err:
+                self.log.warning(
+                    "holidays request failed. Last update on {}"
+                    .format(self.__last_update)
+                )
+                self.log.debug(err)
+                return None
+            holidays += result
+        return holidays
+
+    def between(self, startDate: datetime.date,
+                endDate: datetime.date) -> tuple:
+        """Returns a :class:`HolidayIndex` covering the date range and the
+        `(startDate, endDate)` window it covers.
+
+        Holidays outside the known window are requested without updating the
+        source. The known index and window are returned if that request
+        fails.
+        """
+        known = self.window
+        one_day = datetime.timedelta(days=1)
+        if known is None:
+            windows = [(startDate, endDate)]
+        else:
+            windows = []
+            if startDate < known[0]:
+                windows.append((startDate, known[0] - one_day))
+            if endDate > known[1]:
+                windows.append((known[1] + one_day, endDate))
+        if not windows:
+            return self.index, known
+
+        fetched = self._fetch(windows)
+        if fetched is None:
+            return self.index, known
+
+        holidays = merge_holidays(self.holidays, fetched, windows)
+        window = (startDate, endDate) if known is None else (
+            min(startDate, known[0]), max(endDate, known[1])
+        )
+        return HolidayIndex(holidays), window
+
+    def is_holiday(self, date: datetime.date) -> bool:
+        """Returns `True` if `date` is a school or public holiday. The
+        holidays are requested first if none were loaded yet.
+        """
+        if self.window is None:
+            self.log.debug("  no holiday list found -> request")
+            if not self.request():
+                return False
+        return self.index.is_holiday(date)
@@ -5,6 +5,7 @@ import argparse
 import json
 import pkgutil
 import os
+import signal
 import sys
 
 # Relative imports
@@ -12,8 +13,7 @@ try:
     from .version import version
 except (ValueError, ModuleNotFoundError, SyntaxError):
     version = "VERSION-NOT-FOUND"
-from .utils import init_logger, system_call
-from .school_bell import SchoolBell
+from .utils import init_logger, log_handlers, system_call
 
 # Set path of demo files
 share = os.path.join(sys.exec_prefix, 'share', 'school-bell')
@@ -68,6 +68,87 @@ class SelfUpdate(argparse.Action):
         sys.exit()
 
 
+def load_config(config: str) -> dict:
+    """Load and check the JSON configuration given a string or file.
+    A configuration with a dictionary `bells` holds one configuration per
+    bell, with the other keys shared by all bells.
+    """
+    if os.path.isfile(os.path.expandvars(config)):
+        with open(os.path.expandvars(config)) as f:
+            config = json.load(f)
+    else:
+        try:
+            config = json.loads(config)
+        except json.decoder.JSONDecodeError:
+            err = "JSON configuration should be a string or file!"
+            raise RuntimeError(err)
+
+    bells = {None: config}
+    if 'bells' in config:
+        if not isinstance(config['bells'], dict):
+            raise TypeError("JSON config 'bells' should be a dictionary!")
+        bells = {name: {**config, **bell}
+                 for name, bell in config['bells'].items()}
+
+    # check if all main arguments are present and of the correct type
+    for name, bell in bells.items():
+        prefix = f"JSON config of bell '{name}'" if name else "JSON config"
+        for key in ('schedule', 'wav'):
+            if key not in bell:
+                err = f"{prefix} should contain the dictionary '{key}'!"
+                raise KeyError(err)
+            if not isinstance(bell[key], dict):
+                err = f"{prefix} '{key}' should be a dictionary!"
+                raise TypeError(err)
+        try:
+            log_handlers(bell.get('log'))
+        except (TypeError, ValueError) as err:
+            raise err.__class__(f"{prefix} 'log': {err}")
+
+    return config
+
+
+def watch_config(obj, path: str, interval: float = None,
+                 overrides: dict = None):
+    """Reload the configuration of the SchoolBell object on SIGHUP and,
+    if `interval` is set, when the file modification time changes.
+    The `overrides` (e.g., command line options) update the reloaded file.
+    A reload always runs in the scheduler loop, never in the signal handler,
+    and a SIGHUP before the loop is running is reloaded once it starts.
+    Returns the reload function, returning the changes.
+    """
+    path = os.path.expandvars(path)
+    mtime = [os.stat(path).st_mtime]
+
+    def reload():
+        return obj.reload({**load_config(path), **(overrides or dict())})
+
+    def try_reload(*args):
+        try:
+            reload()
+        except Exception as err:
+            obj.log.error(f"reload failed: {err}")
+
+    def check():
+        try:
+            current = os.stat(path).st_mtime
+        except OSError as err:
+            # e.g., replaced by an editor with an atomic rename
+            obj.log.debug(f"config check skipped: {err}")
+            return
+        if current != mtime[0]:
+            mtime[0] = current
+            try_reload()
+
+    def on_sighup(signum, frame):
+        obj.scheduler.call_soon(try_reload)
+
+    signal.signal(signal.SIGHUP, on_sighup)
+    if interval:
+        obj.scheduler.jobs.every(interval).seconds.do(check)
+    return reload
+
+
 def main():
     """Main script function.
     """
@@ -90,6 +171,12 @@ def main():
               'the JSON configuration and exit '
               '(default: %(default)s)')
     )
+    parser.add_argument(
+        '--control', metavar='..', type=str, nargs='?',
+        default=False, const='',
+        help=('Serve the control API on a UNIX socket, optionally at the '
+              'given path, for school-bell-ctl (default: %(default)s)')
+    )
     parser.add_argument(
         '--debug', action='store_true',
         default=False,
@@ -103,6 +190,13 @@ def main():
         '--demo-service', action=DemoService, nargs=0,
         help='Print the demo systemctl service for the current user and exit'
     )
+    parser.add_argument(
+        '--simulate', metavar='..', type=int, nargs='?',
+        default=False, const=7,
+        help=('Simulate the schedule for the given number of days, '
+              'without playing, print all rings and exit '
+              '(default: %(default)s)')
+    )
     parser.add_argument(
         '--test', action='store_true',
         default=False,
@@ -120,6 +214,13 @@ def main():
         '--version', action='version', version=version,
         help='Print the version and exit'
     )
+    parser.add_argument(
+        '--watch', metavar='..', type=float, nargs='?',
+        default=False, const=10.,
+        help=('Reload the JSON configuration file when changed, checked '
+              'every given number of seconds. A SIGHUP always reloads the '
+              'file (default: %(default)s)')
+    )
     parser.add_argument(
         'config', type=str, help='JSON configuration (string or file)'
     )
@@ -128,24 +229,8 @@ def main():
     args = parser.parse_args()
 
     # parse config
-    if os.path.isfile(os.path.expandvars(args.config)):
-        with open(os.path.expandvars(args.config)) as f:
-            args.config = json.load(f)
-    else:
-        try:
-            args.config = json.loads(args.config)
-        except json.decoder.JSONDecodeError:
-            err = "JSON configuration should be a string or file!"
-            raise RuntimeError(err)
-
-    # check if all main arguments are present and of the correct type
-    for key in ('schedule', 'wav'):
-        if key not in args.config:
-            err = f"JSON config should contain the dictionary '{key}'!"
-            raise KeyError(err)
-        if not isinstance(args.config[key], dict):
-            err = f"JSON config '{key}' should be a dictionary!"
-            raise TypeError(err)
+    path = args.config
+    args.config = load_config(args.config)
 
     # add some extra config keys
     args.config['test'] = args.test
@@ -153,15 +238,46 @@ def main():
     args.config['prog'] = prog
     args.config['info'] = info
 
-    # init
-    obj = SchoolBell(**args.config)
+    # init, importing the heavy dependencies only now
+    if 'bells' in args.config:
+        if args.play:
+            parser.error("option --play requires a single bell configuration")
+        from .runner import BellRunner
+        obj = BellRunner(**args.config)
+    else:
+        from .school_bell import SchoolBell
+        obj = SchoolBell(**args.config)
 
-    # play a test file or run the schedule
+    # play a test file, simulate or run the schedule
     if args.play:
         obj.play(args.play)
         raise SystemExit()
+    elif args.simulate is not False:
+        status = {True: 'holiday', False: 'ring', None: 'ring?'}
+        rings = obj.simulate(days=args.simulate)
+        for name, ring in (rings if 'bells' in args.config else
+                           [(None, ring) for ring in rings]):
+            print("{:%a %Y-%m-%d %H:%M:%S}  {:<8} {}{}".format(
+                ring.when, status[ring.holiday],
+                f"{name}: " if name else '', ring.key
+            ))
+        obj.close()
+        raise SystemExit()
     else:
-        obj.run_schedule()
+        reload = None
+        if os.path.isfile(os.path.expandvars(path)):
+            reload = watch_config(obj, path, args.watch or None,
+                                  dict(test=args.test))
+        control = None
+        if args.control is not False:
+            from .control import ControlServer
+            control = ControlServer(obj, args.control or None, reload)
+            control.start()
+        try:
+            obj.run_schedule()
+        finally:
+            if control:
+                control.stop()
 
 
 if __name__ == "__main__":
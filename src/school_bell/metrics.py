@@ -0,0 +1,345 @@
+#!/usr/bin/python3
+
+# absolute imports
+import logging
+import math
+from collections import deque, namedtuple
+from threading import Lock, Thread
+
+
+__all__ = ['RingRecord', 'RingStats', 'Metrics', 'MetricsServer',
+           'percentile']
+
+
+RingRecord = namedtuple(
+    'RingRecord',
+    ['key', 'scheduled', 'dispatched', 'targets', 'buzzer_on', 'buzzer_off']
+)
+RingRecord.__doc__ = """Timings of a ring as epoch times: the scheduled and the
+dispatch time, a :class:`TargetResult` per target and the buzzer on and off
+times (`None` without buzzer)."""
+
+
+def percentile(values: list, q: float) -> float:
+    """Returns the nearest-rank percentile `q` (0-100) of the values, or
+    `None` if empty.
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    rank = max(math.ceil(q / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+def _summary(values: list) -> dict:
+    """Internal function returning the p50, p95 and max of the values.
+    """
+    return dict(
+        count=len(values),
+        p50=percentile(values, 50),
+        p95=percentile(values, 95),
+        max=max(values) if values else None,
+    )
+
+
+class RingStats(object):
+    """In-memory ring buffer of the latest ring timings with percentile
+    summaries of the drift against the scheduled time.
+    """
+
+    def __init__(self, maxlen: int = None):
+        """Initialize the RingStats object
+
+        Parameters
+        ----------
+        maxlen : `int`, optional
+            Number of rings to keep. Defaults to 1000.
+        """
+        self.__records = deque(maxlen=maxlen or 1000)
+        self.__lock = Lock()
+
+    def __len__(self):
+        """Returns the number of kept rings.
+        """
+        return len(self.__records)
+
+    @property
+    def records(self) -> list:
+        """Get a copy of the kept ring records, oldest first.
+        """
+        with self.__lock:
+            return list(self.__records)
+
+    def add(self, record: RingRecord):
+        """Add a ring record, dropping the oldest if full.
+        """
+        with self.__lock:
+            self.__records.append(record)
+
+    def summary(self) -> dict:
+        """Returns the drift summary, in seconds, of the dispatch and of the
+        playback start of all targets against the scheduled time.
+        """
+        records = self.records
+        return dict(
+            dispatch=_summary([
+                record.dispatched - record.scheduled for record in records
+            ]),
+            start=_summary([
+                result.start - record.scheduled for record in records
+                for result in record.targets.values()
+                if result.start is not None
+            ]),
+        )
+
+
+_buckets = (.001, .005, .01, .025, .05, .1, .25, .5, 1., 2.5, 5., 10., 30.)
+
+
+def _labels(labels: dict) -> str:
+    """Internal function to format the labels in the Prometheus text format.
+    """
+    if not labels:
+        return ''
+    return '{' + ','.join(
+        '{}="{}"'.format(name, str(value).replace('\\', '\\\\')
+                         .replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in sorted(labels.items())
+    ) + '}'
+
+
+class Metrics(object):
+    """Registry of counters, gauges and histograms rendered in the
+    Prometheus text format.
+    """
+
+    def __init__(self, prefix: str = None, logger: logging.Logger = None,
+                 **labels):
+        """Initialize the Metrics object
+
+        Parameters
+        ----------
+        prefix : `str`, optional
+            Prefix of all metric names. Defaults to "school_bell".
+
+        logger : :class:`logging.Logger`, optional
+            The logger object. Defaults to the "school-bell" logger.
+
+        **labels :
+            Constant labels added to all series.
+        """
+        self.prefix = prefix or 'school_bell'
+        self.labels = labels
+        self.__logger = logger or logging.getLogger('school-bell')
+        self.__metrics = dict()
+        self.__lock = Lock()
+
+    @property
+    def log(self) -> logging.Logger:
+        """Get the logger object.
+        """
+        return self.__logger
+
+    def child(self, **labels) -> 'Metrics':
+        """Returns a view on the same registry adding constant labels to all
+        series, e.g., one per bell served from a single endpoint.
+        """
+        child = Metrics(self.prefix, self.log, **self.labels, **labels)
+        child.__metrics = self.__metrics
+        child.__lock = self.__lock
+        return child
+
+    def _key(self, labels: dict) -> tuple:
+        """Internal function returning the series key of the labels.
+        """
+        return tuple(sorted({**self.labels, **labels}.items()))
+
+    def remove(self, **labels):
+        """Remove all series with the constant and given labels.
+        """
+        match = set(self._key(labels))
+        with self.__lock:
+            for name in list(self.__metrics):
+                values = self.__metrics[name]['values']
+                for key in [key for key in values if match <= set(key)]:
+                    del values[key]
+                if not values:
+                    del self.__metrics[name]
+
+    def _metric(self, name: str, kind: str, help: str = None) -> dict:
+        """Internal function to get or register a metric.
+        """
+        name = f"{self.prefix}_{name}"
+        if name not in self.__metrics:
+            self.__metrics[name] = dict(kind=kind, help=help or name,
+                                        values=dict())
+        return self.__metrics[name]
+
+    def inc(self, name: str, value: float = 1, help: str = None, **labels):
+        """Increment a counter.
+        """
+        with self.__lock:
+            values = self._metric(name, 'counter', help)['values']
+            key = self._key(labels)
+            values[key] = values.get(key, 0) + value
+
+    def count(self, name: str, value, help: str = None, **labels):
+        """Set a counter to a callable evaluated when rendered, for a total
+        kept elsewhere. A counter evaluating to `None` is not rendered.
+        """
+        with self.__lock:
+            values = self._metric(name, 'counter', help)['values']
+            values[self._key(labels)] = value
+
+    def set(self, name: str, value, help: str = None, **labels):
+        """Set a gauge to a value, or to a callable evaluated when rendered.
+        A gauge evaluating to `None` is not rendered.
+        """
+        with self.__lock:
+            values = self._metric(name, 'gauge', help)['values']
+            values[self._key(labels)] = value
+
+    def observe(self, name: str, value: float, help: str = None,
+                buckets: tuple = None, **labels):
+        """Observe a value in a histogram.
+        """
+        with self.__lock:
+            metric = self._metric(name, 'histogram', help)
+            metric.setdefault('buckets', buckets or _buckets)
+            key = self._key(labels)
+            counts = metric['values'].setdefault(
+                key, dict(buckets=[0] * len(metric['buckets']), sum=0.,
+                          count=0)
+            )
+            for i, le in enumerate(metric['buckets']):
+                if value <= le:
+                    counts['buckets'][i] += 1
+            counts['sum'] += value
+            counts['count'] += 1
+
+    def get(self, name: str, **labels):
+        """Get the current value of a counter or gauge, or `None`.
+        """
+        metric = self.__metrics.get(f"{self.prefix}_{name}")
+        if metric is None:
+            return None
+        value = metric['values'].get(self._key(labels))
+        return value() if callable(value) else value
+
+    def render(self) -> str:
+        """Returns all metrics in the Prometheus text format. A series whose
+        callable raises is skipped, such that it never fails the scrape.
+        The callables are evaluated after the registry is released, such
+        that they can update the metrics.
+        """
+        with self.__lock:
+            metrics = []
+            for name, metric in sorted(self.__metrics.items()):
+                values = sorted(metric['values'].items())
+                if metric['kind'] == 'histogram':
+                    values = [(key, dict(counts,
+                                         buckets=list(counts['buckets'])))
+                              for key, counts in values]
+                metrics.append((name, dict(metric, values=values)))
+
+        lines = []
+        for name, metric in metrics:
+            lines.append(f"# HELP {name} {metric['help']}")
+            lines.append(f"# TYPE {name} {metric['kind']}")
+            for key, value in metric['values']:
+                labels = dict(key)
+                if metric['kind'] != 'histogram':
+                    try:
+                        value = value() if callable(value) else value
+                    except Exception as err:
+                        self.log.debug(f"metric {name} skipped: {err!r}")
+                        continue
+                    if value is not None:
+                        lines.append(f"{name}{_labels(labels)} {value}")
+                    continue
+                for le, count in zip(metric['buckets'], value['buckets']):
+                    lines.append("{}_bucket{} {}".format(
+                        name, _labels(dict(labels, le=le)), count
+                    ))
+                lines.append("{}_bucket{} {}".format(
+                    name, _labels(dict(labels, le='+Inf')), value['count']
+                ))
+                lines.append(f"{name}_sum{_labels(labels)} {value['sum']}")
+                lines.append(f"{name}_count{_labels(labels)} {value['count']}")
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsServer(object):
+    """Opt-in HTTP endpoint serving the metrics in the Prometheus text
+    format from a background thread.
+    """
+
+    def __init__(self, metrics: Metrics, port: int, host: str = None):
+        """Initialize the MetricsServer object
+
+        Parameters
+        ----------
+        metrics : :class:`Metrics`
+            The metrics to serve.
+
+        port : `int`
+            The port to listen on. Set 0 for any free port.
+
+        host : `str`, optional
+            The address to listen on. Defaults to "127.0.0.1".
+        """
+        from http.server import ThreadingHTTPServer
+
+        self.metrics = metrics
+        self.__server = ThreadingHTTPServer(
+            (host or '127.0.0.1', int(port)), _handler(metrics)
+        )
+        self.__server.daemon_threads = True
+        self.__thread = None
+
+    @property
+    def address(self) -> tuple:
+        """Get the `(host, port)` the server listens on.
+        """
+        return self.__server.server_address[:2]
+
+    def start(self):
+        """Start serving in a daemon thread.
+        """
+        self.__thread = Thread(target=self.__server.serve_forever,
+                               name='metrics', daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """Stop serving and close the socket.
+        """
+        if self.__thread is not None:
+            self.__server.shutdown()
+            self.__thread.join()
+            self.__thread = None
+        self.__server.server_close()
+
+
+def _handler(metrics: Metrics):
+    """Internal function returning the request handler class of the metrics.
+    """
+    from http.server import BaseHTTPRequestHandler
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            if self.path.split('?')[0] not in ('/', '/metrics'):
+                self.send_error(404)
+                return
+            body = metrics.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type',
+                             'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
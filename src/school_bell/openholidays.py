@@ -3,13 +3,26 @@
 # absolute imports
 import datetime
 import json
-import requests
+import logging
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+from threading import local
+from time import monotonic
+from typing import TYPE_CHECKING
 
 # Relative imports
 from .utils import to_date
 
+# requests is only imported once a client is created
+if TYPE_CHECKING:
+    import requests
 
-__all__ = ['OpenHolidays', 'is_holiday']
+
+__all__ = ['OpenHolidays', 'AsyncOpenHolidays', 'HolidayIndex',
+           'fetch_holidays', 'async_fetch_holidays', 'merge_holidays',
+           'is_holiday']
 
 
 class OpenHolidays(object):
@@ -17,15 +30,52 @@ class OpenHolidays(object):
     """
 
     def __init__(self, countryIsoCode: str = None, languageIsoCode: str = None,
-                 subdivisionCode: str = None):
+                 subdivisionCode: str = None, retries: int = None,
+                 backoff: float = None, timeout: float = None,
+                 deadline: float = None, logger: logging.Logger = None):
         """Initialize the Open Holidays API object
+
+        Parameters
+        ----------
+        countryIsoCode : `str`, optional
+            ISO 3166-1 code of the country.
+
+        languageIsoCode : `str`, optional
+            ISO-639-1 code of a language.
+
+        subdivisionCode : `str`, optional
+            Code of the subdivision.
+
+        retries : `int`, optional
+            Number of retries of a failed request. Defaults to 3.
+
+        backoff : `float`, optional
+            Exponential backoff factor between retries, in seconds.
+            Defaults to 0.5.
+
+        timeout : `float`, optional
+            Default timeout of each request, in seconds. Defaults to 10.
+
+        deadline : `float`, optional
+            Default deadline of each call, including its retries, in seconds.
+            No retry is started that cannot complete before the deadline.
+            Defaults to twice the timeout.
+
+        logger : :class:`logging.Logger`, optional
+            The logger object. Defaults to the "school-bell" logger.
         """
         self.__countryIsoCode = countryIsoCode
         self.__languageIsoCode = languageIsoCode
         self.__subdivisionCode = subdivisionCode
-        self.__swagger = self._get("swagger/v1/swagger.json")
+        self.__swagger = None
+        self.__timeout = timeout or 10
+        self.__deadline = deadline or 2 * self.__timeout
+        self.__session = _session(3 if retries is None else retries,
+                                  .5 if backoff is None else backoff)
+        self.__pool = None
         self.__is_holiday_request = None
         self.__is_holiday = False
+        self.__logger = logger or logging.getLogger('school-bell')
 
     @property
     def countryIsoCode(self):
@@ -45,10 +95,51 @@ class OpenHolidays(object):
         """
         return self.__subdivisionCode
 
+    @property
+    def timeout(self):
+        """Returns the default request timeout.
+        """
+        return self.__timeout
+
+    @property
+    def deadline(self):
+        """Returns the default call deadline, including the retries.
+        """
+        return self.__deadline
+
+    @property
+    def log(self) -> logging.Logger:
+        """Returns the logger object.
+        """
+        return self.__logger
+
+    @property
+    def session(self) -> 'requests.Session':
+        """Returns the pooled keep-alive http session.
+        """
+        return self.__session
+
+    def close(self):
+        """Close the http session and its pooled connections.
+        """
+        if self.__pool is not None:
+            self.__pool.shutdown(wait=False)
+            self.__pool = None
+        self.__session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     @property
     def _swagger(self):
-        """Returns the openapi swagger.
+        """Returns the openapi swagger, requested on first access.
         """
+        if self.__swagger is None:
+            self.__swagger = self._get("swagger/v1/swagger.json",
+                                       parse_dates=False)
         return self.__swagger
 
     def __str__(self):
@@ -85,15 +176,80 @@ class OpenHolidays(object):
         """
         return '/'.join([self.base_url, *args])
 
-    def _get(self, path: str, *args, **kwargs) -> list:
+    def _get(self, path: str, params: dict = None, **kwargs) -> list:
         """Returns the parsed json object of the get request to the API.
+        The request, including its retries, is bounded by the `deadline`.
+        A response that is not json (e.g., a proxy error page) raises a
+        :class:`requests.exceptions.RequestException`.
         """
+        from requests.exceptions import RequestException
+
         parse_dates = kwargs.pop('parse_dates', True)
-        data = json.loads(requests.get(self.url(path), *args, **kwargs).text)
+        deadline = kwargs.pop('deadline', None) or self.deadline
+        timeout = min(kwargs.pop('timeout', None) or self.timeout, deadline)
+        _call.deadline, _call.timeout = monotonic() + deadline, timeout
+        try:
+            response = self.session.get(self.url(path), params=params,
+                                        timeout=timeout, **kwargs)
+        finally:
+            _call.deadline = _call.timeout = None
+        try:
+            data = response.json()
+        except ValueError as err:
+            raise RequestException(
+                f"{response.status_code} invalid json response: {err}",
+                response=response
+            ) from err
         if parse_dates:
             _parse_holiday_dates(data)
         return data
 
+    def _get_all(self, paths: list, *args, **kwargs) -> list:
+        """Returns the merged and deduplicated parsed json objects of the
+        concurrent get requests to the API. All requests share the same
+        arguments and one deadline.
+
+        A failed request is logged and the results of the others are kept,
+        unless `partial=False` is given. The first failure is raised, or its
+        error response returned, if no request succeeded.
+        """
+        partial = kwargs.pop('partial', True)
+        deadline = kwargs.get('deadline') or self.deadline
+        if self.__pool is None:
+            self.__pool = ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix='openholidays'
+            )
+        futures = {path: self.__pool.submit(self._get, path, *args, **kwargs)
+                   for path in paths}
+        done, pending = wait(futures.values(), timeout=deadline)
+
+        results, failures = [], dict()
+        for path, future in futures.items():
+            if future in pending:
+                from requests.exceptions import Timeout
+
+                future.cancel()
+                failures[path] = Timeout(
+                    f"{path} request exceeded the deadline of {deadline} s"
+                )
+            elif future.exception() is not None:
+                failures[path] = future.exception()
+            elif not isinstance(future.result(), list):
+                failures[path] = future.result()
+            else:
+                results.append(future.result())
+
+        if failures and not (partial and results):
+            failure = next(iter(failures.values()))
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        for path, failure in failures.items():
+            self.log.warning(
+                f"{path} request failed, holidays are incomplete: {failure}"
+            )
+        return _merge_holidays(results)
+
     def publicHolidays(
         self, validFrom: str, validTo: str = None, countryIsoCode: str = None,
         languageIsoCode: str = None, subdivisionCode: str = None, **kwargs
@@ -132,7 +288,7 @@ class OpenHolidays(object):
             _Example_: NL-BE
 
         **kwargs :
-            Parameters passed to :func:`requests.get`.
+            Parameters passed to :meth:`requests.Session.get`.
         """
         args = dict(
             countryIsoCode=countryIsoCode or self.countryIsoCode,
@@ -161,7 +317,7 @@ class OpenHolidays(object):
             _Example_: NL
 
         **kwargs :
-            Parameters passed to :func:`requests.get`.
+            Parameters passed to :meth:`requests.Session.get`.
         """
         args = dict(
             languageIsoCode=languageIsoCode or self.languageIsoCode,
@@ -207,7 +363,7 @@ class OpenHolidays(object):
             _Example_: NL-BE
 
         **kwargs :
-            Parameters passed to :func:`requests.get`.
+            Parameters passed to :meth:`requests.Session.get`.
         """
         args = dict(
             countryIsoCode=countryIsoCode or self.countryIsoCode,
@@ -236,7 +392,7 @@ class OpenHolidays(object):
             _Example_: NL
 
         **kwargs :
-            Parameters passed to :func:`requests.get`.
+            Parameters passed to :meth:`requests.Session.get`.
         """
         args = dict(
             languageIsoCode=languageIsoCode or self.languageIsoCode,
@@ -282,7 +438,7 @@ class OpenHolidays(object):
             _Example_: NL-BE
 
         **kwargs :
-            Parameters passed to :func:`requests.get`.
+            Parameters passed to :meth:`requests.Session.get`.
         """
         args = dict(
             countryIsoCode=countryIsoCode or self.countryIsoCode,
@@ -291,10 +447,8 @@ class OpenHolidays(object):
             validTo=str(validTo or validFrom),
             subdivisionCode=subdivisionCode or self.subdivisionCode
         )
-        return (
-            self._get('SchoolHolidays', args, **kwargs) +
-            self._get('PublicHolidays', args, **kwargs)
-        )
+        return self._get_all(['SchoolHolidays', 'PublicHolidays'],
+                             args, **kwargs)
 
     def holidaysByDate(
         self, date: str, languageIsoCode: str = None, **kwargs
@@ -316,16 +470,14 @@ class OpenHolidays(object):
             _Example_: NL
 
         **kwargs :
-            Parameters passed to :func:`requests.get`.
+            Parameters passed to :meth:`requests.Session.get`.
         """
         args = dict(
-            countryIsoCode=languageIsoCode or self.__languageIsoCode,
+            languageIsoCode=languageIsoCode or self.languageIsoCode,
             date=str(date),
         )
-        return (
-            self._get('PublicHolidaysByDate', args, **kwargs) +
-            self._get('SchoolHolidaysByDate', args, **kwargs)
-        )
+        return self._get_all(['PublicHolidaysByDate', 'SchoolHolidaysByDate'],
+                             args, **kwargs)
 
     def countries(
         self, languageIsoCode: str = None, **kwargs
@@ -341,7 +493,7 @@ class OpenHolidays(object):
             _Example_: NL
 
         **kwargs :
-            Parameters passed to :func:`requests.get`.
+            Parameters passed to :meth:`requests.Session.get`.
         """
         args = dict(
             languageIsoCode=languageIsoCode or self.languageIsoCode
@@ -362,7 +514,7 @@ class OpenHolidays(object):
             _Example_: BE
 
         **kwargs :
-            Parameters passed to :func:`requests.get`.
+            Parameters passed to :meth:`requests.Session.get`.
         """
         args = dict(
             countryIsoCode=countryIsoCode or self.countryIsoCode
@@ -389,7 +541,7 @@ class OpenHolidays(object):
             _Example_: NL
 
         **kwargs :
-            Parameters passed to :func:`requests.get`.
+            Parameters passed to :meth:`requests.Session.get`.
         """
         args = dict(
             countryIsoCode=countryIsoCode or self.countryIsoCode,
@@ -431,7 +583,7 @@ class OpenHolidays(object):
             _Example_: NL-BE
 
         **kwargs :
-            Parameters passed to :func:`requests.get`.
+            Parameters passed to :meth:`requests.Session.get`.
         """
 
         args = dict(
@@ -467,6 +619,302 @@ class OpenHolidays(object):
         return self.__is_holiday_request
 
 
+class AsyncOpenHolidays(object):
+    """Asyncio wrapper of :class:`OpenHolidays` offloading the blocking
+    requests to threads.
+
+    Each request method is a coroutine with the same signature that runs
+    the blocking request in an executor, such that the event loop is never
+    stalled. This is not an async transport: cancelling a coroutine (e.g.,
+    on shutdown) returns control immediately, but does not abort the http
+    request. The request keeps running in its thread until it completes or
+    its deadline expires.
+    """
+
+    def __init__(self, *args, executor=None, **kwargs):
+        """Initialize the asyncio Open Holidays API object
+
+        Parameters
+        ----------
+        *args, **kwargs :
+            Parameters passed to :class:`OpenHolidays`.
+
+        executor : :class:`concurrent.futures.Executor`, optional
+            Executor to run the requests. Defaults to the event loop default
+            executor.
+        """
+        self.__client = OpenHolidays(*args, **kwargs)
+        self.__executor = executor
+
+    @property
+    def client(self) -> OpenHolidays:
+        """Returns the blocking :class:`OpenHolidays` client.
+        """
+        return self.__client
+
+    @property
+    def countryIsoCode(self):
+        """Returns the class countryIsoCode.
+        """
+        return self.client.countryIsoCode
+
+    @property
+    def languageIsoCode(self):
+        """Returns the class languageIsoCode.
+        """
+        return self.client.languageIsoCode
+
+    @property
+    def subdivisionCode(self):
+        """Returns the class subdivisionCode.
+        """
+        return self.client.subdivisionCode
+
+    def close(self):
+        """Close the http session and its pooled connections.
+        """
+        self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+
+    async def _run(self, method, *args, **kwargs):
+        """Internal function to run a blocking method in the executor.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.__executor, partial(method, *args, **kwargs)
+        )
+
+    async def swagger(self) -> dict:
+        """Coroutine returning the openapi swagger.
+        """
+        return await self._run(getattr, self.client, '_swagger')
+
+    async def publicHolidays(self, *args, **kwargs):
+        """Coroutine of :meth:`OpenHolidays.publicHolidays`.
+        """
+        return await self._run(self.client.publicHolidays, *args, **kwargs)
+
+    async def publicHolidaysByDate(self, *args, **kwargs):
+        """Coroutine of :meth:`OpenHolidays.publicHolidaysByDate`.
+        """
+        return await self._run(self.client.publicHolidaysByDate,
+                               *args, **kwargs)
+
+    async def schoolHolidays(self, *args, **kwargs):
+        """Coroutine of :meth:`OpenHolidays.schoolHolidays`.
+        """
+        return await self._run(self.client.schoolHolidays, *args, **kwargs)
+
+    async def schoolHolidaysByDate(self, *args, **kwargs):
+        """Coroutine of :meth:`OpenHolidays.schoolHolidaysByDate`.
+        """
+        return await self._run(self.client.schoolHolidaysByDate,
+                               *args, **kwargs)
+
+    async def holidays(self, *args, **kwargs):
+        """Coroutine of :meth:`OpenHolidays.holidays`.
+        """
+        return await self._run(self.client.holidays, *args, **kwargs)
+
+    async def holidaysByDate(self, *args, **kwargs):
+        """Coroutine of :meth:`OpenHolidays.holidaysByDate`.
+        """
+        return await self._run(self.client.holidaysByDate, *args, **kwargs)
+
+    async def countries(self, *args, **kwargs):
+        """Coroutine of :meth:`OpenHolidays.countries`.
+        """
+        return await self._run(self.client.countries, *args, **kwargs)
+
+    async def languages(self, *args, **kwargs):
+        """Coroutine of :meth:`OpenHolidays.languages`.
+        """
+        return await self._run(self.client.languages, *args, **kwargs)
+
+    async def subdivisions(self, *args, **kwargs):
+        """Coroutine of :meth:`OpenHolidays.subdivisions`.
+        """
+        return await self._run(self.client.subdivisions, *args, **kwargs)
+
+    async def isHoliday(self, *args, **kwargs):
+        """Coroutine of :meth:`OpenHolidays.isHoliday`.
+        """
+        return await self._run(self.client.isHoliday, *args, **kwargs)
+
+
+def fetch_holidays(clients: list, validFrom: str, validTo: str = None,
+                   max_workers: int = None, **kwargs) -> dict:
+    """Returns the public and school holidays of multiple clients, fetched
+    in parallel, as a dictionary keyed by the subdivision code.
+
+    Parameters
+    ----------
+    clients : `list`
+        A list of :class:`OpenHolidays` objects.
+
+    validFrom : `str`
+        Start of the data range (format: %Y-%m-%d).
+
+    validTo : `str`, optional
+        End of the data range (format: %Y-%m-%d).
+        Defaults to `validFrom`.
+
+    max_workers : `int`, optional
+        Maximum number of clients fetched at once. Defaults to 4.
+
+    **kwargs :
+        Parameters passed to :meth:`OpenHolidays.holidays`.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers or 4) as pool:
+        futures = {
+            client.subdivisionCode: pool.submit(
+                client.holidays, validFrom, validTo, **kwargs
+            )
+            for client in clients
+        }
+        return {code: future.result() for code, future in futures.items()}
+
+
+async def async_fetch_holidays(clients: list, validFrom: str,
+                               validTo: str = None, max_workers: int = None,
+                               **kwargs) -> dict:
+    """Coroutine returning the public and school holidays of multiple
+    asyncio clients, fetched concurrently, as a dictionary keyed by the
+    subdivision code.
+
+    Parameters
+    ----------
+    clients : `list`
+        A list of :class:`AsyncOpenHolidays` objects.
+
+    validFrom : `str`
+        Start of the data range (format: %Y-%m-%d).
+
+    validTo : `str`, optional
+        End of the data range (format: %Y-%m-%d).
+        Defaults to `validFrom`.
+
+    max_workers : `int`, optional
+        Maximum number of clients fetched at once. Defaults to 4.
+
+    **kwargs :
+        Parameters passed to :meth:`AsyncOpenHolidays.holidays`.
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(max_workers or 4)
+
+    async def fetch(client):
+        async with semaphore:
+            return await client.holidays(validFrom, validTo, **kwargs)
+
+    results = await asyncio.gather(*[fetch(client) for client in clients])
+    return {client.subdivisionCode: result
+            for client, result in zip(clients, results)}
+
+
+def merge_holidays(holidays: list, fetched: list, windows: list = None,
+                   startDate=None) -> list:
+    """Returns the known holidays updated with freshly fetched holidays.
+
+    Parameters
+    ----------
+    holidays : `list`
+        A list containing dictionaries per known holiday.
+
+    fetched : `list`
+        A list containing dictionaries per fetched holiday.
+
+    windows : `list`, optional
+        A list of fetched `(validFrom, validTo)` date windows. Known
+        holidays overlapping any window are replaced by the fetched ones.
+
+    startDate : `str` or `datetime.date`, optional
+        Holidays ending before this date are dropped.
+    """
+    start = None if startDate is None else _to_ordinal(startDate)
+    windows = [(_to_ordinal(validFrom), _to_ordinal(validTo))
+               for validFrom, validTo in windows or []]
+
+    def keep(holiday):
+        first = _to_ordinal(holiday['startDate'])
+        last = _to_ordinal(holiday['endDate'])
+        if start is not None and last < start:
+            return False
+        return not any(first <= validTo and last >= validFrom
+                       for validFrom, validTo in windows)
+
+    return _merge_holidays([
+        [holiday for holiday in holidays if keep(holiday)],
+        [holiday for holiday in fetched
+         if start is None or _to_ordinal(holiday['endDate']) >= start],
+    ])
+
+
+def _merge_holidays(results: list) -> list:
+    """Internal function to merge lists of holidays, dropping duplicates.
+    A result that is not a list (e.g., an error response) is returned as is.
+    """
+    merged, seen = [], set()
+    for result in results:
+        if not isinstance(result, list):
+            return result
+        for holiday in result:
+            key = holiday.get('id') or json.dumps(holiday, sort_keys=True,
+                                                  default=str)
+            if key not in seen:
+                seen.add(key)
+                merged.append(holiday)
+    return merged
+
+
+# Deadline and timeout of the call in progress, per thread
+_call = local()
+
+
+def _retry_class():
+    """Internal function returning the retry policy class that also stops
+    retrying when a retry cannot complete before the deadline of the call.
+    """
+    from urllib3.util.retry import Retry
+
+    class DeadlineRetry(Retry):
+
+        def is_exhausted(self) -> bool:
+            deadline = getattr(_call, 'deadline', None)
+            if deadline is not None and monotonic() + self.get_backoff_time() \
+                    + (_call.timeout or 0) > deadline:
+                return True
+            return super().is_exhausted()
+
+    return DeadlineRetry
+
+
+def _session(retries: int, backoff: float) -> 'requests.Session':
+    """Internal function returning a connection-pooled http session that
+    retries transient failures with exponential backoff.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    retry = _retry_class()(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+    )
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(max_retries=retry))
+    session.mount('http://', HTTPAdapter(max_retries=retry))
+    return session
+
+
 def _parse_holiday_dates(holidays: list):
     """Parse the holidays list and inplace convert dates to `datetime.date`.
     """
@@ -479,6 +927,132 @@ def _parse_holiday_dates(holidays: list):
             holidays[i]['endDate'] = to_date(holidays[i]['endDate'])
 
 
+class HolidayIndex(object):
+    """Index of merged and sorted holiday date intervals.
+
+    Holidays are normalised into non-overlapping intervals of date ordinals,
+    such that a lookup is a binary search and range queries only visit the
+    intervals that overlap the range.
+    """
+
+    def __init__(self, holidays: list = None):
+        """Initialize the HolidayIndex object
+
+        Parameters
+        ----------
+        holidays : `list`, optional
+            A list containing dictionaries per holiday, with at least the
+            `startDate` and `endDate`.
+        """
+        intervals = sorted(
+            (_to_ordinal(holiday['startDate']),
+             _to_ordinal(holiday['endDate']))
+            for holiday in holidays or []
+        )
+
+        self.__starts = array('l')
+        self.__ends = array('l')
+        for start, end in intervals:
+            if self.__ends and start <= self.__ends[-1] + 1:
+                self.__ends[-1] = max(self.__ends[-1], end)
+            else:
+                self.__starts.append(start)
+                self.__ends.append(end)
+
+    def __len__(self):
+        """Returns the number of merged intervals.
+        """
+        return len(self.__starts)
+
+    def __iter__(self):
+        """Iterate over the merged `(startDate, endDate)` intervals.
+        """
+        for start, end in zip(self.__starts, self.__ends):
+            yield (datetime.date.fromordinal(start),
+                   datetime.date.fromordinal(end))
+
+    def __contains__(self, date) -> bool:
+        """Returns `True` if the given date is a holiday.
+        """
+        day = _to_ordinal(date)
+        i = bisect_right(self.__starts, day) - 1
+        return i >= 0 and day <= self.__ends[i]
+
+    def is_holiday(self, date) -> bool:
+        """Returns `True` if the given date is a holiday.
+
+        Parameters
+        ----------
+        date : `str` or `datetime.date`
+            Date of interest (format: %Y-%m-%d).
+
+            _Example_: 2023-12-25
+        """
+        return date in self
+
+    def holidays(self, startDate, endDate) -> list:
+        """Returns the list of holiday dates within the date range.
+
+        Parameters
+        ----------
+        startDate : `str` or `datetime.date`
+            Start of the date range, inclusive (format: %Y-%m-%d).
+
+        endDate : `str` or `datetime.date`
+            End of the date range, inclusive (format: %Y-%m-%d).
+        """
+        first, last = _to_ordinal(startDate), _to_ordinal(endDate)
+        i = max(bisect_right(self.__starts, first) - 1, 0)
+        days = []
+        while i < len(self.__starts) and self.__starts[i] <= last:
+            days.extend(
+                datetime.date.fromordinal(day) for day in range(
+                    max(self.__starts[i], first),
+                    min(self.__ends[i], last) + 1
+                )
+            )
+            i += 1
+        return days
+
+    def school_days(self, startDate, endDate, weekdays: tuple = None) -> list:
+        """Returns the list of school days within the date range.
+
+        Parameters
+        ----------
+        startDate : `str` or `datetime.date`
+            Start of the date range, inclusive (format: %Y-%m-%d).
+
+        endDate : `str` or `datetime.date`
+            End of the date range, inclusive (format: %Y-%m-%d).
+
+        weekdays : `tuple`, optional
+            Day numbers of the school week (Monday is 0).
+            Defaults to Monday until Friday.
+        """
+        weekdays = (0, 1, 2, 3, 4) if weekdays is None else weekdays
+        first, last = _to_ordinal(startDate), _to_ordinal(endDate)
+        holidays = set(day.toordinal() for day in
+                       self.holidays(startDate, endDate))
+        return [
+            datetime.date.fromordinal(day) for day in range(first, last + 1)
+            if day not in holidays and (day - 1) % 7 in weekdays
+        ]
+
+
+def _to_ordinal(date) -> int:
+    """Internal function returning the proleptic Gregorian ordinal of a date.
+    """
+    if isinstance(date, str):
+        date = to_date(date)
+    elif isinstance(date, datetime.datetime):
+        date = date.date()
+
+    if not isinstance(date, datetime.date):
+        raise TypeError('date should be a datetime.date')
+
+    return date.toordinal()
+
+
 def is_holiday(date, holidays: list):
     """Returns `True` if the given date is a holiday.
 
@@ -489,9 +1063,12 @@ def is_holiday(date, holidays: list):
 
         _Example_: 2023-12-25
 
-    holidays : `list`
-        A list containing dictionaries per holiday.
+    holidays : `list` or :class:`HolidayIndex`
+        A list containing dictionaries per holiday, or a holiday index.
     """
+    if isinstance(holidays, HolidayIndex):
+        return holidays.is_holiday(date)
+
     if isinstance(date, str):
         date = to_date(date)
     elif isinstance(date, datetime.datetime):
@@ -501,7 +1078,7 @@ def is_holiday(date, holidays: list):
         raise TypeError('date should be a datetime.date')
 
     if not isinstance(holidays, list):
-        raise TypeError('holidays should be a list')
+        raise TypeError('holidays should be a list or HolidayIndex')
 
     for holiday in holidays:
         if date >= holiday['startDate'] and date <= holiday['endDate']:
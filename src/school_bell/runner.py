@@ -0,0 +1,201 @@
+#!/usr/bin/python3
+
+# absolute imports
+from concurrent.futures import ThreadPoolExecutor
+
+# Relative imports
+from .metrics import Metrics, MetricsServer
+from .scheduler import Scheduler
+from .school_bell import SchoolBell
+from .utils import init_logger
+
+
+__all__ = ['BellRunner']
+
+
+class BellRunner(object):
+    """Drive many named school bells, e.g., one per school or zone, from a
+    single scheduler loop and worker pool in one process. The bells share
+    one metrics endpoint, labelled by bell, and one holiday source per
+    subdivision.
+    """
+
+    def __init__(self, bells: dict, workers: int = None, **defaults):
+        """Initialize the BellRunner object
+
+        Parameters
+        ----------
+        bells : `dict`
+            The configuration of each bell by name.
+
+        workers : `int`, optional
+            Size of the shared worker pool of the ring targets. Defaults to
+            one worker per ring target. The ring callbacks are dispatched on
+            a separate pool, such that a ring never holds a worker its
+            targets wait for.
+
+        **defaults :
+            Configuration shared by all bells. Keys set per bell take
+            precedence, except the metrics port of the runner.
+        """
+        self.__defaults = defaults
+        self.__prog = defaults.get('prog') or 'school-bell'
+        self.__logger = init_logger(self.__prog, defaults.get('debug'),
+                                    defaults.get('log'))
+        workers = workers or sum(
+            len({**defaults, **config}.get('trigger') or ()) + 1
+            for config in bells.values()
+        )
+        self.log.info(f"bells = {', '.join(bells)}")
+        self.log.info(f"workers = {workers}")
+        self.__pool = ThreadPoolExecutor(max_workers=workers,
+                                         thread_name_prefix='bell')
+        self.__dispatcher = ThreadPoolExecutor(max_workers=32,
+                                               thread_name_prefix='dispatch')
+        self.__scheduler = Scheduler(executor=self.__dispatcher)
+        self.__metrics = Metrics(logger=self.log)
+        self.__metrics_port = defaults.get('metrics') or None
+        self.__metrics_server = None
+        self.__holiday_sources = dict()
+        self.__bells = dict()
+        for name, config in bells.items():
+            self.add(name, config)
+
+    @property
+    def log(self):
+        """Get the logger object.
+        """
+        return self.__logger
+
+    @property
+    def scheduler(self) -> Scheduler:
+        """Get the shared event-driven scheduler.
+        """
+        return self.__scheduler
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        """Get the shared worker pool of the ring targets.
+        """
+        return self.__pool
+
+    @property
+    def dispatcher(self) -> ThreadPoolExecutor:
+        """Get the pool dispatching the ring callbacks of the scheduler.
+        """
+        return self.__dispatcher
+
+    @property
+    def metrics(self) -> Metrics:
+        """Get the shared metrics registry.
+        """
+        return self.__metrics
+
+    @property
+    def holiday_sources(self) -> dict:
+        """Get the shared holiday sources by subdivision code.
+        """
+        return self.__holiday_sources
+
+    @property
+    def bells(self) -> dict:
+        """Get the school bells by name.
+        """
+        return self.__bells
+
+    def add(self, name: str, config: dict) -> SchoolBell:
+        """Add a school bell given its name and configuration.
+        """
+        if name in self.__bells:
+            raise KeyError(f"bell \"{name}\" already exists!")
+        config = self._config(config)
+        config['prog'] = f"{self.__prog}[{name}]"
+        bell = SchoolBell(name=name, scheduler=self.scheduler,
+                          pool=self.pool, registry=self.metrics,
+                          holiday_sources=self.holiday_sources, **config)
+        self.__bells[name] = bell
+        return bell
+
+    def remove(self, name: str):
+        """Remove and close a school bell given its name.
+        """
+        self.__bells.pop(name).close()
+
+    def reload(self, config: dict) -> dict:
+        """Reload the configuration of all bells, adding and removing bells
+        by name. Returns the changed configuration keys per bell.
+        """
+        bells = config.get('bells') or dict()
+        defaults = {key: value for key, value in config.items()
+                    if key not in ('bells', 'workers')}
+        if defaults.get('log') != self.__defaults.get('log'):
+            self.__logger = init_logger(self.__prog,
+                                        self.__defaults.get('debug'),
+                                        defaults.get('log'))
+        self.__defaults = {**self.__defaults, **defaults}
+        if (self.__defaults.get('metrics') or None) != self.__metrics_port:
+            self.log.warning("metrics changed, restart to apply")
+        changed = dict()
+        for name in set(self.bells) - set(bells):
+            self.log.info(f"remove bell {name}")
+            self.remove(name)
+            changed[name] = ['removed']
+        for name, bell in bells.items():
+            if name in self.bells:
+                changed[name] = self.bells[name].reload(self._config(bell))
+            else:
+                self.log.info(f"add bell {name}")
+                self.add(name, bell)
+                changed[name] = ['added']
+        return changed
+
+    def _config(self, config: dict) -> dict:
+        """Internal function returning the configuration of a bell merged
+        with the defaults. The metrics endpoint is served by the runner.
+        """
+        config = {**self.__defaults, **config}
+        if config.pop('metrics', None) not in (None, self.__metrics_port):
+            self.log.warning("metrics port per bell is ignored, the runner "
+                             "serves all bells on one endpoint")
+        return config
+
+    def start_metrics(self):
+        """Start the shared metrics endpoint, if enabled.
+        """
+        if self.__metrics_port is None or self.__metrics_server:
+            return
+        self.__metrics_server = MetricsServer(self.metrics,
+                                              self.__metrics_port)
+        self.__metrics_server.start()
+        self.log.info("metrics endpoint at http://{}:{}/metrics".format(
+            *self.__metrics_server.address
+        ))
+
+    def simulate(self, **kwargs) -> list:
+        """Simulate the schedules of all bells. Returns a list of
+        `(name, SimulatedRing)` tuples in time order.
+        """
+        rings = [(name, ring) for name, bell in self.bells.items()
+                 for ring in bell.simulate(**kwargs)]
+        return sorted(rings, key=lambda ring: ring[1].when)
+
+    def close(self):
+        """Close all bells, the metrics endpoint and the shared pools.
+        """
+        for bell in self.bells.values():
+            bell.close()
+        if self.__metrics_server is not None:
+            self.__metrics_server.stop()
+            self.__metrics_server = None
+        self.__dispatcher.shutdown(wait=False)
+        self.__pool.shutdown(wait=False)
+
+    def run_schedule(self):
+        """Run the shared scheduler loop of all bells until stopped.
+        """
+        self.log.info('Start schedule.')
+        self.start_metrics()
+        try:
+            self.scheduler.run()
+        finally:
+            self.close()
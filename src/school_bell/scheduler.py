@@ -0,0 +1,295 @@
+#!/usr/bin/python3
+
+# absolute imports
+import datetime
+import schedule
+import socket
+from collections import deque
+from concurrent.futures import Future
+from select import select
+from time import sleep
+
+# Relative imports
+from .timeline import Timeline
+
+
+__all__ = ['Scheduler', 'VirtualClock']
+
+
+class VirtualClock(object):
+    """Virtual wall clock, to be injected in a :class:`Scheduler`, that only
+    moves when set.
+    """
+
+    def __init__(self, start: datetime.datetime = None):
+        """Initialize the VirtualClock object
+
+        Parameters
+        ----------
+        start : :class:`datetime.datetime`, optional
+            The initial time. Defaults to now.
+        """
+        self.__now = start or datetime.datetime.now()
+
+    def __call__(self) -> datetime.datetime:
+        """Returns the virtual time.
+        """
+        return self.__now
+
+    def set(self, value: datetime.datetime):
+        """Move the virtual time to `value`.
+        """
+        self.__now = value
+
+
+class Scheduler(object):
+    """Event-driven scheduler.
+
+    Sleeps until the next ring of the compiled :class:`Timeline` or the next
+    housekeeping job is due instead of polling, and wakes up early only on
+    :meth:`wakeup` (e.g., a configuration or control event).
+
+    Several named timelines, e.g., one per school bell, can be driven from a
+    single loop.
+    """
+
+    def __init__(self, jobs: schedule.Scheduler = None,
+                 max_sleep: float = None, grace: float = None,
+                 clock=None, executor=None):
+        """Initialize the Scheduler object
+
+        Parameters
+        ----------
+        jobs : :class:`schedule.Scheduler`, optional
+            The job scheduler to drive.
+            Defaults to a new job scheduler owned by this scheduler.
+
+        max_sleep : `float`, optional
+            Maximum time to sleep, in seconds, before the next due job is
+            re-evaluated against the wall clock. Protects against clock
+            steps (e.g., an NTP sync on a Raspberry Pi without RTC).
+            Defaults to 60 seconds.
+
+        grace : `float`, optional
+            Maximum delay, in seconds, of a missed ring to still be dispatched.
+            Older rings are skipped. Defaults to 60 seconds.
+
+        clock : `callable`, optional
+            Returns the current wall time as :class:`datetime.datetime`,
+            e.g., a :class:`VirtualClock`. Defaults to
+            :meth:`datetime.datetime.now`.
+
+        executor : :class:`concurrent.futures.Executor`, optional
+            Executor to run the ring callbacks on, such that rings of
+            different timelines do not wait on each other. Defaults to
+            calling the callbacks in the scheduler loop.
+        """
+        self.__jobs = schedule.Scheduler() if jobs is None else jobs
+        self.__wakeup_r, self.__wakeup_w = socket.socketpair()
+        self.__wakeup_r.setblocking(False)
+        self.__wakeup_w.setblocking(False)
+        self.__running = False
+        self.__stop = False
+        self.__timelines = dict()
+        self.__lag = None
+        self.__clock = clock or datetime.datetime.now
+        self.__executor = executor
+        self.__calls = deque()
+        self.max_sleep = max_sleep or 60.
+        self.grace = grace or 60.
+
+    @property
+    def jobs(self) -> schedule.Scheduler:
+        """Get the job scheduler.
+        """
+        return self.__jobs
+
+    @property
+    def clock(self):
+        """Get the wall clock.
+        """
+        return self.__clock
+
+    @property
+    def timeline(self) -> Timeline:
+        """Get the unnamed ring timeline.
+        """
+        return self.timelines.get(None, Timeline())
+
+    @property
+    def timelines(self) -> dict:
+        """Get the ring timelines by name.
+        """
+        return {name: entry['timeline']
+                for name, entry in self.__timelines.items()}
+
+    @property
+    def next_ring(self) -> tuple:
+        """Get the `(datetime, key)` tuple of the next ring of all timelines,
+        or `None`.
+        """
+        rings = [entry['next_ring'] for entry in self.__timelines.values()
+                 if entry['next_ring'] is not None]
+        return min(rings, key=lambda ring: ring[0]) if rings else None
+
+    def set_timeline(self, timeline: Timeline, callback, name: str = None):
+        """Set the ring timeline and the callback, called with the key and
+        the scheduled epoch time as keyword `scheduled`, to dispatch a ring.
+        An existing timeline with the same `name` is replaced.
+        """
+        self.__timelines[name] = dict(
+            timeline=timeline,
+            callback=callback,
+            next_ring=timeline.next_ring(self.clock()),
+        )
+        self.wakeup()
+
+    def remove_timeline(self, name: str = None):
+        """Remove the ring timeline given the name, if any.
+        """
+        self.__timelines.pop(name, None)
+        self.wakeup()
+
+    @property
+    def lag(self) -> float:
+        """Get the lag, in seconds, of the last dispatched ring against its
+        scheduled time, or `None`.
+        """
+        return self.__lag
+
+    @property
+    def running(self) -> bool:
+        """Returns `True` if the scheduler loop is running.
+        """
+        return self.__running
+
+    def idle_seconds(self) -> float:
+        """Returns the number of seconds until the next due ring or job, or
+        `None` if nothing is scheduled.
+        """
+        idle = self.jobs.idle_seconds
+        next_ring = self.next_ring
+        if next_ring is not None:
+            ring = (next_ring[0] - self.clock()).total_seconds()
+            idle = ring if idle is None else min(idle, ring)
+        return idle
+
+    def sleep_time(self) -> float:
+        """Returns the number of seconds to sleep until the next wake up.
+        """
+        idle = self.idle_seconds()
+        if idle is None:
+            return self.max_sleep
+        return min(max(idle, 0.), self.max_sleep)
+
+    def wakeup(self):
+        """Wake up the scheduler loop to re-evaluate the pending jobs.
+        Takes no locks, such that it is safe to use in a signal handler.
+        """
+        try:
+            self.__wakeup_w.send(b'\0')
+        except BlockingIOError:
+            pass  # a wake up is pending already
+
+    def _clear_wakeup(self):
+        """Internal function to clear the pending wake ups.
+        """
+        try:
+            while self.__wakeup_r.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def stop(self):
+        """Stop the scheduler loop.
+        """
+        self.__stop = True
+        self.wakeup()
+
+    def call(self, func, *args, **kwargs) -> Future:
+        """Call a function in the scheduler loop, e.g., to change the
+        schedule from another thread, or immediately if the loop is not
+        running. Returns a :class:`concurrent.futures.Future` of the result.
+        """
+        future = Future()
+        self.__calls.append((future, func, args, kwargs))
+        if self.running:
+            self.wakeup()
+        else:
+            self._run_calls()
+        return future
+
+    def call_soon(self, func, *args, **kwargs) -> Future:
+        """Queue a function to be called in the next pass of the scheduler
+        loop, also if the loop is not running yet. Unlike :meth:`call`, the
+        function is never called immediately, such that it is safe to use in
+        a signal handler. Returns a :class:`concurrent.futures.Future` of the
+        result.
+        """
+        future = Future()
+        self.__calls.append((future, func, args, kwargs))
+        self.wakeup()
+        return future
+
+    def _run_calls(self):
+        """Internal function to run the pending calls.
+        """
+        while self.__calls:
+            future, func, args, kwargs = self.__calls.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as err:
+                future.set_exception(err)
+
+    def _dispatch(self, callback, *args, **kwargs):
+        """Internal function to call a ring callback, on the executor if set.
+        """
+        if self.__executor is None:
+            return callback(*args, **kwargs)
+        return self.__executor.submit(callback, *args, **kwargs)
+
+    def run_pending(self):
+        """Run the pending calls, and dispatch all rings and run all jobs
+        that are due.
+        """
+        self._run_calls()
+        now = self.clock()
+        due = []
+        for entry in list(self.__timelines.values()):
+            while entry['next_ring'] is not None and \
+                    entry['next_ring'][0] <= now:
+                when, key = entry['next_ring']
+                entry['next_ring'] = entry['timeline'].next_ring(when)
+                due.append((when, key, entry['callback']))
+        for when, key, callback in sorted(due, key=lambda ring: ring[0]):
+            lag = (self.clock() - when).total_seconds()
+            if lag <= self.grace:
+                self.__lag = lag
+                self._dispatch(callback, key, scheduled=when.timestamp())
+        self.jobs.run_pending()
+
+    def run_all(self, delay_seconds: float = 0):
+        """Dispatch every ring of all timelines and run all jobs once,
+        regardless of their schedule.
+        """
+        for entry in list(self.__timelines.values()):
+            for offset, key in entry['timeline']:
+                entry['callback'](key)
+                sleep(delay_seconds)
+        self.jobs.run_all(delay_seconds=delay_seconds)
+
+    def run(self):
+        """Run the scheduler loop until :meth:`stop` is called.
+        """
+        self.__running = True
+        while not self.__stop:
+            self._clear_wakeup()
+            self.run_pending()
+            if self.__stop:
+                break
+            select([self.__wakeup_r], [], [], self.sleep_time())
+        self.__running = False
+        self.__stop = False
+        self._run_calls()
@@ -2,27 +2,35 @@
 
 # absolute imports
 import calendar
+import copy
 import datetime
 import os
 import re
-import requests
 import schedule
+import shlex
 import sys
-from gpiozero import Buzzer
-from logging import Logger
-from threading import Thread
-from time import sleep
+from logging import DEBUG, Logger
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from time import sleep, time
 
 # Relative imports
-from .openholidays import OpenHolidays, is_holiday
-from .utils import init_logger, is_raspberry_pi, system_call
+from .audio import Player, WavInfo, create_sink, wav_info
+from .cache import HolidayCache
+from .holidays import HolidaySource
+from .metrics import Metrics, MetricsServer, RingRecord, RingStats
+from .openholidays import HolidayIndex
+from .scheduler import Scheduler, VirtualClock
+from .timeline import Timeline
+from .utils import (init_logger, is_raspberry_pi, log_handlers, private_dir,
+                    system_call, system_output)
 try:
     from .version import version
 except (ValueError, ModuleNotFoundError, SyntaxError):
     version = "VERSION-NOT-FOUND"
 
 
-__all__ = ['SchoolBell']
+__all__ = ['SchoolBell', 'SimulatedRing', 'TargetResult']
 
 
 # Check platform and set wav player
@@ -36,6 +44,18 @@ else:
     __alsa = True
     __play = ["/usr/bin/aplay"]
     __play_test = __play + ['-d', '1']
+__ssh = ["/usr/bin/ssh"]
+
+
+TargetResult = namedtuple('TargetResult', ['success', 'start', 'end'])
+TargetResult.__doc__ = """Playback result of a ring target with its epoch start
+and end time. The start time is `None` if unknown."""
+
+
+SimulatedRing = namedtuple('SimulatedRing', ['when', 'key', 'holiday'])
+SimulatedRing.__doc__ = """Ring of a simulated schedule with its datetime, the
+wav key and whether it is skipped for a holiday (`None` if the date is outside
+the holidays window)."""
 
 
 class SchoolBell(object):
@@ -49,40 +69,88 @@ class SchoolBell(object):
         root: str = None,
         test: bool = None,
         device: str = None,
+        backend: str = None,
         buzz_gpio: int = None,
         timeout: int = None,
         holidays: str = None,
+        cache: str = None,
         trigger: dict = None,
+        degraded: bool = None,
+        deadline: float = None,
+        sync: float = None,
+        workers: int = None,
+        metrics: int = None,
+        name: str = None,
+        scheduler: Scheduler = None,
+        pool: ThreadPoolExecutor = None,
+        registry: Metrics = None,
+        holiday_sources: dict = None,
+        log: list = None,
         debug: bool = None,
         prog: str = None,
         info: str = None,
     ):
         """Initialize the SchoolBell object
+
+        A bell owns its scheduler and worker pool, unless a shared
+        `scheduler` and `pool` are given to drive several named bells from
+        one loop (see :class:`BellRunner`). Likewise, a shared metrics
+        `registry` labels all series with the bell name and shared
+        `holiday_sources` fetch the holidays once per subdivision.
         """
 
         # Preamble
         prog = prog or 'school-bell'
         info = info or 'Python-scheduled ringing of a school bell.'
-        self.__logger = init_logger(prog, debug or False)
+        self.__logger = init_logger(prog, debug or False, log)
         self.__alsa = sys.platform != "darwin"
         self.log.info(info)
         self.log.info(f"version = {version}")
 
         # Init
-        self.__holidays_last_update = None
+        self.__config = _config(locals())
+        self.__holiday_source = None
+        self.__holiday_sources = {} if holiday_sources is None \
+            else holiday_sources
+        self.__triggers_job = None
+        self.__name = name or None
+        self.__scheduler = scheduler or Scheduler()
+        self.__ssh_control = None
+        self.__ring_skew = dict()
+        self.__last_ring = dict()
+        self.__ring_stats = RingStats()
+        self.__metrics = Metrics(logger=self.log) if registry is None \
+            else registry.child(bell=self.__name)
+        self.__shared_metrics = registry is not None
+        self.__metrics_server = None
+        self.metrics_port = metrics or None
+        self.__wav_index = dict()
+        self.__unhealthy = set()
+        self.__pool = pool
+        self.__pool_size = None
+        self.__own_pool = pool is None
 
         self.root = root or None
         self.test = test or False
         self.device = device or None
+        self.backend = backend or None
         self.buzzer = buzz_gpio or None
         self.timeout = timeout or 10
+        self.sync = sync or None
+        self.workers = workers or None
+        self.cache = cache
         self.openholidays = holidays or None
+        self.degraded = degraded or False
+        self.deadline = deadline or None
         self.trigger = trigger or dict()
         self.wav = wav or dict()
 
         # Create schedule
         self.create_schedule(schedule)
 
+        # Register counters and gauges
+        self._register_metrics()
+
     @property
     def device(self):
         """Internal property to the alsa device.
@@ -100,6 +168,36 @@ class SchoolBell(object):
             except ValueError as err:
                 self.log.error(err)
 
+    @property
+    def backend(self) -> str:
+        """Get the local audio playback backend.
+        """
+        return self.__backend
+
+    @backend.setter
+    def backend(self, value: str):
+        """Set the local audio playback backend: "aplay" (default) to spawn
+        a player per ring, or a backend with preloaded buffers: "alsa" to
+        play in-process, "pipe" to stream to a long-lived aplay worker,
+        "null" or "file:<path>".
+        """
+        self.log.info(f"backend = {value or 'aplay'}")
+        self.__backend = value or 'aplay'
+        self.__player = None
+        if self.__backend != 'aplay':
+            try:
+                self.__player = Player(create_sink(self.__backend,
+                                                   self.device))
+            except (ImportError, ValueError) as err:
+                self.log.error(err)
+                raise
+
+    @property
+    def player(self) -> Player:
+        """Get the in-process audio player, or `None`.
+        """
+        return self.__player
+
     @property
     def buzzer(self):
         """Get the buzzer object.
@@ -113,6 +211,7 @@ class SchoolBell(object):
         if isinstance(gpio_pin, int):
             if is_raspberry_pi():
                 try:
+                    from gpiozero import Buzzer
                     self.__buzzer = Buzzer(gpio_pin)
                     self.log.debug(f"  {self.__buzzer}")
                 except Exception as err:
@@ -122,6 +221,18 @@ class SchoolBell(object):
                 self.log.warning("Host is not a Raspberry Pi:"
                                  " buzzer disabled!")
 
+    @property
+    def name(self) -> str:
+        """Get the name of the bell, or `None`.
+        """
+        return self.__name
+
+    @property
+    def scheduler(self) -> Scheduler:
+        """Get the event-driven scheduler.
+        """
+        return self.__scheduler
+
     @property
     def log(self):
         """Get the logger object.
@@ -179,91 +290,190 @@ class SchoolBell(object):
         except ValueError as err:
             self.log.error(err)
 
+    @property
+    def sync(self) -> float:
+        """Get the lead time of a synchronised ring.
+        """
+        return self.__sync
+
+    @sync.setter
+    def sync(self, value: float):
+        """Set the lead time, in seconds, of a synchronised ring. All targets
+        are armed to start playing at the same instant, the lead time after
+        the dispatch. Set `None` to play as soon as possible.
+        """
+        self.log.info(f"sync = {value or False}")
+        try:
+            self.__sync = float(value) if value else None
+        except ValueError as err:
+            self.log.error(err)
+
+    @property
+    def workers(self) -> int:
+        """Get the maximum number of ring workers.
+        """
+        return self.__workers
+
+    @workers.setter
+    def workers(self, value: int):
+        """Set the maximum number of ring workers. Defaults to one per
+        target, with a maximum of 32.
+        """
+        self.log.info(f"workers = {value or 'auto'}")
+        try:
+            self.__workers = int(value) if value else None
+        except ValueError as err:
+            self.log.error(err)
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        """Get the long-lived worker pool of the ring fan-out, created on
+        first use and recreated when the targets or workers change its size.
+        """
+        targets = len(self.trigger) + 1
+        workers = self.workers or min(targets, 32)
+        if self.__own_pool and self.__pool_size != workers:
+            self._reset_pool()
+        if self.__pool is None:
+            if self.sync and workers < targets:
+                self.log.warning(f"{workers} workers for {targets} targets: "
+                                 "synchronised rings will be late!")
+            self.__pool = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix='ring'
+            )
+            self.__pool_size = workers
+        return self.__pool
+
+    def close(self):
+        """Close the ssh control connections, the audio player, the metrics
+        endpoint and the owned worker pool, and remove the timeline and jobs
+        from the scheduler.
+        """
+        self.scheduler.remove_timeline(self.name)
+        if self.__triggers_job is not None:
+            self.scheduler.jobs.cancel_job(self.__triggers_job)
+            self.__triggers_job = None
+        self._release_holidays()
+        self.close_triggers()
+        if self.player:
+            self.player.close()
+        if self.__metrics_server is not None:
+            self.__metrics_server.stop()
+            self.__metrics_server = None
+        if self.__shared_metrics:
+            self.metrics.remove()
+        self._reset_pool()
+
+    @property
+    def ring_skew(self) -> dict:
+        """Get the per target skew, in seconds, of the last synchronised
+        ring.
+        """
+        return self.__ring_skew
+
+    @property
+    def cache(self) -> HolidayCache:
+        """Get the on-disk holiday cache.
+        """
+        return self.__cache
+
+    @cache.setter
+    def cache(self, value: str):
+        """Set the on-disk holiday cache directory. Set `False` to disable.
+        """
+        self.__cache = None if value is False else HolidayCache(value)
+        self.log.info(f"cache = {getattr(self.__cache, 'path', False)}")
+
+    @property
+    def holiday_source(self) -> HolidaySource:
+        """Get the holiday source of the subdivision, or `None`.
+        """
+        return self.__holiday_source
+
     @property
     def openholidays(self):
         """Get the OpenHolidays object.
         """
-        return self.__openholidays
+        return self.__holiday_source and self.__holiday_source.client
 
     @openholidays.setter
     def openholidays(self, subdivisionCode: str):
-        """Set the OpenHolidays object by the subdivision code.
+        """Set the holiday source by the subdivision code. Bells sharing the
+        holiday sources share the source of the same subdivision.
         """
-        self.__openholidays = None
-        self.__holidays = list()
-        self.__holidays_last_update = None
-        self.__ref_date = None
+        self._release_holidays()
         self.log.info(f"holidays = {subdivisionCode or False}")
 
         if subdivisionCode is None:
             return
-        elif isinstance(subdivisionCode, str):
-            self.__openholidays = OpenHolidays(
-                countryIsoCode=subdivisionCode.split('-')[1],
-                languageIsoCode=subdivisionCode.split('-')[0],
-                subdivisionCode=subdivisionCode
-            )
-            self._request_holidays()
-            schedule.every().day.at("00:00").do(self._request_holidays)
-        else:
+        elif not isinstance(subdivisionCode, str):
             raise TypeError("holidays subdivisionCode should be of type str!")
+        source = self.__holiday_sources.get(subdivisionCode)
+        if source is None:
+            source = HolidaySource(subdivisionCode, self.cache, self.timeout,
+                                   self.log)
+            self.__holiday_sources[subdivisionCode] = source
+        source.acquire()
+        self.__holiday_source = source
+        source.start(self.scheduler)
+
+    def _release_holidays(self):
+        """Internal function to release the holiday source, closing it if no
+        other bell uses it.
+        """
+        source = self.__holiday_source
+        self.__holiday_source = None
+        if source is not None and source.release():
+            self.__holiday_sources.pop(source.subdivisionCode, None)
 
     @property
     def holidays(self) -> list:
         """Get the list with holidays.
         """
-        return self.__holidays
+        return self.__holiday_source.holidays if self.__holiday_source \
+            else list()
 
-    def _request_holidays(self, days: int = None, **kwargs) -> bool:
-        """Internal function to request school and public holidays using the
-        OpenHolidays API.
+    @property
+    def holiday_index(self) -> HolidayIndex:
+        """Get the index of merged holiday intervals.
         """
-        if not self.openholidays:
-            return
+        return self.__holiday_source.index if self.__holiday_source \
+            else HolidayIndex()
 
-        startDate = datetime.date.today()
-        endDate = startDate + datetime.timedelta(days=days or 180)
+    @property
+    def holidays_window(self) -> tuple:
+        """Get the `(startDate, endDate)` window covered by the holidays.
+        """
+        return self.__holiday_source and self.__holiday_source.window
 
-        self.log.info(f"request holidays from {startDate} until {endDate}")
-        try:
-            self.__holidays = self.openholidays.holidays(
-                str(startDate), str(endDate),
-                timeout=self.timeout,
-                **kwargs
-            )
-            self.__holidays_last_update = startDate
-            self.log.debug("holidays request completed.")
-            return True
-        except requests.exceptions.RequestException as err:
-            self.log.warning("holidays request failed. Last update on {}"
-                             .format(self.__holidays_last_update))
-            self.log.debug(err)
+    def _load_holidays(self, days: int = None) -> bool:
+        """Internal function to load school and public holidays from the
+        on-disk cache. Returns `True` on success.
+        """
+        if not self.__holiday_source:
             return False
+        return self.__holiday_source.load(days)
+
+    def _request_holidays(self, days: int = None, revalidate: int = None,
+                          **kwargs) -> bool:
+        """Internal function to request school and public holidays using the
+        OpenHolidays API.
+        """
+        if not self.__holiday_source:
+            return
+        return self.__holiday_source.request(days, revalidate, **kwargs)
 
     def is_holiday(self, date: datetime.date = None) -> bool:
         """Returns `True` if `date` is a school or public holiday.
         """
 
-        if self.openholidays is None:
+        if self.__holiday_source is None:
             return
 
         date = date or datetime.date.today()
         self.log.debug(f"verify if {date} is a holiday")
 
-        if self.__ref_date == date:
-            self.log.debug("  return holiday status from cache")
-            return self.__is_holiday
-
-        if not self.holidays:
-            self.log.debug("  no holiday list found -> request")
-            if not self._request_holidays():
-                return False
-
-        self.log.debug("  lookup holiday in cached list and store response")
-        self.__is_holiday = is_holiday(date, self.holidays)
-        self.__ref_date = date
-
-        return self.__is_holiday
+        return self.__holiday_source.is_holiday(date)
 
     @property
     def wav(self) -> dict:
@@ -282,32 +492,86 @@ class SchoolBell(object):
             return
 
         self.log.info("wav =")
-        for key, wav in value.items():
-            self.log.info(f"  {key}: {wav}")
-            self.add_wav(key, wav)
+        self._add_wavs(value)
         if not self.test:
             self.log.warning("wav audio files not not actually played "
                              "(run with option --test instead)")
 
-    def add_wav(self, key: str, value: str):
-        """Add a wav to the dictionary.
+    def _add_wavs(self, value: dict):
+        """Internal function to add the wavs. The headers are validated
+        concurrently, the samples are loaded and test played serially as
+        all samples share one audio device.
+        """
+        with ThreadPoolExecutor(max_workers=min(len(value), 8)) as executor:
+            infos = list(executor.map(self._wav_info, value.values()))
+
+        for (key, wav), info in zip(value.items(), infos):
+            self.log.info(f"  {key}: {wav}")
+            self.add_wav(key, wav, info)
+
+    def _wav_info(self, value: str) -> WavInfo:
+        """Internal function to validate and parse the header of a wav.
         """
         wav = os.path.expandvars(os.path.join(self.root, value))
         if not os.path.isfile(wav):
             err = f"File \"{wav}\" not found!"
             self.log.error(err)
             raise FileNotFoundError(err)
+        try:
+            return wav_info(wav)
+        except (OSError, ValueError) as err:
+            self.log.error(err)
+            raise
+
+    def add_wav(self, key: str, value: str, info: WavInfo = None):
+        """Add a wav to the dictionary, optionally with its parsed header.
+        """
+        wav = os.path.expandvars(os.path.join(self.root, value))
+        info = info or self._wav_info(value)
+        self.log.debug(f"    {info.nchannels} ch, {info.sampwidth * 8} bit, "
+                       f"{info.framerate} Hz, {info.duration:.1f} s, "
+                       f"sha1 {info.sha1}")
+        if self.player:
+            try:
+                self.player.load(key, wav)
+            except Exception as err:
+                self.log.error(err)
+                raise
         if self.test:
-            if not _play(wav, True, self.device, self.log):
+            if not (self.player.play(key, 1) if self.player else
+                    _play(wav, True, self.device, self.log)):
                 err = f"Could not play \"{wav}\"!"
                 self.log.error(err)
                 raise RuntimeError(err)
         try:
             self.__wav[str(key)] = str(value)
+            self.__wav_index[str(key)] = info
         except Exception as err:
             self.log.error(err)
             raise Exception(err)
 
+    @property
+    def wav_index(self) -> dict:
+        """Get the WAVE audio file header index.
+        """
+        return self.__wav_index
+
+    def get_wav_info(self, key: str) -> WavInfo:
+        """Get the WAVE audio file header given the key.
+        """
+        try:
+            return self.__wav_index[str(key)]
+        except KeyError:
+            err = f"WAVE key \"{key}\" is not related to any sample!"
+            self.log.error(err)
+            raise KeyError(err)
+
+    def ring_timeout(self, key: str) -> float:
+        """Get the maximum duration of a ring given the key: the WAVE audio
+        file duration plus the timeout.
+        """
+        return self.get_wav_info(key).duration + self.timeout
+
     def get_wav(self, key: str, root: str = None) -> str:
         """Get a local WAVE audio file given the key.
         """
@@ -344,27 +608,146 @@ class SchoolBell(object):
         return self.__trigger
 
     @trigger.setter
-    def trigger(self, value: list = None):
-        """Set the remote linux devices to trigger over ssh.
+    def trigger(self, value: dict = None):
+        """Set the remote linux devices to trigger over ssh, given a
+        dictionary or a list of host and root pairs.
         """
         if not hasattr(self, '__trigger'):
             self.__trigger = dict()
 
+        if isinstance(value, dict):
+            value = list(value.items())
+
         if not (isinstance(value, list) and len(value) != 0):
             return
 
         self.log.info("trigger =")
-
         for host, root in value:
             self.log.info(f"  remote ring {host}")
-            self.add_trigger(host, root)
+
+        results = self.probe_triggers([host for host, root in value])
+        failed = [host for host, ok in results.items() if not ok]
+        if failed and not self.degraded:
+            err = f"remote ring test for {', '.join(failed)} failed!"
+            self.log.error(err)
+            raise RuntimeError(err)
+
+        for host, root in value:
+            self.__trigger[str(host)] = str(root or '')
+        if failed:
+            self.__unhealthy.update(failed)
+            self.log.warning(f"start degraded, unhealthy: {', '.join(failed)}")
+
+        self._schedule_check_triggers()
+
+    def _schedule_check_triggers(self):
+        """Internal function to keep the trigger connections warm every five
+        minutes, once.
+        """
+        if self.__triggers_job is None:
+            self.__triggers_job = self.scheduler.jobs.every(5).minutes.do(
+                self.check_triggers
+            )
+
+    @property
+    def degraded(self) -> bool:
+        """Get the degraded start flag.
+        """
+        return self.__degraded
+
+    @degraded.setter
+    def degraded(self, value: bool):
+        """Set the degraded start flag. If `True`, hosts that fail the
+        remote ring test at startup are marked unhealthy instead of aborting.
+        """
+        self.log.info(f"degraded = {value}")
+        self.__degraded = bool(value)
+
+    @property
+    def deadline(self) -> float:
+        """Get the global deadline, in seconds, of the startup probes.
+        """
+        return self.__deadline
+
+    @deadline.setter
+    def deadline(self, value: float):
+        """Set the global deadline, in seconds, of the startup probes.
+        Defaults to twice the timeout.
+        """
+        self.__deadline = float(value or 2 * self.timeout)
+        self.log.info(f"deadline = {self.__deadline}")
+
+    @property
+    def unhealthy(self) -> set:
+        """Get the trigger hosts marked unhealthy, skipped when ringing.
+        """
+        return set(self.__unhealthy)
+
+    def probe_triggers(self, hosts: list, deadline: float = None) -> dict:
+        """Run the remote ring test of all hosts concurrently within the
+        global `deadline`, defaulting to :attr:`deadline`.
+        Returns a dictionary with `True` per host that passed.
+        """
+        if not hosts:
+            return dict()
+        deadline = deadline or self.deadline
+        executor = ThreadPoolExecutor(max_workers=min(len(hosts), 32),
+                                      thread_name_prefix='probe')
+        futures = {host: executor.submit(_timed, self._probe_trigger, host)
+                   for host in hosts}
+        wait(futures.values(), timeout=deadline)
+        executor.shutdown(wait=False)
+
+        results = dict()
+        self.log.info("trigger probes =")
+        for host, future in futures.items():
+            if not future.done():
+                self.log.warning(f"  {host}: timed out after {deadline} s")
+                results[host] = False
+                continue
+            try:
+                result = future.result()
+            except Exception as err:
+                self.log.warning(f"  {host}: {err}")
+                results[host] = False
+                continue
+            results[host] = result.success
+            self.log.info("  {}: {} in {:.1f} s".format(
+                host, 'ok' if result.success else 'failed',
+                result.end - result.start
+            ))
+        self.log.info(f"  {sum(results.values())}/{len(results)} healthy")
+        return results
+
+    def _probe_trigger(self, host: str) -> bool:
+        """Internal function to run the remote ring test of a host.
+        """
+        cmd = _ssh(host, self.timeout, self.ssh_control) + [
+            "/usr/bin/aplay", "--help"
+        ]
+        return system_call(cmd, self.log)
+
+    @property
+    def ssh_control(self) -> str:
+        """Get the ssh control socket path of the multiplexed connections,
+        created on first use.
+        """
+        if self.__ssh_control is None:
+            try:
+                self.__ssh_control = _ssh_control_path()
+            except PermissionError as err:
+                self.log.error(err)
+                raise
+        return self.__ssh_control
 
     def add_trigger(self, host: str, root: str = None):
         """Add a remote linux device to trigger over ssh.
+
+        The remote ring test opens a persistent multiplexed ssh control
+        connection to the host, such that a ring only opens a new channel.
         """
         root = root or ''
-        cmd = self._ssh(host) + ["/usr/bin/aplay", "--help"]
-        if not system_call(cmd, self.log):
+        if not self._probe_trigger(host):
             err = f"remote ring test for {host} failed!"
             self.log.error(err)
             raise RuntimeError(err)
@@ -373,6 +756,39 @@ class SchoolBell(object):
         except Exception as err:
             self.log.error(err)
             raise Exception(err)
+        self.metrics.inc('remote_failures_total', 0,
+                         help='Remote ring failures per host.', host=str(host))
+
+    def check_triggers(self) -> bool:
+        """Keep the multiplexed ssh control connections warm, reopening a
+        connection that went down. Returns `True` if all hosts are up.
+        """
+        success = True
+        for host in self.trigger:
+            if host in self.__unhealthy:
+                if self._probe_trigger(host):
+                    self.__unhealthy.discard(host)
+                    self.log.info(f"{host} is healthy again")
+                else:
+                    success = False
+                continue
+            cmd = _ssh(host, self.timeout, self.ssh_control, "check")
+            if system_call(cmd, self.log):
+                continue
+            self.log.warning(f"ssh control connection to {host} is down")
+            cmd = _ssh(host, self.timeout, self.ssh_control) + ["true"]
+            if not system_call(cmd, self.log):
+                self.__unhealthy.add(host)
+                self.log.warning(f"{host} marked unhealthy")
+                success = False
+        return success
+
+    def close_triggers(self):
+        """Close the multiplexed ssh control connections.
+        """
+        for host in self.trigger:
+            system_call(_ssh(host, self.timeout, self.ssh_control, "exit"),
+                        self.log)
 
     def play(self, key: str, test: bool = False, device: str = None) -> bool:
         """Play a WAVE audio file given the key.
@@ -381,12 +797,7 @@ class SchoolBell(object):
         wav = self.get_wav(key)
         self.log.info(f"play wav = {key}: {os.path.basename(wav)}")
 
-        success = _play(
-            wav=wav,
-            test=test,
-            device=device or self.device,
-            logger=self.log
-        )
+        success = self._play_local(key, test, device)
         if not success:
             err = f"Could not play WAVE audio file {wav}!"
             self.log.error(err)
@@ -394,6 +805,32 @@ class SchoolBell(object):
         self.log.info("Play completed successfully.")
         return True
 
+    def _play_local(self, key: str, test: bool = False,
+                    device: str = None) -> bool:
+        """Internal function to play a WAVE audio file locally, with the
+        in-process player if any. Returns `True` on success.
+        """
+        if not self.player:
+            return _play(self.get_wav(key), test, device or self.device,
+                         self.log)
+        try:
+            return self.player.play(key, 1 if test else None)
+        except Exception as err:
+            self.log.error(err)
+            return False
+
+    def _play_local_at(self, start: float, key: str) -> tuple:
+        """Internal function to play a WAVE audio file locally at the given
+        epoch time. Returns a tuple with `True` on success and the start time.
+        """
+        if not self.player:
+            return _play_at(start, self.get_wav(key), self.device, self.log)
+        try:
+            return self.player.play_at(start, key)
+        except Exception as err:
+            self.log.error(err)
+            return False, None
+
     def play_remote(self, host: str, key: str, test: bool = False,
                     timeout: int = None):
         """Play a remote WAVE audio file given the host and key.
@@ -407,7 +844,8 @@ class SchoolBell(object):
             wav=wav,
             test=test,
             timeout=timeout or self.timeout,
-            logger=self.log
+            logger=self.log,
+            control_path=self.ssh_control,
         )
 
         if not success:
@@ -417,59 +855,299 @@ class SchoolBell(object):
         self.log.info("Play remote completed successfully.")
         return True
 
-    def ring(self, key: str, **kwargs) -> bool:
-        """Ring the school bell.
+    def dispatch(self, key: str, start: float = None) -> dict:
+        """Dispatch the playback of a WAVE audio file given the key to the
+        local and all remote targets on the worker pool, optionally armed to
+        start at the epoch time `start`.
+        Returns a dictionary with a :class:`concurrent.futures.Future` of a
+        :class:`TargetResult` per target.
+        """
+        futures = dict()
+        for host, root in self.trigger.items():
+            if host in self.__unhealthy:
+                self.log.warning(f"skip unhealthy {host}")
+                continue
+            wav = self.get_wav(key, root)
+            if start is None:
+                futures[host] = self.pool.submit(
+                    _timed, _play_remote, host, wav, False, self.timeout,
+                    self.log, self.ssh_control
+                )
+            else:
+                futures[host] = self.pool.submit(
+                    _timed, _play_remote_at, start, host, wav,
+                    self.timeout + self.sync, self.log, self.ssh_control
+                )
+        if start is None:
+            futures['local'] = self.pool.submit(_timed, self._play_local, key)
+        else:
+            futures['local'] = self.pool.submit(
+                _timed, self._play_local_at, start, key
+            )
+        return futures
+
+    def ring(self, key: str, scheduled: float = None, force: bool = False,
+             **kwargs) -> bool:
+        """Ring the school bell. Set `scheduled` to the scheduled epoch time
+        to record the drift, defaults to now. Set `force` to also ring on a
+        holiday (e.g., a manual or emergency ring).
         Returns `True` on success.
         """
+        dispatched = time()
+        scheduled = scheduled or dispatched
+        self.metrics.inc('rings_attempted_total', help='Rings attempted.')
 
-        if self.is_holiday():
+        if not force and self.is_holiday():
             self.log.info("today is a holiday, no need to ring!")
+            self.metrics.inc('rings_skipped_holiday_total',
+                             help='Rings skipped for holidays.')
             return False
 
         wav = self.get_wav(key)
 
         self.log.info(f"ring {key}: {os.path.basename(wav)}")
 
-        threads = []
-        for host, root in self.trigger.items():
-            remote_wav = self.get_wav(key, root)
-            threads.append(
-                Thread(
-                    target=_play_remote,
-                    args=(host, remote_wav, False, self.timeout, self.log)
-                )
-            )
-        threads.append(
-            Thread(
-                target=_play,
-                args=(wav, False, self.device, self.log)
-            )
-        )
+        start = time() + self.sync if self.sync else None
+        if start:
+            self.log.debug(f".. armed to start at {start:.3f}")
+
+        futures = self.dispatch(key, start)
+
+        if start:
+            _sleep_until(start)
 
+        buzzer_on = buzzer_off = None
         if self.buzzer:
             self.log.debug(".. buzzer on")
             self.buzzer.on()
+            buzzer_on = time()
 
-        for t in threads:
-            t.start()
-
-        for t in threads:
-            t.join()
+        done, pending = wait(futures.values(),
+                             timeout=self.ring_timeout(key) + (self.sync or 0))
 
         if self.buzzer:
             self.log.debug(".. buzzer off")
             self.buzzer.off()
+            buzzer_off = time()
+
+        self.__last_ring = dict()
+        for name, future in futures.items():
+            if future in pending:
+                self.log.warning(f"ring target {name} is still playing!")
+                continue
+            try:
+                self.__last_ring[name] = future.result()
+            except Exception as err:
+                self.log.error(f"ring target {name} failed: {err}")
+
+        for name, result in self.__last_ring.items():
+            self.log.debug(f".. {name}: success = {result.success}, "
+                           f"duration = {result.end - result.start:.3f} s"
+                           if result.start is not None else
+                           f".. {name}: success = {result.success}")
+
+        if start:
+            self._report_skew(start)
+
+        self._record_ring(RingRecord(
+            key=str(key),
+            scheduled=scheduled,
+            dispatched=dispatched,
+            targets=self.__last_ring,
+            buzzer_on=buzzer_on,
+            buzzer_off=buzzer_off,
+        ))
+
+        for name in futures:
+            result = self.__last_ring.get(name)
+            if name != 'local' and not (result and result.success):
+                self.metrics.inc('remote_failures_total',
+                                 help='Remote ring failures per host.',
+                                 host=name)
+
+        success = len(self.__last_ring) == len(futures) and all(
+            result.success for result in self.__last_ring.values()
+        )
+        if success:
+            self.metrics.inc('rings_succeeded_total',
+                             help='Rings succeeded on all targets.')
 
         self.log.debug(".. done")
-        return True
+        return success
+
+    def _record_ring(self, record: RingRecord):
+        """Internal function to record the ring timings and log the drift.
+        """
+        self.__ring_stats.add(record)
+        self.metrics.observe(
+            'ring_dispatch_drift_seconds',
+            record.dispatched - record.scheduled,
+            help='Ring dispatch drift against the scheduled time.'
+        )
+        for name, result in record.targets.items():
+            if result.start is None:
+                continue
+            self.metrics.observe(
+                'ring_start_drift_seconds', result.start - record.scheduled,
+                help='Ring playback start drift against the scheduled time.',
+                target=name
+            )
+            self.metrics.observe(
+                'playback_duration_seconds', result.end - result.start,
+                help='Playback duration per target.', target=name
+            )
+        starts = [result.start - record.scheduled
+                  for result in record.targets.values()
+                  if result.start is not None]
+        self.log.info(
+            "ring drift = dispatch {:+.1f} ms, start {}".format(
+                (record.dispatched - record.scheduled) * 1e3,
+                f"{max(starts) * 1e3:+.1f} ms" if starts else "unknown"
+            )
+        )
+        summary = self.__ring_stats.summary()['start']
+        if summary['count']:
+            self.log.debug(
+                ".. start drift p50 {:+.1f} ms, p95 {:+.1f} ms, "
+                "max {:+.1f} ms over {} targets".format(
+                    summary['p50'] * 1e3, summary['p95'] * 1e3,
+                    summary['max'] * 1e3, summary['count']
+                )
+            )
+
+    @property
+    def metrics(self) -> Metrics:
+        """Get the metrics registry.
+        """
+        return self.__metrics
+
+    @property
+    def metrics_port(self) -> int:
+        """Get the port of the metrics endpoint.
+        """
+        return self.__metrics_port
+
+    @metrics_port.setter
+    def metrics_port(self, value: int):
+        """Set the port of the opt-in metrics endpoint, or `None` to
+        disable.
+        """
+        self.log.info(f"metrics = {value or False}")
+        self.__metrics_port = None if value is None else int(value)
+
+    def _register_metrics(self):
+        """Internal function to register the counters at zero, such that
+        their series exist before the first ring, and the gauges evaluated
+        on scrape.
+        """
+        self.metrics.inc('rings_attempted_total', 0, help='Rings attempted.')
+        self.metrics.inc('rings_skipped_holiday_total', 0,
+                         help='Rings skipped for holidays.')
+        self.metrics.inc('rings_succeeded_total', 0,
+                         help='Rings succeeded on all targets.')
+        for host in self.trigger:
+            self.metrics.inc('remote_failures_total', 0,
+                             help='Remote ring failures per host.', host=host)
+        self.metrics.set(
+            'holidays_cache_age_seconds',
+            lambda: None if self.holiday_source is None
+            or self.holiday_source.updated is None
+            else time() - self.holiday_source.updated,
+            help='Age of the holidays.'
+        )
+        self.metrics.set(
+            'scheduler_lag_seconds', lambda: self.scheduler.lag,
+            help='Lag of the last dispatched ring.'
+        )
+        self.metrics.set(
+            'trigger_unhealthy_hosts', lambda: len(self.__unhealthy),
+            help='Trigger hosts marked unhealthy.'
+        )
+        self.metrics.count(
+            'player_restarts_total', lambda: getattr(
+                self.player and self.player.sink, 'restarts', None
+            ),
+            help='Restarts of the audio player workers.'
+        )
+
+    def start_metrics(self):
+        """Start the metrics endpoint, if enabled.
+        """
+        if self.metrics_port is None or self.__metrics_server:
+            return
+        self.__metrics_server = MetricsServer(self.metrics, self.metrics_port)
+        self.__metrics_server.start()
+        self.log.info("metrics endpoint at http://{}:{}/metrics".format(
+            *self.__metrics_server.address
+        ))
+
+    @property
+    def ring_stats(self) -> RingStats:
+        """Get the in-memory ring timings with drift percentile summaries.
+        """
+        return self.__ring_stats
+
+    def _report_skew(self, start: float):
+        """Internal function to report the per target skew of a synchronised
+        ring.
+        """
+        self.__ring_skew = {
+            name: None if result.start is None else result.start - start
+            for name, result in self.__last_ring.items()
+        }
+        self.log.info("ring skew = " + ", ".join(
+            f"{name}: {skew * 1e3:+.1f} ms" if skew is not None
+            else f"{name}: unknown"
+            for name, skew in self.__ring_skew.items()
+        ))
+        skews = [skew for skew in self.__ring_skew.values()
+                 if skew is not None]
+        if len(skews) > 1:
+            self.log.info(
+                f"ring skew spread = {(max(skews) - min(skews)) * 1e3:.1f} ms"
+            )
+
+    @property
+    def last_ring(self) -> dict:
+        """Get the :class:`TargetResult` per target of the last ring.
+        """
+        return self.__last_ring
+
+    @property
+    def timeline(self) -> Timeline:
+        """Get the compiled weekly ring timeline.
+        """
+        return self.scheduler.timelines.get(self.name, Timeline())
+
+    def next_ring(self, after: datetime.datetime = None) -> tuple:
+        """Returns a `(datetime, key)` tuple of the next ring after `after`.
+        """
+        return self.timeline.next_ring(after)
+
+    def next_rings(self, count: int = None,
+                   after: datetime.datetime = None) -> list:
+        """Returns a list with the `(datetime, key)` tuples of the next
+        `count` rings after `after`, defaults to 5 rings from now.
+        """
+        rings = []
+        after = after or datetime.datetime.now()
+        for i in range(count or 5):
+            ring = self.timeline.next_ring(after)
+            if ring is None:
+                break
+            rings.append(ring)
+            after = ring[0]
+        return rings
 
     def create_schedule(self, value: dict = None, **kwargs):
-        """Create a schedule
+        """Create a schedule. An empty schedule clears the timeline.
         """
         if not (isinstance(value, dict) and len(value) != 0):
+            self.scheduler.remove_timeline(self.name)
             return
 
         self.log.info("schedule =")
+        entries = []
         for day, times in value.items():
             day = day.capitalize()
 
@@ -477,14 +1155,13 @@ class SchoolBell(object):
                 continue
 
             day_num = list(calendar.day_abbr).index(day)
-            day_name = calendar.day_name[day_num].lower()
 
-            for time, key in times.items():
+            for at, key in times.items():
 
-                if not _validate_time(time, **kwargs):
+                if not _validate_time(at, **kwargs):
                     continue
 
-                self.log.info(f"  ring every {day} at {time} with \"{key}\"")
+                self.log.info(f"  ring every {day} at {at} with \"{key}\"")
 
                 wav = self.get_wav(key)
 
@@ -493,45 +1170,425 @@ class SchoolBell(object):
                     self.log.error(err)
                     raise FileNotFoundError(err)
 
-                eval(
-                    "schedule.every().{}.at(\"{}\").do(self.ring, key)"
-                    .format(day_name, time)
+                entries.append((day_num, at, key))
+
+        timeline = Timeline(entries)
+        durations = {key: self.get_wav_info(key).duration
+                     for key in timeline.keys}
+        for offset, key, next_offset in timeline.overlaps(durations):
+            self.log.warning(
+                f"ring \"{key}\" on {_format_offset(offset)} still plays "
+                f"at the next ring on {_format_offset(next_offset)}!"
+            )
+
+        self.scheduler.set_timeline(timeline, self.ring, self.name)
+
+    def simulate(self, start: datetime.datetime = None,
+                 end: datetime.datetime = None, days: int = None) -> list:
+        """Replay the schedule on a virtual clock without sleeping or
+        playing and return all rings as a list of :class:`SimulatedRing`.
+        Holidays outside the known window are requested for the simulated
+        range.
+
+        Parameters
+        ----------
+        start : :class:`datetime.datetime`, optional
+            Start of the simulation. Defaults to now.
+
+        end : :class:`datetime.datetime`, optional
+            End of the simulation. Defaults to `start` plus `days`.
+
+        days : `int`, optional
+            Number of days to simulate if `end` is not set. Defaults to 7.
+        """
+        start = start or datetime.datetime.now()
+        end = end or start + datetime.timedelta(days=days or 7)
+
+        rings = []
+        holidays = dict()
+        index, window = HolidayIndex(), None
+        if self.holiday_source:
+            index, window = self.holiday_source.between(start.date(),
+                                                        end.date())
+        if self.openholidays and window is None:
+            self.log.warning("simulation without holidays, holidays are "
+                             "unknown")
+        elif self.openholidays and (
+            start.date() < window[0] or end.date() > window[1]
+        ):
+            self.log.warning("simulation exceeds the holidays window, "
+                             "holidays are unknown outside {} - {}".format(
+                                 *window))
+
+        def callback(key, scheduled=None):
+            when = clock()
+            date = when.date()
+            if date not in holidays:
+                if not self.openholidays:
+                    holidays[date] = False
+                elif window and window[0] <= date <= window[1]:
+                    holidays[date] = index.is_holiday(date)
+                else:
+                    holidays[date] = None
+            rings.append(SimulatedRing(when, key, holidays[date]))
+
+        clock = VirtualClock(start)
+        scheduler = Scheduler(schedule.Scheduler(), clock=clock)
+        scheduler.set_timeline(self.timeline, callback)
+        while scheduler.next_ring and scheduler.next_ring[0] <= end:
+            clock.set(scheduler.next_ring[0])
+            scheduler.run_pending()
+
+        return rings
+
+    @property
+    def config(self) -> dict:
+        """Get the applied configuration.
+        """
+        return self.__config
+
+    def reload(self, config: dict) -> list:
+        """Reload the configuration, applying only the changes to the
+        schedule, wavs, trigger hosts, holiday subdivision, log handlers and
+        the runtime settings. Unchanged samples, caches and connections are
+        kept.
+
+        The configuration is validated first and the previous settings,
+        wavs, schedule, holiday subdivision, trigger hosts and log handlers
+        are restored if applying them fails, such that a failed reload leaves
+        the running configuration untouched. Removed trigger hosts that are
+        restored reconnect on their next ring.
+        Returns the list of changed configuration keys.
+        """
+        old, new = self.__config, _config(config)
+        changed = [key for key in new if new[key] != old[key]]
+        self.log.info(f"reload = {', '.join(changed) or 'no changes'}")
+        if not changed:
+            return changed
+
+        self._validate_reload(new, changed)
+
+        for key in ('test', 'device', 'backend', 'buzz_gpio', 'metrics',
+                    'cache'):
+            if key in changed:
+                self.log.warning(f"reload of \"{key}\" requires a restart")
+                new[key] = old[key]
+
+        state = self._reload_state()
+        try:
+            for key in ('timeout', 'sync', 'degraded', 'deadline',
+                        'workers'):
+                if key in changed:
+                    setattr(self, key, new[key])
+
+            if 'root' in changed:
+                self.root = new['root']
+
+            if 'root' in changed or 'wav' in changed:
+                self._reload_wav(new['wav'], 'root' in changed)
+
+            if {'root', 'wav', 'schedule'} & set(changed):
+                self.create_schedule(new['schedule'])
+
+            if 'holidays' in changed:
+                self.openholidays = new['holidays']
+
+            if 'trigger' in changed:
+                self._reload_trigger(new['trigger'])
+
+            if 'log' in changed:
+                self.__logger = init_logger(
+                    self.log.name, self.log.level == DEBUG, new['log']
                 )
+                self.log.info(f"log = {', '.join(log_handlers(new['log']))}")
+        except Exception as err:
+            self._restore_state(state)
+            self.log.error(f"reload failed, configuration restored: {err}")
+            raise
+
+        self.__config = new
+        return changed
+
+    def _validate_reload(self, new: dict, changed: list):
+        """Internal function to validate a configuration before it is
+        applied.
+        """
+        keys = {str(key) for times in new['schedule'].values()
+                for key in times.values()}
+        missing = keys - {str(key) for key in new['wav']}
+        if missing:
+            err = f"WAVE keys {sorted(missing)} are not related to any sample!"
+            self.log.error(err)
+            raise KeyError(err)
+
+        if 'root' in changed and \
+                not os.path.isdir(os.path.expandvars(new['root'] or '')):
+            err = f"Root directory \"{new['root']}\" does not exist!"
+            self.log.error(err)
+            raise FileNotFoundError(err)
+
+        if not isinstance(new['holidays'], (str, type(None))):
+            err = "holidays subdivisionCode should be of type str!"
+            self.log.error(err)
+            raise TypeError(err)
+
+        try:
+            log_handlers(new['log'])
+        except (TypeError, ValueError) as err:
+            self.log.error(err)
+            raise
+
+    def _reload_state(self) -> dict:
+        """Internal function returning the state restored on a failed
+        reload.
+        """
+        return dict(
+            settings={key: getattr(self, key) for key in
+                      ('timeout', 'sync', 'degraded', 'deadline', 'workers')},
+            root=self.__root,
+            wav=dict(self.__wav),
+            wav_index=dict(self.__wav_index),
+            samples=dict(self.player.samples) if self.player else None,
+            timeline=self.scheduler.timelines.get(self.name),
+            holidays=self.__config['holidays'],
+            trigger=dict(self.__trigger),
+            unhealthy=set(self.__unhealthy),
+            log=self.__config['log'],
+        )
+
+    def _restore_state(self, state: dict):
+        """Internal function to restore the state of a failed reload.
+        """
+        for key, value in state['settings'].items():
+            setattr(self, key, value)
+        self.__root = state['root']
+        self.__wav = state['wav']
+        self.__wav_index = state['wav_index']
+        if self.player:
+            self.player.samples.clear()
+            self.player.samples.update(state['samples'])
+        if state['timeline'] is None:
+            self.scheduler.remove_timeline(self.name)
+        else:
+            self.scheduler.set_timeline(state['timeline'], self.ring,
+                                        self.name)
+        source = self.__holiday_source
+        if (source and source.subdivisionCode) != state['holidays']:
+            self.openholidays = state['holidays']
+        self.__trigger.clear()
+        self.__trigger.update(state['trigger'])
+        self.__unhealthy.clear()
+        self.__unhealthy.update(state['unhealthy'])
+        self.__logger = init_logger(self.log.name, self.log.level == DEBUG,
+                                    state['log'])
+
+    def _reload_wav(self, value: dict, reload_all: bool = False):
+        """Internal function to reload the wavs, loading only the added or
+        changed samples unless `reload_all`.
+        """
+        value = {str(key): str(wav) for key, wav in value.items()}
+        current = dict(self.wav)
+        for key in set(current) - set(value):
+            self.log.info(f"  remove wav {key}")
+            del self.__wav[key]
+            del self.__wav_index[key]
+            if self.player:
+                self.player.samples.pop(key, None)
+
+        changed = {key: wav for key, wav in value.items()
+                   if reload_all or current.get(key) != wav}
+        if changed:
+            self._add_wavs(changed)
+
+    def _reload_trigger(self, value: dict):
+        """Internal function to reload the trigger hosts, probing only the
+        added hosts. Added hosts that fail are marked unhealthy.
+        """
+        value = {str(host): str(root or '') for host, root in value.items()}
+        for host in set(self.trigger) - set(value):
+            self.log.info(f"  remove remote ring {host}")
+            system_call(_ssh(host, self.timeout, self.ssh_control, "exit"),
+                        self.log)
+            del self.__trigger[host]
+            self.__unhealthy.discard(host)
+
+        added = [host for host in value if host not in self.trigger]
+        results = self.probe_triggers(added)
+        for host, root in value.items():
+            self.__trigger[host] = root
+            self.metrics.inc('remote_failures_total', 0,
+                             help='Remote ring failures per host.', host=host)
+            if host in added and not results[host]:
+                self.__unhealthy.add(host)
+                self.log.warning(f"{host} marked unhealthy")
+        if self.trigger:
+            self._schedule_check_triggers()
+
+    def _reset_pool(self):
+        """Internal function to recreate the owned worker pool on next use.
+        """
+        if self.__own_pool and self.__pool is not None:
+            self.__pool.shutdown(wait=False)
+            self.__pool = None
+            self.__pool_size = None
 
     def run_schedule(self, _test_mode: bool = False):
         """
         """
         if _test_mode:
             self.log.info('Start schedule in test mode.')
-            schedule.run_all(delay_seconds=10)
+            self.scheduler.run_all(delay_seconds=10)
             return True
         else:
             self.log.info('Start schedule.')
-            while True:
-                schedule.run_pending()
-                sleep(.2)
+            self.start_metrics()
+            try:
+                self.scheduler.run()
+            finally:
+                self.close()
+
+
+def _config(config: dict) -> dict:
+    """Internal function returning a normalized copy of the configuration
+    keys that are diffed on reload.
+    """
+    config = copy.deepcopy({key: config.get(key) for key in (
+        'schedule', 'wav', 'root', 'test', 'device', 'backend', 'buzz_gpio',
+        'timeout', 'holidays', 'cache', 'trigger', 'degraded', 'deadline',
+        'sync', 'workers', 'metrics', 'log',
+    )})
+    if isinstance(config['log'], str):
+        config['log'] = [config['log']]
+    if isinstance(config['trigger'], list):
+        config['trigger'] = dict(config['trigger'])
+    config['trigger'] = {str(host): str(root or '') for host, root in
+                         (config['trigger'] or dict()).items()}
+    for key in ('schedule', 'wav'):
+        config[key] = config[key] or dict()
+    return config
+
+
+def _ssh_control_path() -> str:
+    """Internal function returning the ssh control socket path template in a
+    private directory. Raises a `PermissionError` if the directory is not
+    private to the user.
+    """
+    return os.path.join(private_dir(os.environ.get('XDG_RUNTIME_DIR')), "%C")
 
 
-def _ssh(self, host: str, timeout: int = 10):
+def _ssh(host: str, timeout: int = 10, control_path: str = None,
+         control: str = None):
     """Internal function wrapping the ssh command.
+
+    Connections are multiplexed over a persistent control connection if
+    `control_path` is set. Set `control` to send a control command (e.g.,
+    "check" or "exit") to the control connection.
     """
-    return ["/usr/bin/ssh",
-            "-t",
-            "-o", f"ConnectTimeout={timeout}",
-            "-o", "StrictHostKeyChecking=no",
-            host]
+    cmd = __ssh + [
+        "-t",
+        "-o", f"ConnectTimeout={timeout or 10}",
+        "-o", "StrictHostKeyChecking=no",
+    ]
+    if control_path:
+        cmd += [
+            "-o", "ControlMaster=auto",
+            "-o", f"ControlPath={control_path}",
+            "-o", "ControlPersist=yes",
+        ]
+    if control:
+        cmd += ["-O", control]
+    return cmd + [host]
 
 
 def _play_remote(host: str, wav: str, test: bool = False, timeout: int = None,
-                 logger: Logger = None):
+                 logger: Logger = None, control_path: str = None):
     """Internal function to play a remove wav file over ssh. Returns `True` on
     success.
     """
-    cmd = _ssh(host, timeout) + __play_test if test else __play + [wav, "&"]
+    cmd = _ssh(host, timeout, control_path)
+    cmd += __play_test + [wav] if test else __play + [wav]
 
     return system_call(cmd, logger)
 
 
+def _format_offset(offset: int) -> str:
+    """Internal function to format a second-of-week offset.
+    """
+    return "{} {}".format(
+        calendar.day_abbr[offset // 86400],
+        datetime.timedelta(seconds=offset % 86400)
+    )
+
+
+def _timed(func, *args) -> TargetResult:
+    """Internal function to call a playback function and time it.
+    """
+    begin = time()
+    result = func(*args)
+    end = time()
+    if isinstance(result, tuple):
+        success, started = result
+    else:
+        success, started = result, begin
+    return TargetResult(bool(success), started, end)
+
+
+def _sleep_until(start: float):
+    """Internal function to sleep until the given epoch time.
+    """
+    delay = start - time()
+    if delay > 0:
+        sleep(delay)
+
+
+# Remote python snippet that waits until the epoch time in the first argument,
+# reports its actual start time and replaces itself with the player.
+_play_at_script = (
+    "import os,sys,time;"
+    "time.sleep(max(0.,float(sys.argv[1])-time.time()));"
+    "print(repr(time.time()),flush=True);"
+    "os.execv(sys.argv[2],sys.argv[2:])"
+)
+
+
+def _play_remote_at(start: float, host: str, wav: str, timeout: int = None,
+                    logger: Logger = None, control_path: str = None):
+    """Internal function to play a remote wav file over ssh at the given epoch
+    time. Returns a tuple with `True` on success and the remote start time.
+    """
+    cmd = _ssh(host, timeout, control_path) + [
+        "python3", "-c", shlex.quote(_play_at_script), repr(start)
+    ] + __play + [wav]
+
+    success, output = system_output(cmd, logger)
+
+    return success, _started(output)
+
+
+def _play_at(start: float, wav: str, device: str = None,
+             logger: Logger = None):
+    """Internal function to play a wav file at the given epoch time. Returns
+    a tuple with `True` on success and the start time reported by the player
+    process, as for a remote target.
+    """
+    cmd = __play + ['-D', device, wav] if __alsa and device else __play + [wav]
+    cmd = [sys.executable, "-c", _play_at_script, repr(start)] + cmd
+
+    success, output = system_output(cmd, logger)
+
+    return success, _started(output)
+
+
+def _started(output: str) -> float:
+    """Internal function returning the start time printed first by the
+    player process, or `None`.
+    """
+    try:
+        return float(output.split()[0])
+    except (IndexError, ValueError):
+        return None
+
+
 def _play(wav: str, test: bool = False, device: str = None,
           logger: Logger = None):
     """Internal function to play a wav file. Returns `True` on success.
@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+
+# absolute imports
+import datetime
+from array import array
+from bisect import bisect_right
+
+
+__all__ = ['Timeline', 'week_offset']
+
+
+class Timeline(object):
+    """Compiled weekly ring timeline.
+
+    The schedule is compiled once into a sorted array of second-of-week
+    offsets with a parallel array of key indexes. The next ring is found
+    by binary search, so the lookup cost does not grow with the schedule.
+    """
+
+    def __init__(self, entries: list = None):
+        """Initialize the Timeline object
+
+        Parameters
+        ----------
+        entries : `list`, optional
+            A list of `(weekday, time, key)` tuples, with `weekday` the day
+            number (Monday is 0) and `time` a string formatted as
+            "HH:MM[:SS]". A later entry at the same instant replaces an
+            earlier one.
+        """
+        rings = dict()
+        for weekday, time, key in entries or []:
+            rings[week_offset(weekday, time)] = str(key)
+
+        self.__keys = sorted(set(rings.values()))
+        lookup = {key: i for i, key in enumerate(self.__keys)}
+
+        self.__offsets = array('l')
+        self.__index = array('l')
+        for offset in sorted(rings):
+            self.__offsets.append(offset)
+            self.__index.append(lookup[rings[offset]])
+
+    def __len__(self):
+        """Returns the number of rings per week.
+        """
+        return len(self.__offsets)
+
+    def __iter__(self):
+        """Iterate over the `(offset, key)` tuples of the week.
+        """
+        for offset, index in zip(self.__offsets, self.__index):
+            yield offset, self.__keys[index]
+
+    @property
+    def keys(self) -> list:
+        """Get the sorted list of unique keys.
+        """
+        return self.__keys
+
+    @property
+    def offsets(self) -> array:
+        """Get the sorted second-of-week offsets.
+        """
+        return self.__offsets
+
+    def next_ring(self, after: datetime.datetime = None) -> tuple:
+        """Returns a `(datetime, key)` tuple of the first ring strictly after
+        `after`, or `None` if the timeline is empty.
+
+        Parameters
+        ----------
+        after : :class:`datetime.datetime`, optional
+            Reference time. Defaults to now.
+        """
+        if not self.__offsets:
+            return None
+
+        after = after or datetime.datetime.now()
+        week = datetime.datetime.combine(
+            after.date() - datetime.timedelta(days=after.weekday()),
+            datetime.time()
+        )
+        offset = int((after - week).total_seconds())
+
+        i = bisect_right(self.__offsets, offset)
+        if i == len(self.__offsets):
+            i = 0
+            week += datetime.timedelta(days=7)
+
+        return (
+            week + datetime.timedelta(seconds=self.__offsets[i]),
+            self.__keys[self.__index[i]]
+        )
+
+    def overlaps(self, durations: dict) -> list:
+        """Returns the `(offset, key, next_offset)` tuples of the rings that
+        are still playing when the next ring starts.
+
+        Parameters
+        ----------
+        durations : `dict`
+            The ring duration in seconds per key.
+        """
+        result = []
+        n = len(self.__offsets)
+        for i in range(n):
+            offset, key = self.__offsets[i], self.__keys[self.__index[i]]
+            next_offset = self.__offsets[(i + 1) % n]
+            if i + 1 == n:
+                next_offset += 7 * 86400
+            if offset + durations.get(key, 0) > next_offset:
+                result.append((offset, key, next_offset % (7 * 86400)))
+        return result
+
+
+def week_offset(weekday: int, time: str) -> int:
+    """Returns the second-of-week offset given the day number (Monday is 0)
+    and a time string formatted as "HH:MM[:SS]".
+    """
+    if not 0 <= weekday < 7:
+        raise ValueError(f"Day number \"{weekday}\" is invalid!")
+    fields = [int(field) for field in time.split(':')]
+    hours, minutes, seconds = (fields + [0])[:3]
+    return weekday * 86400 + hours * 3600 + minutes * 60 + seconds
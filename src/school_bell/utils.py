@@ -1,39 +1,144 @@
 #!/usr/bin/python3
 
 # absolute imports
+import atexit
 import logging
 import os
+import stat
 import sys
+import tempfile
 from datetime import datetime, date
 from subprocess import Popen, PIPE
+from threading import Lock
 
 
-__all__ = ['init_logger', 'is_raspberry_pi', 'system_call',
-           'to_datetime', 'to_date']
+__all__ = ['init_logger', 'log_handlers', 'is_raspberry_pi', 'private_dir',
+           'system_call', 'system_output', 'to_datetime', 'to_date']
 
 
 def init_logger(
-    prog=None, debug=False
+    prog=None, debug=False, handlers=None
 ):
-    """Create the logger object
+    """Create the logger object, or update the level of an existing logger.
+
+    Records are put on a queue and written by a background listener, such
+    that a slow stdout or journal never blocks the caller. Loggers with the
+    same handlers share one listener.
+
+    Parameters
+    ----------
+    prog : `str`, optional
+        Name of the logger. Defaults to "school-bell".
+
+    debug : `bool`, optional
+        Log debug messages. Defaults to `False`.
+
+    handlers : `list` or `str`, optional
+        The log handlers: "stdout", "syslog" (e.g., journald via
+        `/dev/log`) or "file:<path>" for a rotating log file.
+        Defaults to ["stdout"].
     """
     # create logger
     logger = logging.getLogger(prog or 'school-bell')
 
-    # log to stdout
-    streamHandler = logging.StreamHandler(sys.stdout)
-    streamHandler.setFormatter(logging.Formatter(
-        "%(levelname)s: %(message)s"
-        # "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    ))
-    logger.addHandler(streamHandler)
-
     # set logger level
     logger.setLevel(logging.DEBUG if debug else logging.INFO)
 
+    # attach a single queue handler
+    spec = log_handlers(handlers)
+    queue = _listener(spec)
+    for handler in list(logger.handlers):
+        if getattr(handler, '_school_bell', None) == spec:
+            return logger
+        if hasattr(handler, '_school_bell'):
+            logger.removeHandler(handler)
+
+    from logging.handlers import QueueHandler
+    handler = QueueHandler(queue)
+    handler._school_bell = spec
+    logger.addHandler(handler)
+
     return logger
 
 
+def log_handlers(handlers=None) -> tuple:
+    """Returns the log handlers as a tuple, defaults to ("stdout",). Raises a
+    `TypeError` if not a string or a list of strings, or a `ValueError` if a
+    handler is not supported.
+    """
+    if not isinstance(handlers, (str, list, tuple, type(None))):
+        raise TypeError("log should be a string or a list of strings!")
+    spec = tuple([handlers] if isinstance(handlers, str) else
+                 handlers or ['stdout'])
+    for name in spec:
+        if not isinstance(name, str):
+            raise TypeError("log should be a string or a list of strings!")
+        if name not in ('stdout', 'syslog', 'journald') and \
+                not name.startswith('file:'):
+            raise ValueError(f"Log handler \"{name}\" is not supported!")
+    return spec
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """Stream handler writing to the current `sys.stdout`.
+    """
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+_listeners = dict()
+_listeners_lock = Lock()
+
+
+def _listener(spec: tuple):
+    """Internal function returning the queue of the background listener of
+    the handlers, started once and stopped at exit.
+    """
+    with _listeners_lock:
+        if spec in _listeners:
+            return _listeners[spec].queue
+
+        from logging import handlers as _handlers
+        from queue import SimpleQueue
+
+        outputs = []
+        for name in spec:
+            if name == 'stdout':
+                handler = _StdoutHandler()
+                handler.setFormatter(logging.Formatter(
+                    "%(levelname)s: %(message)s"
+                    # "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+                ))
+            elif name in ('syslog', 'journald'):
+                handler = _handlers.SysLogHandler(address='/dev/log')
+                handler.setFormatter(logging.Formatter(
+                    "%(name)s: %(levelname)s: %(message)s"
+                ))
+            elif name.startswith('file:'):
+                handler = _handlers.RotatingFileHandler(
+                    os.path.expandvars(name[5:]), maxBytes=1 << 20,
+                    backupCount=5
+                )
+                handler.setFormatter(logging.Formatter(
+                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+                ))
+            else:
+                raise ValueError(f"Log handler \"{name}\" is not supported!")
+            outputs.append(handler)
+
+        listener = _handlers.QueueListener(SimpleQueue(), *outputs)
+        listener.start()
+        atexit.register(listener.stop)
+        _listeners[spec] = listener
+        return listener.queue
+
+
 def is_raspberry_pi():
     """Checks if the device is a Rasperry Pi
     """
@@ -44,29 +149,65 @@ def is_raspberry_pi():
     return model.startswith("Raspberry Pi")
 
 
+def private_dir(root: str = None) -> str:
+    """Returns the per-user directory `school-bell-<uid>` in `root`,
+    defaults to the temporary directory, created with mode 0700 if missing.
+    Raises a `PermissionError` if the directory is a symlink, not owned by
+    the user or accessible by others.
+    """
+    path = os.path.join(root or tempfile.gettempdir(),
+                        f"school-bell-{os.getuid()}")
+    try:
+        os.mkdir(path, 0o700)
+        os.chmod(path, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if not (
+        stat.S_ISDIR(info.st_mode) and info.st_uid == os.getuid() and
+        stat.S_IMODE(info.st_mode) == 0o700
+    ):
+        raise PermissionError(
+            f"directory \"{path}\" is not private to the user!"
+        )
+    return path
+
+
 def system_call(
     command: list, log: logging.Logger = None,
     **kwargs
 ):
     """Execute a system call. Returns `True` on success.
     """
+    return system_output(command, log, **kwargs)[0]
+
+
+def system_output(
+    command: list, log: logging.Logger = None,
+    **kwargs
+):
+    """Execute a system call. Returns a tuple with `True` on success and the
+    decoded standard output.
+    """
     if not isinstance(command, list):
         raise TypeError("command should be a list!")
 
-    log = log if isinstance(log, logging.Logger) else init_logger(debug=True)
+    log = log if isinstance(log, logging.Logger) else \
+        logging.getLogger('school-bell')
     log.debug(' '.join(command))
 
     p = Popen(command, stdout=PIPE, stderr=PIPE, **kwargs)
 
     output, error = p.communicate()
+    output = output.decode("utf-8")
 
     if output:
-        log.debug(output.decode("utf-8"))
+        log.debug(output)
 
     if p.returncode != 0:
         log.error(error.decode("utf-8"))
 
-    return p.returncode == 0
+    return p.returncode == 0, output
 
 
 def to_datetime(value: str, fmt: str = None):
@@ -0,0 +1,107 @@
+# content of test_audio.py
+import pytest
+import wave
+from time import time
+from os import getcwd
+from school_bell.audio import (
+    Player, NullSink, FileSink, AplaySink, create_sink, load_wav, wav_info
+)
+
+wav = f"{getcwd()}/samples/ClassBell-SoundBible.com-1426436341.wav"
+
+
+def test_load_wav():
+    sample = load_wav(wav)
+    assert sample.nchannels == 2
+    assert sample.sampwidth == 2
+    assert sample.framerate == 44100
+    assert len(sample.frames) == sample.nframes * 4
+
+
+def test_create_sink(tmp_path):
+    assert isinstance(create_sink('null'), NullSink)
+    sink = create_sink(f"file:{tmp_path}/out.wav")
+    assert isinstance(sink, FileSink)
+    assert sink.path == f"{tmp_path}/out.wav"
+
+
+def test_player_null():
+    player = Player(NullSink())
+    player.load('0', wav)
+    assert player.play('0') is True
+    assert player.play(0, duration=1) is True
+    assert player.sink.count == 2
+
+
+def test_player_play_at():
+    player = Player(NullSink())
+    player.load('0', wav)
+    start = time() + .1
+    success, started = player.play_at(start, '0')
+    assert success is True
+    assert start <= started < start + .05
+
+
+def test_player_file(tmp_path):
+    player = Player(FileSink(f"{tmp_path}/out.wav"))
+    player.load('0', wav)
+    assert player.play('0', duration=1) is True
+    with wave.open(f"{tmp_path}/out.wav") as f:
+        assert f.getnframes() == 44100
+        assert f.getnchannels() == 2
+
+
+def test_player_pipe():
+    sink = AplaySink(command=['/bin/sh', '-c', 'cat > /dev/null', 'sh'])
+    player = Player(sink)
+    player.load('0', wav)
+    worker = sink.worker
+    assert sink.format == (2, 2, 44100)
+    assert player.play('0', duration=1) is True
+    worker.kill()
+    worker.wait()
+    assert player.play('0', duration=1) is True
+    assert sink.restarts == 1
+    player.close()
+    assert sink.worker is None
+
+
+def test_player_pipe_format():
+    sink = AplaySink(command=['/bin/sh', '-c', 'cat > /dev/null', 'sh'])
+    sample = load_wav(wav)
+    mono = sample._replace(nchannels=1)
+    assert sink.play(sample) is True
+    worker = sink.worker
+    assert sink.play(mono) is True
+    assert sink.format == (1, 2, 44100)
+    assert worker.poll() is not None
+    assert sink.restarts == 0
+    sink.close()
+
+
+def test_player_pipe_timeout():
+    sink = AplaySink(command=['/bin/sh', '-c', 'sleep 30', 'sh'],
+                     timeout=.1)
+    player = Player(sink)
+    player.load('0', wav)
+    started = time()
+    assert player.play('0', duration=.5) is False
+    assert time() - started < 2
+    assert player.play('0', duration=.01) is True
+    assert sink.restarts == 1
+    player.close()
+
+
+def test_wav_info():
+    info = wav_info(wav)
+    sample = load_wav(wav)
+    assert info.nframes == sample.nframes
+    assert info.duration == sample.nframes / sample.framerate
+    assert len(info.sha1) == 40
+
+
+def test_wav_info_invalid(tmp_path):
+    with open(f"{tmp_path}/bad.wav", 'wb') as f:
+        f.write(b'RIFF0000WAVEjunk')
+    with pytest.raises(ValueError):
+        wav_info(f"{tmp_path}/bad.wav")
@@ -0,0 +1,54 @@
+# content of test_cache.py
+import os
+from school_bell.cache import HolidayCache
+from school_bell.utils import to_date
+
+holidays = [
+    {'id': '1', 'startDate': to_date('2024-01-01'),
+     'endDate': to_date('2024-01-01'), 'type': 'Public'},
+]
+
+
+def test_cache_path(tmp_path):
+    cache = HolidayCache(str(tmp_path))
+    assert cache.path == str(tmp_path)
+    assert cache.filename('NL-BE') == os.path.join(
+        str(tmp_path), 'holidays-NL-BE.json'
+    )
+
+
+def test_cache_miss(tmp_path):
+    cache = HolidayCache(str(tmp_path))
+    assert cache.get('NL-BE', '2024-01-01', '2024-06-29') is None
+    assert cache.age('NL-BE') is None
+
+
+def test_cache_set_get(tmp_path):
+    cache = HolidayCache(str(tmp_path / 'cache'))
+    cache.set('NL-BE', '2024-01-01', '2024-06-29', holidays)
+    assert os.listdir(cache.path) == ['holidays-NL-BE.json']
+    assert cache.get('NL-BE', '2024-01-01', '2024-06-29') == holidays
+    assert cache.get('NL-BE', '2024-01-02', '2024-06-30') is None
+    assert cache.get('NL-BE', '2024-01-02', '2024-06-30', stale=True) == \
+        holidays
+    assert cache.get('NL-BE', '2024-07-01', '2024-12-31', stale=True) is None
+    assert 0 <= cache.age('NL-BE') < 10
+
+
+def test_cache_ttl(tmp_path):
+    cache = HolidayCache(str(tmp_path), ttl=0)
+    cache.set('NL-BE', '2024-01-01', '2024-06-29', holidays)
+    assert cache.get('NL-BE', '2024-01-01', '2024-06-29') is None
+    assert cache.get('NL-BE', '2024-01-01', '2024-06-29', stale=True) == \
+        holidays
+
+
+def test_cache_malformed(tmp_path):
+    cache = HolidayCache(str(tmp_path))
+    cache.set('NL-BE', '2024-01-01', '2024-06-29', holidays)
+    for content in ('{"validFrom": "2024-01-01"}', '[]', '{',
+                    '{"validFrom": "x", "validTo": "2024-06-29"}'):
+        with open(cache.filename('NL-BE'), 'w') as f:
+            f.write(content)
+        assert cache.record('NL-BE') is None
+        assert cache.get('NL-BE', '2024-01-01', '2024-06-29') is None
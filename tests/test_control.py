@@ -0,0 +1,90 @@
+# content of test_control.py
+import json
+import os
+import pytest
+import socket
+import stat
+import sys
+import tempfile
+from datetime import date
+from school_bell import control
+from school_bell.control import ControlServer, request
+from school_bell.school_bell import SchoolBell
+from test_school_bell import create_offline_args
+
+
+@pytest.fixture
+def server(tmp_path):
+    args = create_offline_args(tmp_path)
+    args['backend'] = 'null'
+    bell = SchoolBell(**args)
+    server = ControlServer(bell, str(tmp_path / 'ctl.sock'),
+                           reload=lambda: ['schedule'])
+    server.start()
+    yield server
+    server.stop()
+    bell.close()
+
+
+def test_control_commands(server):
+    path = server.path
+    status = request('status', path)
+    assert status['ok'] is True
+    assert status['result']['default']['unhealthy'] == []
+    rings = request('next-rings', path, count=3)['result']['default']
+    assert len(rings) == 3 and rings[0]['key'] in ('0', '1')
+    holiday = request('holiday', path, date=str(date.today()))
+    assert holiday['result']['default']['holiday'] is False
+    assert request('ring', path, key='0')['result'] == {'default': True}
+    assert request('play', path, key='1')['result'] == {'default': True}
+    assert request('reload', path)['result'] == ['schedule']
+    assert server.target.player.sink.count == 2
+
+
+def test_control_errors(server):
+    response = request('shutdown', server.path)
+    assert response['ok'] is False and 'Unknown command' in response['error']
+    response = request('ring', server.path, key='9')
+    assert response['ok'] is False and 'KeyError' in response['error']
+    response = request('status', server.path, bell='north')
+    assert response['ok'] is False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(server.path)
+        sock.sendall(b'not json\n[]\n')
+        with sock.makefile('rb') as f:
+            assert json.loads(f.readline())['ok'] is False
+            assert json.loads(f.readline())['ok'] is False
+
+
+def test_control_in_use(server):
+    with pytest.raises(RuntimeError):
+        ControlServer(server.target, server.path)
+
+
+def test_control_mode(server):
+    assert stat.S_IMODE(os.stat(server.path).st_mode) == 0o600
+
+
+def test_control_default_path(tmp_path, monkeypatch):
+    monkeypatch.delenv('XDG_RUNTIME_DIR', raising=False)
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    path = tmp_path / f"school-bell-{os.getuid()}"
+    assert control.default_path() == str(path / 'control.sock')
+    assert stat.S_IMODE(os.lstat(path).st_mode) == 0o700
+    os.chmod(path, 0o777)
+    with pytest.raises(PermissionError):
+        control.default_path()
+
+
+def test_control_client(server, monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', [
+        'school-bell-ctl', '--socket', server.path, 'next-rings', '2'
+    ])
+    control.main()
+    assert len(json.loads(capsys.readouterr().out)['default']) == 2
+    monkeypatch.setattr(sys, 'argv', [
+        'school-bell-ctl', '--socket', server.path, 'play', '9'
+    ])
+    with pytest.raises(SystemExit) as exit:
+        control.main()
+    assert exit.value.code == 1
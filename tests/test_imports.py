@@ -0,0 +1,55 @@
+# content of test_imports.py
+import platform
+import pytest
+import subprocess
+import sys
+
+heavy = ('gpiozero', 'requests', 'schedule', 'asyncio', 'http.server')
+
+
+def _loaded(code: str) -> list:
+    """Returns the heavy modules loaded after running the code in a fresh
+    interpreter.
+    """
+    result = subprocess.run([
+        sys.executable, '-c',
+        f"import sys\n{code}\nprint(' '.join(m for m in {heavy!r} "
+        "if m in sys.modules))"
+    ], capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def _import_time(module: str) -> float:
+    """Returns the cumulative import time of the module in seconds in a
+    fresh interpreter, or `None` if not reported.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                             f"import {module}"],
+                            capture_output=True, text=True, check=True)
+    for line in result.stderr.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) * 1e-6
+
+
+def test_lazy_imports():
+    assert _loaded('import school_bell') == []
+    assert _loaded('import school_bell.main') == []
+    assert _loaded('from school_bell import SchoolBell') == ['schedule']
+
+
+def test_lazy_attributes():
+    assert _loaded('import school_bell\nschool_bell.SchoolBell') == \
+        ['schedule']
+    assert _loaded('import school_bell\nschool_bell.openholidays') == []
+
+
+@pytest.mark.skipif(platform.python_implementation() != 'CPython',
+                    reason='-X importtime is CPython only')
+def test_import_time_budget():
+    # relative to the heavy dependency deferred by the lazy imports, as an
+    # absolute budget depends on the machine
+    cost = _import_time('school_bell.main')
+    deferred = _import_time('requests')
+    assert cost is not None and deferred is not None
+    assert cost < deferred
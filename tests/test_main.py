@@ -0,0 +1,88 @@
+# content of test_main.py
+import json
+import logging
+import os
+import pytest
+import signal
+import threading
+from time import sleep
+from school_bell.main import load_config, watch_config
+from school_bell.scheduler import Scheduler
+
+
+class StubBell(object):
+
+    def __init__(self):
+        self.configs = []
+        self.threads = []
+        self.scheduler = Scheduler()
+        self.log = logging.getLogger('school-bell')
+
+    def reload(self, config):
+        self.configs.append(config)
+        self.threads.append(threading.current_thread())
+
+
+def test_load_config(tmp_path):
+    config = {'schedule': {}, 'wav': {}}
+    assert load_config(json.dumps(config)) == config
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(config))
+    assert load_config(str(path)) == config
+    with pytest.raises(KeyError):
+        load_config('{"wav": {}}')
+    with pytest.raises(RuntimeError):
+        load_config('not a config')
+    config['log'] = ['stdout', 'file:/tmp/school-bell.log']
+    assert load_config(json.dumps(config)) == config
+    with pytest.raises(ValueError):
+        load_config('{"schedule": {}, "wav": {}, "log": "mail"}')
+    with pytest.raises(TypeError):
+        load_config('{"schedule": {}, "wav": {}, "log": [1]}')
+
+
+def test_watch_config_sighup(tmp_path):
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps({'schedule': {}, 'wav': {'0': 'bell.wav'}}))
+    bell = StubBell()
+    handler = signal.getsignal(signal.SIGHUP)
+
+    def signal_loop():
+        while not bell.scheduler.running:
+            sleep(.01)
+        os.kill(os.getpid(), signal.SIGHUP)
+        while len(bell.configs) < 2:
+            sleep(.01)
+        bell.scheduler.stop()
+
+    try:
+        watch_config(bell, str(path), overrides=dict(test=True))
+        os.kill(os.getpid(), signal.SIGHUP)
+        assert bell.configs == []
+        thread = threading.Thread(target=signal_loop)
+        thread.start()
+        bell.scheduler.run()
+        thread.join()
+    finally:
+        signal.signal(signal.SIGHUP, handler)
+    assert bell.configs == 2 * [
+        {'schedule': {}, 'wav': {'0': 'bell.wav'}, 'test': True}
+    ]
+    assert bell.threads == 2 * [threading.main_thread()]
+
+
+def test_watch_config_removed(tmp_path):
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps({'schedule': {}, 'wav': {}}))
+    bell = StubBell()
+    handler = signal.getsignal(signal.SIGHUP)
+    try:
+        watch_config(bell, str(path), interval=1)
+    finally:
+        signal.signal(signal.SIGHUP, handler)
+    path.unlink()
+    bell.scheduler.jobs.run_all()
+    path.write_text(json.dumps({'schedule': {}, 'wav': {'0': 'bell.wav'}}))
+    os.utime(path, (0, 0))
+    bell.scheduler.jobs.run_all()
+    assert bell.configs == [{'schedule': {}, 'wav': {'0': 'bell.wav'}}]
@@ -0,0 +1,104 @@
+# content of test_metrics.py
+from urllib.request import urlopen
+from school_bell.metrics import (Metrics, MetricsServer, RingRecord,
+                                 RingStats, percentile)
+from school_bell.school_bell import TargetResult
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile([], 50) is None
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 100) == 100
+    assert percentile([3.], 0) == 3.
+
+
+def test_ring_stats():
+    stats = RingStats(maxlen=2)
+    for i in range(3):
+        stats.add(RingRecord(
+            key='0', scheduled=100., dispatched=100. + i,
+            targets={'local': TargetResult(True, 101. + i, 110.),
+                     'remote': TargetResult(False, None, 110.)},
+            buzzer_on=None, buzzer_off=None,
+        ))
+    assert len(stats) == 2
+    summary = stats.summary()
+    assert summary['dispatch'] == dict(count=2, p50=1., p95=2., max=2.)
+    assert summary['start'] == dict(count=2, p50=2., p95=3., max=3.)
+
+
+def test_ring_stats_empty():
+    summary = RingStats().summary()
+    assert summary['dispatch']['count'] == 0
+    assert summary['start']['max'] is None
+
+
+def test_metrics_render():
+    metrics = Metrics()
+    metrics.inc('rings_total', help='Rings.')
+    metrics.inc('failures_total', host='pi"bell')
+    metrics.set('lag_seconds', lambda: .5)
+    metrics.set('unknown_seconds', lambda: None)
+    metrics.observe('drift_seconds', .02, buckets=(.01, .1))
+    text = metrics.render()
+    assert '# HELP school_bell_rings_total Rings.' in text
+    assert '# TYPE school_bell_rings_total counter' in text
+    assert 'school_bell_rings_total 1' in text
+    assert 'school_bell_failures_total{host="pi\\"bell"} 1' in text
+    assert 'school_bell_lag_seconds 0.5' in text
+    assert '\nschool_bell_unknown_seconds ' not in text
+    assert 'school_bell_drift_seconds_bucket{le="0.01"} 0' in text
+    assert 'school_bell_drift_seconds_bucket{le="0.1"} 1' in text
+    assert 'school_bell_drift_seconds_bucket{le="+Inf"} 1' in text
+    assert 'school_bell_drift_seconds_count 1' in text
+
+
+def test_metrics_render_error():
+    metrics = Metrics()
+    metrics.set('broken_seconds', lambda: 1 / 0)
+    metrics.set('lag_seconds', lambda: .5)
+    text = metrics.render()
+    assert '\nschool_bell_broken_seconds ' not in text
+    assert 'school_bell_lag_seconds 0.5' in text
+
+
+def test_metrics_render_unlocked():
+    metrics = Metrics()
+
+    def rings():
+        metrics.inc('rings_total')
+        return 1
+
+    metrics.set('rings', rings)
+    assert 'school_bell_rings 1' in metrics.render()
+    assert metrics.get('rings_total') == 1
+
+
+def test_metrics_child():
+    metrics = Metrics()
+    north, south = metrics.child(bell='north'), metrics.child(bell='south')
+    north.inc('rings_total')
+    south.inc('rings_total', 2)
+    assert north.get('rings_total') == 1
+    text = metrics.render()
+    assert 'school_bell_rings_total{bell="north"} 1' in text
+    assert 'school_bell_rings_total{bell="south"} 2' in text
+    north.remove()
+    assert 'bell="north"' not in metrics.render()
+    assert south.get('rings_total') == 2
+
+
+def test_metrics_server():
+    metrics = Metrics()
+    metrics.inc('rings_total')
+    server = MetricsServer(metrics, 0)
+    server.start()
+    try:
+        host, port = server.address
+        with urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+            assert response.status == 200
+            assert b'school_bell_rings_total 1' in response.read()
+    finally:
+        server.stop()
@@ -1,6 +1,16 @@
 # content of test_openholidays.py
+import asyncio
+import logging
+import pytest
 from datetime import date
-from school_bell.openholidays import OpenHolidays
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+from time import monotonic, sleep
+from requests.exceptions import RequestException
+from school_bell.openholidays import (
+    OpenHolidays, AsyncOpenHolidays, HolidayIndex,
+    fetch_holidays, async_fetch_holidays, merge_holidays, is_holiday
+)
 from school_bell.utils import to_date
 
 countryIsoCode = 'BE'
@@ -71,3 +81,215 @@ def test_schoolHolidays():
 def test_schoolHolidaysByDate():
     r = oh.schoolHolidaysByDate(startDate, languageIsoCode)
     assert r[0]['type'] == "School"
+
+
+holidays = [
+    {'startDate': to_date('2024-01-01'), 'endDate': to_date('2024-01-01')},
+    {'startDate': to_date('2024-02-12'), 'endDate': to_date('2024-02-18')},
+    {'startDate': to_date('2024-02-14'), 'endDate': to_date('2024-02-14')},
+    {'startDate': to_date('2024-02-19'), 'endDate': to_date('2024-02-20')},
+]
+
+
+def test_HolidayIndex():
+    index = HolidayIndex(holidays)
+    assert len(index) == 2
+    assert list(index)[1] == (to_date('2024-02-12'), to_date('2024-02-20'))
+    assert '2024-01-01' in index
+    assert to_date('2024-01-02') not in index
+    assert index.is_holiday('2024-02-20') is True
+    assert index.is_holiday('2024-02-21') is False
+    assert HolidayIndex().is_holiday('2024-01-01') is False
+
+
+def test_HolidayIndex_is_holiday():
+    index = HolidayIndex(holidays)
+    for day in ('2023-12-31', '2024-01-01', '2024-02-14', '2024-02-21'):
+        assert is_holiday(day, index) == is_holiday(day, holidays)
+
+
+def test_HolidayIndex_range():
+    index = HolidayIndex(holidays)
+    assert index.holidays('2024-02-19', '2024-02-25') == [
+        to_date('2024-02-19'), to_date('2024-02-20')
+    ]
+    assert index.school_days('2024-02-19', '2024-02-25') == [
+        to_date('2024-02-21'), to_date('2024-02-22'), to_date('2024-02-23')
+    ]
+
+
+def test_lazy_swagger():
+    assert OpenHolidays()._OpenHolidays__swagger is None
+
+
+def test_session():
+    client = OpenHolidays(retries=5, backoff=1., timeout=3)
+    adapter = client.session.get_adapter(client.base_url)
+    assert adapter.max_retries.total == 5
+    assert adapter.max_retries.backoff_factor == 1.
+    assert client.timeout == 3
+    client.close()
+
+
+def test_get_params():
+    client = OpenHolidays('BE', 'NL', 'NL-BE')
+    calls = []
+
+    class Response(object):
+        def json(self):
+            return []
+
+    def get(url, **kwargs):
+        calls.append(kwargs)
+        return Response()
+
+    client.session.get = get
+    assert client.publicHolidays(startDate, endDate) == []
+    assert calls[0]['params']['validFrom'] == str(startDate)
+    assert calls[0]['timeout'] == client.timeout
+    client.close()
+
+
+class Unavailable(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        self.send_error(503)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_get_deadline(monkeypatch):
+    server = HTTPServer(('127.0.0.1', 0), Unavailable)
+    Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(OpenHolidays, 'base_url',
+                        "http://{}:{}".format(*server.server_address))
+    client = OpenHolidays(retries=10, backoff=.2, timeout=.2, deadline=1.)
+    start = monotonic()
+    with pytest.raises(RequestException):
+        client.countries()
+    assert monotonic() - start < 1.
+    client.close()
+    server.shutdown()
+    server.server_close()
+
+
+class NotJson(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.end_headers()
+        self.wfile.write(b'<html>maintenance</html>')
+
+    def log_message(self, *args):
+        pass
+
+
+def test_get_not_json(monkeypatch):
+    server = HTTPServer(('127.0.0.1', 0), NotJson)
+    Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(OpenHolidays, 'base_url',
+                        "http://{}:{}".format(*server.server_address))
+    client = OpenHolidays(timeout=1.)
+    with pytest.raises(RequestException):
+        client.countries()
+    client.close()
+    server.shutdown()
+    server.server_close()
+
+
+def _stub_get(path, *args, **kwargs):
+    sleep(.2)
+    return [{'id': path[0], 'type': path}, {'id': 'shared', 'type': 'Both'}]
+
+
+def test_holidays_concurrent():
+    client = OpenHolidays('BE', 'NL', 'NL-BE')
+    client._get = _stub_get
+    start = monotonic()
+    r = client.holidays(startDate, endDate)
+    assert monotonic() - start < .35
+    assert [holiday['id'] for holiday in r] == ['S', 'shared', 'P']
+    client.close()
+
+
+def _stub_get_public_down(path, *args, **kwargs):
+    if path == 'PublicHolidays':
+        raise RequestException('503 Service Unavailable')
+    return _stub_get(path)
+
+
+def test_holidays_partial(caplog):
+    client = OpenHolidays('BE', 'NL', 'NL-BE',
+                          logger=logging.getLogger('school-bell[test]'))
+    client._get = _stub_get_public_down
+    r = client.holidays(startDate, endDate)
+    assert [holiday['id'] for holiday in r] == ['S', 'shared']
+    assert [record.name for record in caplog.records] == ['school-bell[test]']
+    with pytest.raises(RequestException):
+        client.holidays(startDate, endDate, partial=False)
+    client.close()
+
+
+def test_holidays_shared_deadline():
+    client = OpenHolidays('BE', 'NL', 'NL-BE', deadline=.5)
+
+    def stub(path, *args, **kwargs):
+        sleep(2. if path == 'PublicHolidays' else 0.)
+        return _stub_get(path)
+
+    client._get = stub
+    start = monotonic()
+    r = client.holidays(startDate, endDate)
+    assert monotonic() - start < 1.
+    assert [holiday['id'] for holiday in r] == ['S', 'shared']
+    client.close()
+
+
+def test_fetch_holidays():
+    clients = [OpenHolidays('BE', 'NL', code) for code in ('NL-BE', 'FR-BE')]
+    for client in clients:
+        client._get = _stub_get
+    start = monotonic()
+    r = fetch_holidays(clients, startDate, endDate)
+    assert monotonic() - start < .35
+    assert sorted(r) == ['FR-BE', 'NL-BE']
+    assert len(r['NL-BE']) == 3
+
+
+def test_async_holidays():
+    async def run():
+        async with AsyncOpenHolidays('BE', 'NL', 'NL-BE') as client:
+            client.client._get = _stub_get
+            return await client.holidays(startDate, endDate)
+    assert len(asyncio.run(run())) == 3
+
+
+def test_async_fetch_holidays():
+    clients = [AsyncOpenHolidays('BE', 'NL', code)
+               for code in ('NL-BE', 'FR-BE', 'DE-BE')]
+    for client in clients:
+        client.client._get = _stub_get
+    start = monotonic()
+    r = asyncio.run(async_fetch_holidays(clients, startDate, endDate))
+    assert monotonic() - start < .35
+    assert sorted(r) == ['DE-BE', 'FR-BE', 'NL-BE']
+
+
+def test_merge_holidays():
+    known = [
+        {'id': 'old', 'startDate': to_date('2024-01-01'),
+         'endDate': to_date('2024-01-01')},
+        {'id': 'near', 'startDate': to_date('2024-01-05'),
+         'endDate': to_date('2024-01-06')},
+        {'id': 'far', 'startDate': to_date('2024-03-01'),
+         'endDate': to_date('2024-03-01')},
+    ]
+    fetched = [
+        {'id': 'tail', 'startDate': to_date('2024-07-01'),
+         'endDate': to_date('2024-07-01')},
+    ]
+    windows = [('2024-01-02', '2024-01-09'), ('2024-06-30', '2024-07-31')]
+    merged = merge_holidays(known, fetched, windows, '2024-01-02')
+    assert [holiday['id'] for holiday in merged] == ['far', 'tail']
@@ -0,0 +1,97 @@
+# content of test_runner.py
+from datetime import date, datetime, timedelta
+from os import getcwd
+from school_bell import school_bell
+from school_bell.cache import HolidayCache
+from school_bell.runner import BellRunner
+from school_bell.school_bell import SchoolBell
+
+
+def create_bells(tmp_path):
+    HolidayCache(str(tmp_path)).set(
+        'NL-BE', date.today(), date.today() + timedelta(days=180), []
+    )
+    return {
+        'bells': {
+            'north': {'schedule': {'Mon': {'08:30': '0'}}},
+            'south': {'schedule': {'Mon': {'08:45': '1'}},
+                      'trigger': {'pibell2': ''}},
+        },
+        'wav': {
+            '0': 'ClassBell-SoundBible.com-1426436341.wav',
+            '1': 'SchoolBell-SoundBible.com-449398625.wav'
+        },
+        'root': f"{getcwd()}/samples",
+        'backend': 'null',
+        'holidays': 'NL-BE',
+        'cache': str(tmp_path),
+    }
+
+
+def test_independent_bells(tmp_path):
+    config = create_bells(tmp_path)
+    del config['bells']
+    north = SchoolBell(schedule={'Mon': {'08:30': '0'}}, **config)
+    south = SchoolBell(schedule={'Mon': {'08:45': '1'}}, **config)
+    assert north.scheduler is not south.scheduler
+    assert len(north.scheduler.jobs.jobs) == 1
+    assert len(south.scheduler.jobs.jobs) == 1
+    north.close()
+    assert north.scheduler.jobs.jobs == []
+    assert len(south.scheduler.jobs.jobs) == 1
+
+
+def test_runner(tmp_path, monkeypatch):
+    monkeypatch.setattr(school_bell, 'system_call', lambda *args: True)
+    runner = BellRunner(**create_bells(tmp_path))
+    assert sorted(runner.bells) == ['north', 'south']
+    assert sorted(runner.scheduler.timelines) == ['north', 'south']
+    assert runner.pool._max_workers == 3
+    assert runner.dispatcher is not runner.pool
+    for bell in runner.bells.values():
+        assert bell.scheduler is runner.scheduler
+        assert bell.pool is runner.pool
+    assert len(runner.scheduler.jobs.jobs) == 2
+    assert list(runner.holiday_sources) == ['NL-BE']
+    assert runner.holiday_sources['NL-BE'].users == 2
+    assert runner.bells['north'].openholidays is \
+        runner.bells['south'].openholidays
+    assert runner.bells['south'].ring('1') is True
+    text = runner.metrics.render()
+    assert 'school_bell_rings_succeeded_total{bell="south"} 1' in text
+    assert 'school_bell_trigger_unhealthy_hosts{bell="north"} 0' in text
+
+    monday = datetime.combine(date.today(), datetime.min.time()) + \
+        timedelta(days=7 - date.today().weekday())
+    rings = runner.simulate(start=monday, days=1)
+    assert [(name, ring.key) for name, ring in rings] == [
+        ('north', '0'), ('south', '1')
+    ]
+    runner.close()
+
+
+def test_runner_small_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(school_bell, 'system_call', lambda *args: True)
+    runner = BellRunner(workers=1, **create_bells(tmp_path))
+    future = runner.scheduler._dispatch(runner.bells['south'].ring, '1')
+    assert future.result(timeout=10) is True
+    runner.close()
+
+
+def test_runner_reload(tmp_path, monkeypatch):
+    monkeypatch.setattr(school_bell, 'system_call', lambda *args: True)
+    config = create_bells(tmp_path)
+    runner = BellRunner(**config)
+    config['bells'] = {
+        'north': {'schedule': {'Tue': {'08:30': '0'}}},
+        'east': {'schedule': {'Mon': {'09:00': '0'}}},
+    }
+    assert runner.reload(config) == {
+        'south': ['removed'], 'north': ['schedule'], 'east': ['added']
+    }
+    assert sorted(runner.scheduler.timelines) == ['east', 'north']
+    assert len(runner.scheduler.jobs.jobs) == 1
+    assert runner.holiday_sources['NL-BE'].users == 2
+    assert 'bell="south"' not in runner.metrics.render()
+    runner.close()
+    assert runner.holiday_sources == {}
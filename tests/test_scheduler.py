@@ -0,0 +1,89 @@
+# content of test_scheduler.py
+import schedule
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from threading import Thread
+from time import monotonic
+from school_bell.scheduler import Scheduler, VirtualClock
+from school_bell.timeline import Timeline
+
+
+def test_sleep_time_no_jobs():
+    scheduler = Scheduler(schedule.Scheduler(), max_sleep=30)
+    assert scheduler.idle_seconds() is None
+    assert scheduler.sleep_time() == 30
+
+
+def test_sleep_time_next_job():
+    jobs = schedule.Scheduler()
+    jobs.every(10).seconds.do(lambda: None)
+    scheduler = Scheduler(jobs, max_sleep=60)
+    assert 9 < scheduler.sleep_time() <= 10
+
+
+def test_wakeup_and_stop():
+    jobs = schedule.Scheduler()
+    jobs.every(1).hours.do(lambda: None)
+    scheduler = Scheduler(jobs)
+    thread = Thread(target=scheduler.run)
+    start = monotonic()
+    thread.start()
+    scheduler.wakeup()
+    scheduler.stop()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert monotonic() - start < 5
+    assert scheduler.running is False
+
+
+def test_timeline_dispatch():
+    rings = []
+    scheduler = Scheduler(schedule.Scheduler())
+    scheduler.set_timeline(Timeline([(0, '08:30', '0')]),
+                           lambda key, **kwargs: rings.append(key))
+    assert scheduler.next_ring[1] == '0'
+    assert 0 < scheduler.sleep_time() <= scheduler.max_sleep
+    scheduler.run_all()
+    assert rings == ['0']
+
+
+def test_virtual_clock():
+    rings = []
+    clock = VirtualClock(datetime(2024, 1, 1))  # a Monday
+    scheduler = Scheduler(schedule.Scheduler(), clock=clock)
+    scheduler.set_timeline(
+        Timeline([(0, '08:30', '0'), (2, '10:00', '1')]),
+        lambda key, **kwargs: rings.append((clock(), key))
+    )
+    assert scheduler.next_ring == (datetime(2024, 1, 1, 8, 30), '0')
+    clock.set(datetime(2024, 1, 3, 10, 0, 30))
+    scheduler.run_pending()
+    assert rings == [(datetime(2024, 1, 3, 10, 0, 30), '1')]
+    assert scheduler.lag == 30
+    assert scheduler.next_ring == (datetime(2024, 1, 8, 8, 30), '0')
+
+
+def test_named_timelines():
+    rings = []
+    clock = VirtualClock(datetime(2024, 1, 1))  # a Monday
+    executor = ThreadPoolExecutor(max_workers=2)
+    scheduler = Scheduler(clock=clock, executor=executor)
+    scheduler.set_timeline(Timeline([(0, '08:30', '0')]),
+                           lambda key, **kwargs: rings.append(('a', key)),
+                           'a')
+    scheduler.set_timeline(Timeline([(0, '08:29:30', '1')]),
+                           lambda key, **kwargs: rings.append(('b', key)),
+                           'b')
+    assert sorted(scheduler.timelines) == ['a', 'b']
+    assert scheduler.next_ring == (datetime(2024, 1, 1, 8, 29, 30), '1')
+    clock.set(datetime(2024, 1, 1, 8, 30))
+    scheduler.run_pending()
+    executor.shutdown(wait=True)
+    assert sorted(rings) == [('a', '0'), ('b', '1')]
+    scheduler.remove_timeline('b')
+    assert scheduler.next_ring == (datetime(2024, 1, 8, 8, 30), '0')
+
+
+def test_own_jobs():
+    assert Scheduler().jobs is not Scheduler().jobs
+    assert Scheduler().jobs is not schedule.default_scheduler
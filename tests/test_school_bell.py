@@ -1,5 +1,12 @@
 # content of test_school_bell.py
+import os
+import pytest
+import stat
+from datetime import date, datetime, timedelta
 from os import getcwd
+from time import sleep, time
+from school_bell import school_bell
+from school_bell.cache import HolidayCache
 from school_bell.school_bell import SchoolBell, _validate_day, _validate_time
 
 
@@ -24,6 +31,19 @@ def create_args(device):
     }
 
 
+def create_offline_args(tmp_path, holidays: list = None):
+    """School bell arguments with a fresh holiday cache to run offline.
+    """
+    today = date.today()
+    HolidayCache(str(tmp_path)).set(
+        'NL-BE', today, today + timedelta(days=180), holidays or []
+    )
+    args = create_args(None)
+    args['test'] = False
+    args['cache'] = str(tmp_path)
+    return args
+
+
 def test_validate_day():
     assert _validate_day('Mon') is True
     assert _validate_day('Tue') is True
@@ -52,3 +72,460 @@ def test_school_bell(device):
     assert bell.play(0) is True
     assert bell.ring(1) != bell.is_holiday()
     assert bell.run_schedule(_test_mode=True) is True
+
+
+def test_holidays_from_cache(tmp_path):
+    today = date.today()
+    holidays = [{'id': '1', 'startDate': today, 'endDate': today}]
+    bell = SchoolBell(**create_offline_args(tmp_path, holidays))
+    assert bell.holidays == holidays
+    assert bell.is_holiday() is True
+    assert bell.is_holiday(today + timedelta(days=1)) is False
+    assert bell.holidays_window == (today, today + timedelta(days=180))
+
+
+def test_holidays_cache_read_once(tmp_path, monkeypatch):
+    reads = []
+    record = HolidayCache.record
+    monkeypatch.setattr(HolidayCache, 'record',
+                        lambda *args: reads.append(args) or record(*args))
+    bell = SchoolBell(**create_offline_args(tmp_path))
+    assert len(reads) == 1
+    assert bell.holidays_window is not None
+
+
+def test_holidays_cache_fresh(tmp_path):
+    bell = SchoolBell(**create_offline_args(tmp_path))
+    source = bell.holiday_source
+    assert source.is_fresh() is True
+    assert source.is_fresh(days=365) is False
+    assert source.load(days=365) is True
+    assert source.window[1] == date.today() + timedelta(days=180)
+
+
+def test_holidays_cache_malformed(tmp_path, monkeypatch):
+    args = create_offline_args(tmp_path)
+    with open(HolidayCache(str(tmp_path)).filename('NL-BE'), 'w') as f:
+        f.write('{"validFrom": "2024-01-01"}')
+    monkeypatch.setattr(school_bell.HolidaySource, '_fetch',
+                        lambda self, windows, **kwargs: [])
+    bell = SchoolBell(**args)
+    assert bell.holidays == []
+    assert bell.holidays_window is not None
+
+
+def test_no_holidays_in_window(tmp_path):
+    bell = SchoolBell(**create_offline_args(tmp_path))
+    calls = []
+    bell.openholidays.holidays = lambda *args, **kwargs: calls.append(args)
+    assert bell.holidays == []
+    assert bell.is_holiday() is False
+    assert calls == []
+
+
+def test_request_holidays_incremental(tmp_path):
+    today = date.today()
+    later = today + timedelta(days=30)
+    holidays = [{'id': '1', 'startDate': later, 'endDate': later},
+                {'id': '2', 'startDate': today, 'endDate': today}]
+    bell = SchoolBell(**create_offline_args(tmp_path, holidays))
+    calls = []
+
+    def stub(validFrom, validTo, **kwargs):
+        calls.append((validFrom, validTo))
+        return []
+
+    bell.openholidays.holidays = stub
+    assert bell._request_holidays(days=200) is True
+    assert calls == [
+        (str(today), str(today + timedelta(days=7))),
+        (str(today + timedelta(days=181)), str(today + timedelta(days=200))),
+    ]
+    assert [holiday['id'] for holiday in bell.holidays] == ['1']
+    assert bell.holidays_window == (today, today + timedelta(days=200))
+
+
+def test_ssh_control_path(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+    path = tmp_path / f"school-bell-{os.getuid()}"
+    assert school_bell._ssh_control_path() == f"{path}/%C"
+    assert stat.S_IMODE(os.lstat(path).st_mode) == 0o700
+    os.chmod(path, 0o755)
+    with pytest.raises(PermissionError):
+        school_bell._ssh_control_path()
+    os.rmdir(path)
+    os.mkdir(tmp_path / 'other', 0o700)
+    os.symlink(tmp_path / 'other', path)
+    with pytest.raises(PermissionError):
+        school_bell._ssh_control_path()
+
+
+def test_ssh_control_lazy(tmp_path, monkeypatch):
+    runtime = tmp_path / 'runtime'
+    runtime.mkdir()
+    monkeypatch.setenv('XDG_RUNTIME_DIR', str(runtime))
+    bell = SchoolBell(**create_offline_args(tmp_path))
+    bell.close()
+    assert list(runtime.iterdir()) == []
+
+
+def test_ssh():
+    cmd = school_bell._ssh('pibell2', 5)
+    assert cmd[0] == '/usr/bin/ssh' and cmd[-1] == 'pibell2'
+    assert 'ConnectTimeout=5' in cmd
+    assert 'ControlMaster=auto' not in cmd
+    cmd = school_bell._ssh('pibell2', 5, '/tmp/%C', 'check')
+    assert 'ControlMaster=auto' in cmd
+    assert 'ControlPath=/tmp/%C' in cmd
+    assert cmd[-3:] == ['-O', 'check', 'pibell2']
+
+
+def test_trigger_multiplexed(tmp_path, monkeypatch):
+    calls = []
+
+    def stub(cmd, log=None, **kwargs):
+        calls.append(cmd)
+        return True
+
+    monkeypatch.setattr(school_bell, 'system_call', stub)
+    args = create_offline_args(tmp_path)
+    args['trigger'] = {'pibell2': '/home/pi/samples'}
+    bell = SchoolBell(**args)
+    assert bell.trigger == {'pibell2': '/home/pi/samples'}
+    assert f"ControlPath={bell.ssh_control}" in calls[0]
+    assert bell.play_remote('pibell2', '0') is True
+    assert calls[-1][-1] == '/home/pi/samples/' + args['wav']['0']
+    assert f"ControlPath={bell.ssh_control}" in calls[-1]
+    assert bell.check_triggers() is True
+    assert calls[-1][-3:] == ['-O', 'check', 'pibell2']
+
+
+def _stub_remote(monkeypatch):
+    """Run the remote command in a local shell, as ssh would on the host.
+    """
+    monkeypatch.setattr(school_bell, '_ssh',
+                        lambda *args: ['/bin/sh', '-c', 'eval "$*"', 'sh'])
+    monkeypatch.setattr(school_bell, '__play', ['/bin/echo'])
+
+
+def test_play_remote_at(monkeypatch):
+    _stub_remote(monkeypatch)
+    start = time() + .2
+    success, started = school_bell._play_remote_at(start, 'host', 'bell.wav')
+    assert success is True
+    assert abs(started - start) < .1
+
+
+def test_play_at(monkeypatch):
+    monkeypatch.setattr(school_bell, '__play', ['/bin/echo'])
+    start = time() + .2
+    success, started = school_bell._play_at(start, 'bell.wav')
+    assert success is True
+    assert abs(started - start) < .1
+
+
+def test_ring_sync(tmp_path, monkeypatch):
+    _stub_remote(monkeypatch)
+    monkeypatch.setattr(school_bell, 'system_call', lambda *args: True)
+    args = create_offline_args(tmp_path)
+    args['trigger'] = {'pibell2': '/home/pi/samples'}
+    args['sync'] = .2
+    bell = SchoolBell(**args)
+    assert bell.ring('0') is True
+    assert sorted(bell.ring_skew) == ['local', 'pibell2']
+    assert all(abs(skew) < .1 for skew in bell.ring_skew.values())
+
+
+def test_backend_null(tmp_path):
+    args = create_offline_args(tmp_path)
+    args['backend'] = 'null'
+    args['test'] = True
+    bell = SchoolBell(**args)
+    assert sorted(bell.player.samples) == ['0', '1']
+    assert bell.play(0) is True
+    assert bell.ring(1) is True
+    assert bell.player.sink.count == 4
+
+
+def test_wav_index(tmp_path):
+    bell = SchoolBell(**create_offline_args(tmp_path))
+    assert sorted(bell.wav_index) == ['0', '1']
+    assert bell.get_wav_info(0).framerate == 44100
+    assert bell.ring_timeout(0) == bell.get_wav_info(0).duration + 10
+
+
+def test_wav_unsupported(tmp_path):
+    with open(f"{tmp_path}/bad.wav", 'wb') as f:
+        f.write(b'RIFF0000WAVEjunk')
+    args = create_offline_args(tmp_path)
+    args['root'] = str(tmp_path)
+    args['wav'] = {'0': 'bad.wav'}
+    args['schedule'] = {}
+    with pytest.raises(ValueError):
+        SchoolBell(**args)
+
+
+def test_ring_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(school_bell, 'system_call', lambda *args: True)
+    args = create_offline_args(tmp_path)
+    args['trigger'] = {'pibell2': '', 'pibell3': ''}
+    args['backend'] = 'null'
+    bell = SchoolBell(**args)
+    assert bell.ring('0') is True
+    pool = bell.pool
+    assert pool._max_workers == 3
+    assert bell.ring('1') is True
+    assert bell.pool is pool
+    assert sorted(bell.last_ring) == ['local', 'pibell2', 'pibell3']
+    result = bell.last_ring['local']
+    assert result.success is True and result.start <= result.end
+    bell.add_trigger('pibell4')
+    assert bell.pool is not pool and bell.pool._max_workers == 4
+    assert bell.ring('0') is True
+    assert len(bell.last_ring) == 4
+    bell.close()
+
+
+def test_ring_stats(tmp_path):
+    args = create_offline_args(tmp_path)
+    args['backend'] = 'null'
+    bell = SchoolBell(**args)
+    scheduled = time()
+    assert bell.ring('0', scheduled=scheduled) is True
+    record = bell.ring_stats.records[-1]
+    assert record.scheduled == scheduled
+    assert record.dispatched >= scheduled
+    assert record.buzzer_on is None
+    assert bell.ring_stats.summary()['start']['count'] == 1
+
+
+def test_ring_metrics(tmp_path, monkeypatch):
+    monkeypatch.setattr(school_bell, 'system_call', lambda *args: True)
+    args = create_offline_args(tmp_path)
+    args['trigger'] = {'pibell2': ''}
+    args['backend'] = 'null'
+    bell = SchoolBell(**args)
+    metrics = bell.metrics
+    assert metrics.get('rings_attempted_total') == 0
+    assert metrics.get('rings_skipped_holiday_total') == 0
+    assert metrics.get('remote_failures_total', host='pibell2') == 0
+    assert bell.ring('0') is True
+    monkeypatch.setattr(school_bell, 'system_call', lambda *args: False)
+    assert bell.ring('0') is False
+    assert metrics.get('rings_attempted_total') == 2
+    assert metrics.get('rings_succeeded_total') == 1
+    assert metrics.get('remote_failures_total', host='pibell2') == 1
+    assert metrics.get('remote_failures_total', host='local') is None
+    assert 0 <= metrics.get('holidays_cache_age_seconds') < 60
+    assert 'school_bell_ring_dispatch_drift_seconds_count 2' in \
+        metrics.render()
+    bell.close()
+
+
+def test_simulate(tmp_path):
+    monday = datetime.combine(date.today(), datetime.min.time()) + \
+        timedelta(days=7 - date.today().weekday())
+    wednesday = (monday + timedelta(days=9)).date()
+    holidays = [{'id': '1', 'startDate': wednesday, 'endDate': wednesday}]
+    bell = SchoolBell(**create_offline_args(tmp_path, holidays))
+    rings = bell.simulate(start=monday, days=14)
+    assert [(ring.when, ring.key) for ring in rings] == [
+        (monday + timedelta(days=2, hours=8, minutes=30), '0'),
+        (monday + timedelta(days=2, hours=10, minutes=30), '1'),
+        (monday + timedelta(days=9, hours=8, minutes=30), '0'),
+        (monday + timedelta(days=9, hours=10, minutes=30), '1'),
+    ]
+    assert [ring.holiday for ring in rings] == [False, False, True, True]
+
+
+def test_simulate_beyond_window(tmp_path):
+    bell = SchoolBell(**create_offline_args(tmp_path))
+    start = datetime.combine(date.today() + timedelta(days=200),
+                             datetime.min.time())
+    calls = []
+
+    def stub(validFrom, validTo, **kwargs):
+        calls.append((validFrom, validTo))
+        return [{'id': '9', 'startDate': start.date(),
+                 'endDate': start.date() + timedelta(days=13)}]
+
+    bell.openholidays.holidays = stub
+    rings = bell.simulate(start=start, days=14)
+    assert calls == [(str(date.today() + timedelta(days=181)),
+                      str(start.date() + timedelta(days=14)))]
+    assert len(rings) == 4
+    assert all(ring.holiday is True for ring in rings)
+    assert bell.holidays_window[1] == date.today() + timedelta(days=180)
+
+
+def _stub_probe(monkeypatch, down=(), slow=()):
+    """Stub the ssh calls, failing the hosts `down` and delaying the hosts
+    `slow`.
+    """
+    def stub(cmd, log=None, **kwargs):
+        if cmd[-1] in slow or (len(cmd) > 2 and cmd[-3] in slow):
+            sleep(1)
+        return not any(host in cmd for host in down)
+
+    monkeypatch.setattr(school_bell, 'system_call', stub)
+
+
+def test_probe_triggers_concurrent(tmp_path, monkeypatch):
+    hosts = [f"pibell{i}" for i in range(8)]
+    _stub_probe(monkeypatch, slow=hosts)
+    args = create_offline_args(tmp_path)
+    args['trigger'] = {host: '' for host in hosts}
+    start = time()
+    bell = SchoolBell(**args)
+    assert time() - start < 4
+    assert sorted(bell.trigger) == hosts
+    assert bell.unhealthy == set()
+
+
+def test_probe_triggers_failed(tmp_path, monkeypatch):
+    _stub_probe(monkeypatch, down=['pibell3'])
+    args = create_offline_args(tmp_path)
+    args['trigger'] = {'pibell2': '', 'pibell3': ''}
+    with pytest.raises(RuntimeError):
+        SchoolBell(**args)
+
+
+def test_probe_triggers_degraded(tmp_path, monkeypatch):
+    _stub_probe(monkeypatch, down=['pibell3'], slow=['pibell4'])
+    args = create_offline_args(tmp_path)
+    args['trigger'] = {'pibell2': '', 'pibell3': '', 'pibell4': ''}
+    args['backend'] = 'null'
+    args['degraded'] = True
+    args['deadline'] = .3
+    bell = SchoolBell(**args)
+    assert sorted(bell.trigger) == ['pibell2', 'pibell3', 'pibell4']
+    assert bell.unhealthy == {'pibell3', 'pibell4'}
+    assert bell.metrics.get('trigger_unhealthy_hosts') == 2
+    assert bell.ring('0') is True
+    assert sorted(bell.last_ring) == ['local', 'pibell2']
+    _stub_probe(monkeypatch)
+    assert bell.check_triggers() is True
+    assert bell.unhealthy == set()
+    bell.close()
+
+
+def test_reload(tmp_path, monkeypatch):
+    calls = []
+
+    def stub(cmd, log=None, **kwargs):
+        calls.append(cmd)
+        return True
+
+    monkeypatch.setattr(school_bell, 'system_call', stub)
+    args = create_offline_args(tmp_path)
+    args['backend'] = 'null'
+    bell = SchoolBell(**args)
+    sample = bell.player.samples['0']
+    assert bell.reload(args) == []
+
+    config = create_offline_args(tmp_path)
+    config['backend'] = 'null'
+    config['schedule'] = {'Mon': {'09:00': '0'}}
+    config['wav'] = {'0': args['wav']['0']}
+    config['trigger'] = {'pibell2': ''}
+    config['timeout'] = 5
+    assert sorted(bell.reload(config)) == [
+        'schedule', 'timeout', 'trigger', 'wav'
+    ]
+    assert bell.player.samples['0'] is sample
+    assert sorted(bell.wav) == ['0'] and sorted(bell.wav_index) == ['0']
+    assert [key for offset, key in bell.timeline] == ['0']
+    assert bell.trigger == {'pibell2': ''} and bell.timeout == 5
+    assert sum('pibell2' in cmd for cmd in calls) == 1
+
+    config['trigger'] = {}
+    assert bell.reload(config) == ['trigger']
+    assert bell.trigger == {}
+    assert calls[-1][-3:] == ['-O', 'exit', 'pibell2']
+
+    config['schedule'] = {}
+    assert bell.reload(config) == ['schedule']
+    assert len(bell.timeline) == 0
+    assert bell.scheduler.next_ring is None
+
+
+def test_reload_log(tmp_path):
+    args = create_offline_args(tmp_path)
+    args['backend'] = 'null'
+    bell = SchoolBell(**args)
+    log = str(tmp_path / 'bell.log')
+    assert bell.reload({**args, 'log': [f"file:{log}"]}) == ['log']
+    handler, = bell.log.handlers
+    assert handler._school_bell == (f"file:{log}",)
+    with pytest.raises(ValueError):
+        bell.reload({**args, 'log': 'mail'})
+    assert bell.config['log'] == [f"file:{log}"]
+    bell.reload({**args, 'log': None})
+    bell.close()
+
+
+def test_reload_log_failed(tmp_path):
+    args = create_offline_args(tmp_path)
+    args['backend'] = 'null'
+    bell = SchoolBell(**args)
+    timeline = list(bell.timeline)
+    assert timeline
+    with pytest.raises(FileNotFoundError):
+        bell.reload({**args, 'schedule': {},
+                     'log': f"file:{tmp_path}/missing/bell.log"})
+    assert list(bell.timeline) == timeline
+    assert bell.config['schedule'] == args['schedule']
+    handler, = bell.log.handlers
+    assert handler._school_bell == ('stdout',)
+    assert bell.reload(args) == []
+    bell.close()
+
+
+def test_reload_rollback_all(tmp_path, monkeypatch):
+    monkeypatch.setattr(school_bell, 'system_call', lambda *a, **k: True)
+    args = create_offline_args(tmp_path)
+    args['backend'] = 'null'
+    bell = SchoolBell(**args)
+    with pytest.raises(FileNotFoundError):
+        bell.reload({**args, 'workers': 3, 'holidays': None,
+                     'trigger': {'pibell2': ''},
+                     'log': f"file:{tmp_path}/missing/bell.log"})
+    assert bell.workers is None
+    assert bell.trigger == {} and bell.unhealthy == set()
+    assert bell.holiday_source.subdivisionCode == 'NL-BE'
+    assert bell.reload(args) == []
+    bell.close()
+
+
+def test_reload_missing_wav(tmp_path):
+    args = create_offline_args(tmp_path)
+    args['backend'] = 'null'
+    bell = SchoolBell(**args)
+    config = dict(args, wav={'0': args['wav']['0']})
+    with pytest.raises(KeyError):
+        bell.reload(config)
+    assert sorted(bell.wav) == ['0', '1']
+    assert bell.config['wav'] == args['wav']
+
+
+def test_reload_rollback(tmp_path):
+    with open(f"{tmp_path}/bad.wav", 'wb') as f:
+        f.write(b'RIFF0000WAVEjunk')
+    args = create_offline_args(tmp_path)
+    args['backend'] = 'null'
+    bell = SchoolBell(**args)
+    timeline = list(bell.timeline)
+    config = dict(args, timeout=5, schedule={'Mon': {'09:00': '2'}},
+                  wav=dict(args['wav'], **{'2': f"{tmp_path}/bad.wav"}))
+    with pytest.raises(ValueError):
+        bell.reload(config)
+    assert bell.timeout == 10
+    assert bell.wav == args['wav'] and sorted(bell.wav_index) == ['0', '1']
+    assert sorted(bell.player.samples) == ['0', '1']
+    assert list(bell.timeline) == timeline
+    assert bell.config['timeout'] == 10
+
+    config['wav']['2'] = args['wav']['0']
+    assert sorted(bell.reload(config)) == ['schedule', 'timeout', 'wav']
+    assert sorted(bell.wav) == ['0', '1', '2']
+    assert sorted(bell.player.samples) == ['0', '1', '2']
@@ -0,0 +1,64 @@
+# content of test_timeline.py
+from datetime import datetime
+from school_bell.timeline import Timeline, week_offset
+
+entries = [
+    (0, '08:30', '0'),
+    (0, '12:00', 1),
+    (2, '8:30:15', '0'),
+    (4, '15:00', '1'),
+]
+
+
+def test_week_offset():
+    assert week_offset(0, '0:0') == 0
+    assert week_offset(0, '08:30') == 8 * 3600 + 30 * 60
+    assert week_offset(6, '23:59:59') == 7 * 86400 - 1
+
+
+def test_timeline():
+    timeline = Timeline(entries)
+    assert len(timeline) == 4
+    assert timeline.keys == ['0', '1']
+    assert list(timeline.offsets) == sorted(timeline.offsets)
+    assert list(timeline)[1] == (week_offset(0, '12:00'), '1')
+
+
+def test_timeline_duplicates():
+    timeline = Timeline([(0, '8:30', '0'), (0, '08:30:00', '1')])
+    assert list(timeline) == [(week_offset(0, '08:30'), '1')]
+
+
+def test_next_ring():
+    timeline = Timeline(entries)
+    monday = datetime(2024, 1, 1)  # a Monday
+    assert timeline.next_ring(monday) == (datetime(2024, 1, 1, 8, 30), '0')
+    assert timeline.next_ring(datetime(2024, 1, 1, 8, 30)) == (
+        datetime(2024, 1, 1, 12), '1'
+    )
+    assert timeline.next_ring(datetime(2024, 1, 3, 8, 30, 14, 999)) == (
+        datetime(2024, 1, 3, 8, 30, 15), '0'
+    )
+
+
+def test_next_ring_wraps():
+    timeline = Timeline(entries)
+    assert timeline.next_ring(datetime(2024, 1, 5, 16)) == (
+        datetime(2024, 1, 8, 8, 30), '0'
+    )
+
+
+def test_next_ring_empty():
+    assert Timeline().next_ring(datetime(2024, 1, 1)) is None
+
+
+def test_overlaps():
+    timeline = Timeline(entries)
+    assert timeline.overlaps({'0': 10, '1': 10}) == []
+    assert timeline.overlaps({'0': 4 * 3600}) == [
+        (week_offset(0, '08:30'), '0', week_offset(0, '12:00'))
+    ]
+    assert timeline.overlaps({'1': 3 * 86400}) == [
+        (week_offset(0, '12:00'), '1', week_offset(2, '08:30:15')),
+        (week_offset(4, '15:00'), '1', week_offset(0, '08:30')),
+    ]
@@ -1,12 +1,42 @@
 # content of test_utils.py
-from school_bell import utils
+import pytest
 from datetime import datetime, date
+from logging.handlers import QueueHandler
+from time import sleep
+from school_bell import utils
 
 
 def test_init_logger():
     assert isinstance(utils.init_logger(), utils.logging.Logger)
 
 
+def test_init_logger_dedup():
+    logger = utils.init_logger('test-dedup')
+    assert utils.init_logger('test-dedup', debug=True) is logger
+    assert len(logger.handlers) == 1
+    assert isinstance(logger.handlers[0], QueueHandler)
+    assert logger.level == utils.logging.DEBUG
+    utils.system_call(['true'])
+    assert len(utils.init_logger().handlers) == 1
+
+
+def test_init_logger_file(tmp_path):
+    path = tmp_path / 'school-bell.log'
+    logger = utils.init_logger('test-file', handlers=[f"file:{path}"])
+    assert len(logger.handlers) == 1
+    logger.info('Hello, World')
+    for i in range(100):
+        if path.exists() and 'Hello, World' in path.read_text():
+            break
+        sleep(.01)
+    assert 'test-file - INFO - Hello, World' in path.read_text()
+
+
+def test_init_logger_unsupported():
+    with pytest.raises(ValueError):
+        utils.init_logger('test-unsupported', handlers='stderr')
+
+
 def test_system_call():
     assert utils.system_call(['echo', 'Hello, World']) is True
 